@@ -16,43 +16,51 @@ gettext.bindtextdomain('minios-kernel-manager', '/usr/share/locale')
 gettext.textdomain('minios-kernel-manager')
 _ = gettext.gettext
 
-def update_syslinux_config(minios_path: str, kernel_version: str) -> bool:
+# Patterns work on raw bytes: configs may be UTF-8, CP866 or Latin-1, and
+# every byte they match or insert is ASCII, so no decoding is needed.
+
+# Kernel and initramfs references in SYSLINUX configs
+_SYSLINUX_BOOT_RE = re.compile(
+    rb'(KERNEL\s+/minios/boot/)vmlinuz-\S+|(initrd=/minios/boot/)initrfs-\S+')
+
+# Kernel and initramfs references in GRUB configs. A vmlinuz path is
+# replaced when followed by whitespace or when it is the argument of a
+# linux or search command; only the initrfs alternative has no group.
+_GRUB_BOOT_RE = re.compile(
+    rb'/minios/boot/(?:'
+    rb'(?:(?<=linux /minios/boot/)|(?<=search --set -f /minios/boot/))(vmlinuz)\S*'
+    rb'|(vmlinuz)\S*(?=\s)'
+    rb'|initrfs\S*\.img)')
+
+# Filesystems without POSIX permission bits; chmod cannot help there
+_NO_MODE_FS_TYPES = frozenset(('vfat', 'msdos', 'exfat', 'ntfs', 'ntfs3', 'fuseblk'))
+
+def update_syslinux_config(minios_path: str, kernel_version: str, fs_type: Optional[str] = None) -> bool:
     """
     Update syslinux.cfg to use the new kernel
     Returns True if updated or if file doesn't exist (optional)
+    fs_type, when known, skips the permission fix on filesystems without modes
     """
-    def _update_syslinux_file(config_file: str, version: str) -> bool:
+    fix_mode = fs_type not in _NO_MODE_FS_TYPES
+
+    def _update_syslinux_file(config_file: str) -> bool:
         try:
             if not os.path.exists(config_file):
                 return True
 
-            try:
-                os.chmod(config_file, 0o644)
-            except (OSError, NotImplementedError):
-                pass
-
-            with open(config_file, 'rb') as f:
-                raw_data = f.read()
-
-            content = None
-            detected_encoding = None
-            for encoding in ['utf-8', 'cp866', 'iso-8859-1']:
+            if fix_mode:
                 try:
-                    content = raw_data.decode(encoding)
-                    detected_encoding = encoding
-                    break
-                except UnicodeDecodeError:
-                    continue
+                    os.chmod(config_file, 0o644)
+                except (OSError, NotImplementedError):
+                    pass
 
-            if content is None:
-                detected_encoding = 'latin-1'
-                content = raw_data.decode(detected_encoding)
+            with open(config_file, 'rb') as f:
+                content = f.read()
 
-            new_content = re.sub(r'(KERNEL\s+/minios/boot/)vmlinuz-[^\s]+', f'\\1vmlinuz-{version}', content)
-            new_content = re.sub(r'(initrd=/minios/boot/)initrfs-[^\s]+', f'\\1initrfs-{version}.img', new_content)
+            new_content = _SYSLINUX_BOOT_RE.sub(_replace, content)
 
             if new_content != content:
-                with open(config_file, 'w', encoding=detected_encoding) as f:
+                with open(config_file, 'wb') as f:
                     f.write(new_content)
                 print(f"I: {_('Updated SYSLINUX config: {}').format(config_file)}")
 
@@ -61,18 +69,27 @@ def update_syslinux_config(minios_path: str, kernel_version: str) -> bool:
             print(f"W: {_('Failed to update SYSLINUX config {}: {}').format(config_file, e)}")
             return False
 
+    # Replacement names are built once per activation, not per match
+    vmlinuz_name = f'vmlinuz-{kernel_version}'.encode()
+    initrfs_name = f'initrfs-{kernel_version}.img'.encode()
+
+    def _replace(match):
+        if match.lastindex == 1:
+            return match.group(1) + vmlinuz_name
+        return match.group(2) + initrfs_name
+
     success = True
     syslinux_dir = os.path.join(minios_path, 'boot', 'syslinux')
     syslinux_cfg = os.path.join(syslinux_dir, 'syslinux.cfg')
 
     if os.path.exists(syslinux_cfg):
-        success &= _update_syslinux_file(syslinux_cfg, kernel_version)
+        success &= _update_syslinux_file(syslinux_cfg)
 
     lang_dir = os.path.join(syslinux_dir, 'lang')
     if os.path.exists(lang_dir):
         for lang_file in os.listdir(lang_dir):
             if lang_file.endswith('.cfg'):
-                success &= _update_syslinux_file(os.path.join(lang_dir, lang_file), kernel_version)
+                success &= _update_syslinux_file(os.path.join(lang_dir, lang_file))
 
     return success
 
@@ -136,48 +153,24 @@ def update_grub_config(minios_path: str, kernel_version: str) -> bool:
         
         success = True
         updated_files = []
+        vmlinuz_path = f'/minios/boot/vmlinuz-{kernel_version}'.encode()
+        initrfs_path = f'/minios/boot/initrfs-{kernel_version}.img'.encode()
+
+        def _replace(match):
+            return vmlinuz_path if match.lastindex else initrfs_path
         
         for config_file in config_files:
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
+                with open(config_file, 'rb') as f:
                     content = f.read()
                 
                 original_content = content
                 
-                # Update direct linux/initrd commands
-                content = re.sub(
-                    r'linux /minios/boot/vmlinuz[^\s]*',
-                    f'linux /minios/boot/vmlinuz-{kernel_version}',
-                    content
-                )
-                content = re.sub(
-                    r'initrd /minios/boot/initrfs[^\s]*\.img',
-                    f'initrd /minios/boot/initrfs-{kernel_version}.img',
-                    content
-                )
-                
-                # Update search --set -f patterns (for main.cfg)
-                content = re.sub(
-                    r'search --set -f /minios/boot/vmlinuz[^\s]*',
-                    f'search --set -f /minios/boot/vmlinuz-{kernel_version}',
-                    content
-                )
-                
-                # Update all other vmlinuz/initrfs references
-                content = re.sub(
-                    r'/minios/boot/vmlinuz[^\s]*(?=\s)',
-                    f'/minios/boot/vmlinuz-{kernel_version}',
-                    content
-                )
-                content = re.sub(
-                    r'/minios/boot/initrfs[^\s]*\.img',
-                    f'/minios/boot/initrfs-{kernel_version}.img',
-                    content
-                )
+                content = _GRUB_BOOT_RE.sub(_replace, content)
                 
                 # Only write if content changed
                 if content != original_content:
-                    with open(config_file, 'w', encoding='utf-8') as f:
+                    with open(config_file, 'wb') as f:
                         f.write(content)
                     updated_files.append(os.path.basename(config_file))
                 
@@ -196,7 +189,7 @@ def update_grub_config(minios_path: str, kernel_version: str) -> bool:
         print(f"E: {_('Error updating grub configs: {error}').format(error=e)}")
         return False
 
-def update_bootloader_configs(minios_path: str, kernel_version: str) -> bool:
+def update_bootloader_configs(minios_path: str, kernel_version: str, fs_type: Optional[str] = None) -> bool:
     """
     Update all bootloader configurations for the new kernel
     SYSLINUX is optional, GRUB is required
@@ -208,7 +201,7 @@ def update_bootloader_configs(minios_path: str, kernel_version: str) -> bool:
         success = False
     
     # Update SYSLINUX (optional)
-    if not update_syslinux_config(minios_path, kernel_version):
+    if not update_syslinux_config(minios_path, kernel_version, fs_type):
         success = False
     
     return success
@@ -6,6 +6,7 @@ Handles SquashFS creation, initramfs generation, and file operations
 """
 
 import os
+import re
 import sys
 import subprocess
 import shutil
@@ -17,12 +18,12 @@ from typing import Optional, Callable
 # Use only system installed modules
 try:
     # Try relative imports first (when imported as module)
-    from .compression_utils import get_compression_params
+    from .compression_utils import get_compression_params, SQFS_BLOCK_SIZE
     from .kernel_utils import get_non_symlink_modules_dir
     from .minios_utils import get_temp_dir_with_space_check
 except ImportError:
     # Fall back to absolute imports (when run as main script)
-    from compression_utils import get_compression_params
+    from compression_utils import get_compression_params, SQFS_BLOCK_SIZE
     from kernel_utils import get_non_symlink_modules_dir
     from minios_utils import get_temp_dir_with_space_check
 
@@ -31,6 +32,9 @@ gettext.bindtextdomain('minios-kernel-manager', '/usr/share/locale')
 gettext.textdomain('minios-kernel-manager')
 _ = gettext.gettext
 
+# Major and minor version in 'mksquashfs -version' output
+_MKSQUASHFS_VERSION_RE = re.compile(r'version\s+(\d+)\.(\d+)')
+
 
 def detect_initramfs_builder() -> str:
     """Detect which initramfs builder is available: 'dracut' or 'livekit'"""
@@ -103,7 +107,8 @@ def copy_vmlinuz(kernel_version: str, temp_dir: str, output_dir: str, kernel_sou
 
 
 def create_squashfs_image(kernel_version: str, compression: str, output_dir: str,
-                         logger: Optional[Callable] = None, temp_dir: str = None) -> str:
+                         logger: Optional[Callable] = None, temp_dir: str = None,
+                         level: Optional[int] = None, block_size: Optional[int] = None) -> str:
     """Create SquashFS image of kernel modules
 
     Args:
@@ -112,6 +117,8 @@ def create_squashfs_image(kernel_version: str, compression: str, output_dir: str
         output_dir: Directory to save the output file
         logger: Optional logging function
         temp_dir: Temporary directory with extracted deb contents (required)
+        level: Optional compression level (default parameters if not set)
+        block_size: Optional SquashFS block size in bytes (1M if not set)
     """
     if not temp_dir or not os.path.exists(temp_dir):
         raise RuntimeError(_("temp_dir is required and must exist for SquashFS creation"))
@@ -133,7 +140,8 @@ def create_squashfs_image(kernel_version: str, compression: str, output_dir: str
     for base_path in modules_base_paths:
         if os.path.exists(base_path):
             # Find the first (and usually only) kernel version directory
-            version_dirs = [d for d in os.listdir(base_path) if os.path.isdir(os.path.join(base_path, d))]
+            with os.scandir(base_path) as entries:
+                version_dirs = [entry.name for entry in entries if entry.is_dir()]
             if version_dirs:
                 original_kernel_version = version_dirs[0]  # Store original version from package
                 modules_path = os.path.join(base_path, original_kernel_version)
@@ -189,7 +197,10 @@ def create_squashfs_image(kernel_version: str, compression: str, output_dir: str
     print(f"I: {_('Using extracted deb modules with structure: {path}').format(path=f'{temp_squashfs_dir}/{system_modules_base}/{original_kernel_version}')}")
 
     # Get compression parameters
-    comp_params = get_compression_params(compression, 'squashfs')
+    try:
+        comp_params = get_compression_params(compression, 'squashfs', level)
+    except ValueError as e:
+        raise RuntimeError(str(e))
 
     # Check mksquashfs version for -no-strip support and availability
     try:
@@ -202,8 +213,7 @@ def create_squashfs_image(kernel_version: str, compression: str, output_dir: str
 
         if version_line:
             # Extract version number - handle different formats
-            import re
-            version_match = re.search(r'version\s+(\d+)\.(\d+)', version_line.lower())
+            version_match = _MKSQUASHFS_VERSION_RE.search(version_line.lower())
             if version_match:
                 major, minor = int(version_match.group(1)), int(version_match.group(2))
                 use_no_strip = (major > 4) or (major == 4 and minor >= 5)
@@ -230,7 +240,7 @@ def create_squashfs_image(kernel_version: str, compression: str, output_dir: str
         cmd.extend(comp_params.split())
 
     cmd.extend([
-        '-b', '1024K',
+        '-b', str(block_size or SQFS_BLOCK_SIZE),
         '-always-use-fragments',
         '-noappend'
     ])
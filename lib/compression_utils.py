@@ -6,7 +6,7 @@ Handles compression method detection and parameter configuration
 """
 
 import shutil
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 
 
 # Compression tools mapping
@@ -31,6 +31,25 @@ SQFS_COMPRESSION_PARAMS = {
     'bzip2': '-Xblock-size 256K'
 }
 
+# SquashFS compressors whose level can be set with -Xcompression-level
+SQFS_LEVEL_RANGES = {
+    'gzip': (1, 9),
+    'zstd': (1, 22)
+}
+
+# Default SquashFS block size
+SQFS_BLOCK_SIZE = 1024 * 1024
+
+# Named SquashFS presets: (compression, level, block size in bytes).
+# mksquashfs only accepts zstd levels from 1, so negative levels are not used.
+SQFS_PRESETS = {
+    'zstd-ultra-fast': ('zstd', 1, 128 * 1024),
+    'zstd-fast': ('zstd', 3, 256 * 1024),
+    'zstd-balanced': ('zstd', 8, 256 * 1024),
+    'zstd-max': ('zstd', 19, 1024 * 1024)
+}
+DEFAULT_SQFS_PRESET = 'zstd-balanced'
+
 # Speed order (fastest to slowest)
 SPEED_ORDER = ['lz4', 'lzo', 'gzip', 'zstd', 'lzma', 'xz', 'bzip2']
 
@@ -52,10 +71,29 @@ def get_available_compressions() -> List[str]:
     return sorted_available
 
 
-def get_compression_params(compression: str, image_type: str = 'squashfs') -> str:
-    """Get compression parameters for given method and image type"""
+def get_available_sqfs_presets() -> List[str]:
+    """Get list of SquashFS presets whose compressor is available"""
+    available = get_available_compressions()
+    return [name for name, (compression, _, _) in SQFS_PRESETS.items()
+            if compression in available]
+
+
+def get_compression_params(compression: str, image_type: str = 'squashfs',
+                           level: Optional[int] = None) -> str:
+    """Get compression parameters for given method and image type
+
+    A level overrides the default SquashFS parameters; ValueError is raised
+    if the compressor has no level or the level is out of range.
+    """
     if image_type == 'squashfs':
-        return SQFS_COMPRESSION_PARAMS.get(compression, '')
+        if level is None:
+            return SQFS_COMPRESSION_PARAMS.get(compression, '')
+        if compression not in SQFS_LEVEL_RANGES:
+            raise ValueError(f"Compression level is not supported for {compression}")
+        low, high = SQFS_LEVEL_RANGES[compression]
+        if not low <= level <= high:
+            raise ValueError(f"Compression level for {compression} must be between {low} and {high}")
+        return f'-Xcompression-level {level}'
     else:
         # For initramfs, no special parameters needed
         return ''
@@ -11,6 +11,7 @@ import subprocess
 import tempfile
 import shutil
 import re
+import time
 import gettext
 from typing import Dict, List, Optional, Tuple
 
@@ -19,6 +20,13 @@ gettext.bindtextdomain('minios-kernel-manager', '/usr/share/locale')
 gettext.textdomain('minios-kernel-manager')
 _ = gettext.gettext
 
+# apt-cache depends line naming a dependency
+_DEPENDS_RE = re.compile(r'\s*Depends:\s*(\S+)')
+# Kernel version in a linux-image .deb file name
+_IMAGE_FILENAME_RE = re.compile(r'linux-image-(.+?)_')
+# Kernel version in a linux-image package control file
+_CONTROL_IMAGE_RE = re.compile(r'Package:\s*linux-image-(.+)')
+
 
 LAST_KERNEL_VERSIONS: Dict[str, Optional[str]] = {
     'display_version': None,
@@ -130,14 +138,13 @@ def _parse_package_info(apt_show_output: str, package_name: str, description: st
 
     return info if info['size'] > 0 else None
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 def _format_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
-    size_value = float(size_bytes)
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_value < 1024.0:
-            return f"{size_value:.1f} {unit}"
-        size_value /= 1024.0
-    return f"{size_value:.1f} TB"
+    # Each unit is 10 bits wide; the unit index is the highest set bit // 10
+    unit = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (unit * 10)):.1f} {_SIZE_UNITS[unit]}"
 
 
 def check_package_cache(force_update: bool = False) -> Tuple[bool, str]:
@@ -150,8 +157,6 @@ def check_package_cache(force_update: bool = False) -> Tuple[bool, str]:
     Returns:
         (success, message): True if can proceed, False if should stop
     """
-    import time
-
     cache_file = '/var/cache/apt/pkgcache.bin'
     lists_dir = '/var/lib/apt/lists'
 
@@ -199,7 +204,7 @@ def check_package_cache(force_update: bool = False) -> Tuple[bool, str]:
 
 def _extract_dep_package(dep_line: str) -> Optional[str]:
     """Extract package name from apt-cache depends output line."""
-    match = re.search(r'^\s*Depends:\s*(\S+)', dep_line)
+    match = _DEPENDS_RE.match(dep_line)
     if not match:
         return None
     pkg = match.group(1).strip()
@@ -264,10 +269,8 @@ def _detect_kernel_version_from_extracted(temp_dir: str) -> Optional[str]:
     for modules_base in modules_base_paths:
         if not os.path.exists(modules_base):
             continue
-        version_dirs = [
-            d for d in os.listdir(modules_base)
-            if os.path.isdir(os.path.join(modules_base, d))
-        ]
+        with os.scandir(modules_base) as entries:
+            version_dirs = [entry.name for entry in entries if entry.is_dir()]
         if version_dirs:
             return version_dirs[0]
 
@@ -285,10 +288,10 @@ def _extracted_modules_versions(temp_dir: str) -> List[str]:
     for modules_base in modules_base_paths:
         if not os.path.exists(modules_base):
             continue
-        for item in os.listdir(modules_base):
-            item_path = os.path.join(modules_base, item)
-            if os.path.isdir(item_path) and item not in versions:
-                versions.append(item)
+        with os.scandir(modules_base) as entries:
+            for entry in entries:
+                if entry.is_dir() and entry.name not in versions:
+                    versions.append(entry.name)
 
     return versions
 
@@ -311,7 +314,7 @@ def process_manual_packages(package_paths: List[str], temp_dir: str) -> str:
         display_kernel_version = None
         for package_path in package_paths:
             filename = os.path.basename(package_path)
-            match = re.search(r'linux-image-(.+?)_', filename)
+            match = _IMAGE_FILENAME_RE.search(filename)
             if match:
                 display_kernel_version = match.group(1)
                 break
@@ -339,7 +342,7 @@ def process_manual_packages(package_paths: List[str], temp_dir: str) -> str:
                     continue
                 with open(control_file, 'r') as f:
                     control_content = f.read()
-                match = re.search(r'Package:\s*linux-image-(.+)', control_content)
+                match = _CONTROL_IMAGE_RE.search(control_content)
                 if match:
                     actual_kernel_version = match.group(1)
                     if not display_kernel_version:
@@ -483,8 +486,6 @@ def locate_kernel_modules(kernel_version: str) -> str:
 
 def prepare_temp_modules(kernel_version: str, temp_dir: str, force_reinstall: bool = False) -> None:
     """Prepare temporary kernel modules for repository kernel"""
-    import shutil
-
     target_dir = get_non_symlink_modules_dir()
     target_path = os.path.join(target_dir, kernel_version)
 
@@ -20,6 +20,9 @@ import threading
 import time
 import signal
 import atexit
+import socket
+import stat
+import struct
 
 # Set up localization
 locale.setlocale(locale.LC_ALL, '')
@@ -70,7 +73,7 @@ try:
     from .build_utils import create_squashfs_image, generate_initramfs, copy_vmlinuz
     from .minios_utils import (
         find_minios_directory, activate_kernel, list_all_kernels, get_active_kernel,
-        get_temp_dir_with_space_check, is_kernel_currently_running
+        get_temp_dir_with_space_check, is_kernel_currently_running, _get_filesystem_type
     )
 except ImportError:
     # Fall back to absolute imports (when run as main script)
@@ -81,7 +84,7 @@ except ImportError:
     from build_utils import create_squashfs_image, generate_initramfs, copy_vmlinuz
     from minios_utils import (
         find_minios_directory, activate_kernel, list_all_kernels, get_active_kernel,
-        get_temp_dir_with_space_check, is_kernel_currently_running
+        get_temp_dir_with_space_check, is_kernel_currently_running, _get_filesystem_type
     )
 
 def activity_indicator(stop_event, message):
@@ -95,6 +98,20 @@ def activity_indicator(stop_event, message):
     print("\r", end="", flush=True)  # Clear line
 
 
+def _emit_error(error_msg, json_output, file=None, **extra):
+    """Print an error either as a JSON object or as an "E:" line on stderr.
+
+    Extra keyword arguments are added to the JSON object. JSON errors go to
+    stdout unless another file is given.
+    """
+    if json_output:
+        data = {"success": False, "error": error_msg}
+        data.update(extra)
+        print(json.dumps(data, ensure_ascii=False), file=file or sys.stdout, flush=True)
+    else:
+        print("E: {}".format(error_msg), file=sys.stderr, flush=True)
+
+
 def package_kernel(args):
     """Package a kernel from repository or deb file."""
     def progress_print(percent, message=None):
@@ -149,7 +166,8 @@ def package_kernel(args):
         copy_vmlinuz(kernel_version, temp_dir, args.output)
 
         progress_print(60, _("Creating SquashFS image"))
-        create_squashfs_image(kernel_version, args.sqfs_comp, args.output, logger=None, temp_dir=temp_dir)
+        create_squashfs_image(kernel_version, args.sqfs_comp, args.output, logger=None, temp_dir=temp_dir,
+                              level=args.sqfs_level, block_size=args.sqfs_bs)
 
         progress_print(80, _("Generating initramfs"))
         # This will require running as root if it calls a privileged helper
@@ -223,15 +241,7 @@ def package_kernel(args):
             print(json.dumps(success_data), flush=True)
 
     except Exception as e:
-        if args.json:
-            error_data = {
-                "success": False,
-                "error": str(e),
-                "type": "error"
-            }
-            print(json.dumps(error_data), file=sys.stderr, flush=True)
-        else:
-            print("E: {}".format(e), file=sys.stderr, flush=True)
+        _emit_error(str(e), args.json, file=sys.stderr, type="error")
         sys.exit(1)
     finally:
         # Clear global reference (but don't cleanup - only signal handlers should cleanup)
@@ -242,10 +252,7 @@ def list_kernels_cmd(args):
     # Find MiniOS directory
     minios_path = find_minios_directory()
     if not minios_path:
-        if args.json:
-            print(json.dumps({"error": "MiniOS directory not found", "kernels": []}))
-        else:
-            print("E: {}".format(_('MiniOS directory not found')), file=sys.stderr, flush=True)
+        _emit_error(_("MiniOS directory not found"), args.json, kernels=[])
         sys.exit(1)
 
     available_kernels = list_all_kernels(minios_path)
@@ -284,10 +291,7 @@ def activate_kernel_cmd(args):
     # Find MiniOS directory
     minios_path = find_minios_directory()
     if not minios_path:
-        if args.json:
-            print(json.dumps({"success": False, "error": "MiniOS directory not found"}))
-        else:
-            print("E: {}".format(_('MiniOS directory not found')), file=sys.stderr, flush=True)
+        _emit_error(_("MiniOS directory not found"), args.json)
         sys.exit(1)
 
     if not args.json:
@@ -295,6 +299,7 @@ def activate_kernel_cmd(args):
 
     # List available kernels
     available_kernels = list_all_kernels(minios_path)
+    available_set = set(available_kernels)
 
     # Check current active kernel
     current_kernel = get_active_kernel(minios_path)
@@ -302,7 +307,7 @@ def activate_kernel_cmd(args):
         print("I: {}".format(_('Currently active kernel: {}')).format(current_kernel), flush=True)
 
     # Check if requested kernel is available
-    if args.kernel_version not in available_kernels:
+    if args.kernel_version not in available_set:
         error_msg = f"Kernel {args.kernel_version} not found in repository"
         if args.json:
             print(json.dumps({
@@ -332,7 +337,7 @@ def activate_kernel_cmd(args):
     if not args.json:
         print("I: {}".format(_('Activating kernel {}...')).format(args.kernel_version), flush=True)
 
-    success = activate_kernel(minios_path, args.kernel_version)
+    success = activate_kernel(minios_path, args.kernel_version, active_kernel=current_kernel)
 
     if args.json:
         print(json.dumps({
@@ -353,10 +358,7 @@ def info_kernel_cmd(args):
     # Find MiniOS directory
     minios_path = find_minios_directory()
     if not minios_path:
-        if args.json:
-            print(json.dumps({"error": "MiniOS directory not found"}))
-        else:
-            print("E: {}".format(_('MiniOS directory not found')), file=sys.stderr, flush=True)
+        _emit_error(_("MiniOS directory not found"), args.json)
         sys.exit(1)
 
     current_kernel = get_active_kernel(minios_path)
@@ -366,19 +368,13 @@ def info_kernel_cmd(args):
         target_kernel = args.kernel_version
         if target_kernel not in available_kernels:
             error_msg = _("Kernel {} not found").format(target_kernel)
-            if args.json:
-                print(json.dumps({"error": error_msg, "available_kernels": available_kernels}))
-            else:
-                print("E: {}".format(error_msg), file=sys.stderr, flush=True)
+            _emit_error(error_msg, args.json, available_kernels=available_kernels)
             sys.exit(1)
     else:
         target_kernel = current_kernel
         if not target_kernel:
             error_msg = _("No active kernel found")
-            if args.json:
-                print(json.dumps({"error": error_msg, "available_kernels": available_kernels}))
-            else:
-                print("E: {}".format(error_msg), file=sys.stderr, flush=True)
+            _emit_error(error_msg, args.json, available_kernels=available_kernels)
             sys.exit(1)
 
     if args.json:
@@ -405,11 +401,7 @@ def status_cmd(args):
     # Find MiniOS directory
     minios_path = find_minios_directory()
     if not minios_path:
-        error_msg = _("MiniOS directory not found")
-        if args.json:
-            print(json.dumps({"success": False, "error": error_msg, "found": False, "writable": False}))
-        else:
-            print("E: {}".format(error_msg), file=sys.stderr, flush=True)
+        _emit_error(_("MiniOS directory not found"), args.json, found=False, writable=False)
         sys.exit(1)
 
     # Check if directory is writable
@@ -418,34 +410,18 @@ def status_cmd(args):
     error_msg = None
 
     try:
-        # Get filesystem type
-        import subprocess
-        try:
-            result = subprocess.run(['stat', '-f', '-c', '%T', minios_path],
-                                  stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
-            fs_type = result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # Fallback method using /proc/mounts
-            try:
-                with open('/proc/mounts', 'r') as f:
-                    for line in f:
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            mount_point, fs_type_mount = parts[1], parts[2]
-                            if minios_path.startswith(mount_point):
-                                fs_type = fs_type_mount
-                                break
-            except Exception:
-                pass
+        fs_type = _get_filesystem_type(minios_path)
 
         # SquashFS is always read-only
         if fs_type == 'squashfs':
             writable = False
             error_msg = _("Directory is on a SquashFS filesystem (read-only)")
+        elif os.statvfs(minios_path).f_flag & os.ST_RDONLY:
+            writable = False
+            error_msg = _("Directory is on a read-only filesystem")
         else:
             # Try to create a temporary file to test write access
             try:
-                import tempfile
                 with tempfile.NamedTemporaryFile(dir=minios_path, delete=True):
                     pass
                 writable = True
@@ -484,11 +460,7 @@ def delete_kernel_cmd(args):
 
     minios_path = find_minios_directory()
     if not minios_path:
-        error_msg = _("MiniOS directory not found")
-        if args.json:
-            print(json.dumps({"success": False, "error": error_msg}))
-        else:
-            print(error_msg, file=sys.stderr)
+        _emit_error(_("MiniOS directory not found"), args.json)
         sys.exit(1)
 
     kernel_version = args.kernel_version
@@ -508,30 +480,165 @@ def delete_kernel_cmd(args):
             print(_("Failed to delete kernel {}").format(kernel_version), file=sys.stderr)
             sys.exit(1)
 
-def main():
-    """Main entry point for the CLI utility."""
-    # Pre-check for --json flag before parsing
-    json_output = '--json' in sys.argv
+def _run_daemon_request(argv):
+    """Run one CLI invocation in a forked child and capture its output.
+
+    Returns a dict with returncode, stdout and stderr, like a finished
+    subprocess. Forking the already-loaded interpreter avoids both the pkexec
+    authentication and the Python startup cost of a fresh process.
+    """
+    out_file = tempfile.TemporaryFile()
+    err_file = tempfile.TemporaryFile()
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            os.dup2(out_file.fileno(), 1)
+            os.dup2(err_file.fileno(), 2)
+            sys.argv = ['minios-kernel'] + argv
+            try:
+                main(allow_daemon=False)
+                code = 0
+            except SystemExit as e:
+                if e.code is None:
+                    code = 0
+                elif isinstance(e.code, int):
+                    code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    code = 1
+        except BaseException as e:
+            print("E: {}".format(e), file=sys.stderr)
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+    out_file.seek(0)
+    err_file.seek(0)
+    result = {
+        "returncode": os.WEXITSTATUS(status) if os.WIFEXITED(status) else 128 + os.WTERMSIG(status),
+        "stdout": out_file.read().decode('utf-8', errors='replace'),
+        "stderr": err_file.read().decode('utf-8', errors='replace'),
+    }
+    out_file.close()
+    err_file.close()
+    return result
+
+
+def _check_daemon_socket_path(socket_path, client_uid):
+    """Make sure socket_path is safe to (re)create as root.
+
+    The path must sit directly in the client's runtime directory, and an
+    existing entry is only replaced if it is a stale socket owned by the
+    client. Raises ValueError otherwise; removes the stale socket if any.
+    """
+    runtime_dir = os.path.realpath('/run/user/{}'.format(client_uid))
+    if os.path.realpath(os.path.dirname(os.path.abspath(socket_path))) != runtime_dir:
+        raise ValueError(_('Socket must be created in {}').format(runtime_dir))
 
-    # Check for root privileges
-    if os.geteuid() != 0:
-        error_msg = _("This tool requires root privileges. Please run with sudo or through pkexec.")
-        if json_output:
-            print(json.dumps({"success": False, "error": error_msg}, ensure_ascii=False), file=sys.stderr)
-        else:
-            print(error_msg, file=sys.stderr)
+    try:
+        st = os.lstat(socket_path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != client_uid:
+        raise ValueError(_('Refusing to replace {}: not a socket owned by the client').format(socket_path))
+    os.unlink(socket_path)
+
+# Seconds the daemon waits for the manager to connect once it is running.
+# pkexec only starts the daemon after authentication, so this does not
+# include time spent in the auth dialog.
+DAEMON_ACCEPT_TIMEOUT = 30
+
+def serve_daemon(socket_path):
+    """Serve CLI requests for a single client over a Unix socket.
+
+    The socket is owned by the user that started us through pkexec and only
+    that user (or root) may talk to it. Each request is one JSON line of the
+    form {"argv": [...]}; each reply is one JSON line with returncode, stdout
+    and stderr. The daemon exits when the client disconnects, or if no client
+    connects within DAEMON_ACCEPT_TIMEOUT seconds.
+    """
+    client_uid = int(os.environ.get('PKEXEC_UID', '0'))
+
+    try:
+        _check_daemon_socket_path(socket_path, client_uid)
+    except ValueError as e:
+        print("E: {}".format(e), file=sys.stderr)
         sys.exit(1)
 
-    # Ensure unbuffered output for real-time GUI updates (Python 3.6 compatible)
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, line_buffering=True)
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, line_buffering=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(old_umask)
+    os.chown(socket_path, client_uid, -1, follow_symlinks=False)
+    server.listen(1)
+    server.settimeout(DAEMON_ACCEPT_TIMEOUT)
+
+    try:
+        conn, _addr = server.accept()
+    except socket.timeout:
+        print("E: {}".format(_('No client connected to {}')).format(socket_path), file=sys.stderr)
+        sys.exit(1)
+    finally:
+        server.close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+    with conn:
+        creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+        _pid, peer_uid, _gid = struct.unpack('3i', creds)
+        if peer_uid not in (0, client_uid):
+            return
+
+        stream = conn.makefile('rwb')
+        for line in stream:
+            try:
+                request = json.loads(line)
+                argv = [str(arg) for arg in request['argv']]
+            except (ValueError, KeyError, TypeError) as e:
+                reply = {"returncode": 2, "stdout": "", "stderr": "Invalid request: {}".format(e)}
+            else:
+                reply = _run_daemon_request(argv)
+            stream.write(json.dumps(reply).encode('utf-8') + b"\n")
+            stream.flush()
 
+
+def _sqfs_block_size(value):
+    """argparse type for --sqfs-bs: a power of two between 4K and 1M"""
+    try:
+        size = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(_("invalid block size: {}").format(value))
+    if size < 4096 or size > 1048576 or size & (size - 1):
+        raise argparse.ArgumentTypeError(_("block size must be a power of two between 4096 and 1048576"))
+    return size
+
+
+def main(allow_daemon=True):
+    """Main entry point for the CLI utility.
+
+    Daemon requests run with allow_daemon=False so they cannot start
+    another daemon, whichever spelling of --daemon they use.
+    """
     parser = argparse.ArgumentParser(description=_("MiniOS Kernel Manager CLI"))
+    # --json is accepted both before and after the subcommand. The subcommand
+    # copy uses SUPPRESS so it does not reset a value set by the main parser.
     parser.add_argument('--json', action='store_true', help=_('Output in JSON format'))
+    parser.add_argument('--daemon', metavar='SOCKET',
+                        help=_('Serve requests from the graphical manager over a Unix socket'))
 
     # Global options
     parent_parser = argparse.ArgumentParser(add_help=False)
-    parent_parser.add_argument('--json', action='store_true', help=_('Output in JSON format'))
+    parent_parser.add_argument('--json', action='store_true', default=argparse.SUPPRESS,
+                               help=_('Output in JSON format'))
 
     subparsers = parser.add_subparsers(dest='command', help=_('Available commands'))
 
@@ -542,6 +649,8 @@ def main():
     source_group.add_argument("--deb", nargs='+', help=_("Path(s) to kernel .deb package(s)"))
     package_parser.add_argument("-o", "--output", required=True, help=_("Directory to save the packaged kernel files"))
     package_parser.add_argument("--sqfs-comp", default="zstd", help=_("Compression method for SquashFS"))
+    package_parser.add_argument("--sqfs-level", type=int, help=_("Compression level for SquashFS (gzip and zstd only)"))
+    package_parser.add_argument("--sqfs-bs", type=_sqfs_block_size, help=_("SquashFS block size in bytes (default: 1048576)"))
     package_parser.add_argument("--temp-dir", help=_("Custom temporary directory (must have at least 1024MB free space)"))
     package_parser.add_argument("--force-update", action="store_true", help=_("Force package lists update if outdated"))
 
@@ -563,15 +672,28 @@ def main():
     delete_parser = subparsers.add_parser('delete', help=_('Delete a packaged kernel'), parents=[parent_parser])
     delete_parser.add_argument("kernel_version", help=_("Kernel version to delete"))
 
-    # Parse arguments - handle global flags that can appear anywhere
-    # Extract global flags from any position
-    global_json = '--json' in sys.argv
-
     args = parser.parse_args()
+    if args.daemon is not None and not allow_daemon:
+        parser.error(_("nested daemon requests are not allowed"))
+
+    # Check for root privileges
+    if os.geteuid() != 0:
+        error_msg = _("This tool requires root privileges. Please run with sudo or through pkexec.")
+        _emit_error(error_msg, args.json, file=sys.stderr)
+        sys.exit(1)
 
-    # Apply global flags
-    if global_json:
-        args.json = True
+    # Ensure line-buffered output for real-time GUI updates
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=True)
+        sys.stderr.reconfigure(line_buffering=True)
+    else:
+        # Python 3.6 fallback
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, line_buffering=True)
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, line_buffering=True)
+
+    if args.daemon:
+        serve_daemon(args.daemon)
+        return
 
     # Handle missing subcommand
     if not args.command:
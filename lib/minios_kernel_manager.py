@@ -35,94 +35,306 @@ import tempfile
 import shutil
 import time
 import subprocess
-import fcntl
 import json
 import re
+import socket
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Use only system installed modules
 try:
     # Try relative imports first (when imported as module)
     from .minios_utils import (
-        find_minios_directory, get_kernel_info,
-        get_currently_running_kernel, is_kernel_currently_running, get_system_type
+        find_minios_directory,
+        get_currently_running_kernel, get_system_type
     )
     from .kernel_utils import get_repository_kernels, get_manual_packages, _format_size
-    from .compression_utils import get_available_compressions
+    from .compression_utils import (
+        get_available_compressions, get_available_sqfs_presets, SQFS_PRESETS, DEFAULT_SQFS_PRESET
+    )
 except ImportError:
     # Fall back to absolute imports (when run as main script)
     from minios_utils import (
-        find_minios_directory, get_kernel_info,
-        get_currently_running_kernel, is_kernel_currently_running, get_system_type
+        find_minios_directory,
+        get_currently_running_kernel, get_system_type
     )
     from kernel_utils import get_repository_kernels, get_manual_packages, _format_size
-    from compression_utils import get_available_compressions
+    from compression_utils import (
+        get_available_compressions, get_available_sqfs_presets, SQFS_PRESETS, DEFAULT_SQFS_PRESET
+    )
 
 gi.require_version('Gtk', '3.0')
 gi.require_version('Gio', '2.0')
-from gi.repository import Gtk, GLib, Gio, Pango
+from gi.repository import Gtk, Gdk, GLib, Gio, Pango
 
 # ──────────────────────────────────────────────────────────────────────────────
 # CLI Interface Functions
 # ──────────────────────────────────────────────────────────────────────────────
+def privileged_command(cmd):
+    """Prefix cmd with pkexec unless the manager already runs as root"""
+    if os.geteuid() == 0:
+        return list(cmd)
+    return ['pkexec'] + cmd
+
+class HelperNotAuthorized(RuntimeError):
+    """The user dismissed or failed the pkexec authentication"""
+
+class PrivHelper:
+    """Privileged minios-kernel process kept alive for the whole session.
+
+    The helper is started once through pkexec and then serves CLI requests
+    over a Unix socket, so later calls skip both the pkexec authentication
+    and the Python interpreter startup. If the helper cannot be used, calls
+    fall back to running pkexec minios-kernel directly; a dismissed auth
+    dialog only fails the current call.
+    """
+
+    START_TIMEOUT = 300  # seconds, includes time spent in the auth dialog
+
+    def __init__(self):
+        self.process = None
+        self.sock = None
+        self.stream = None
+        self.failed = False
+        self.denied = False  # the last start was not authorised
+        self.closing = False
+        self.lock = threading.Lock()
+
+    def _start(self):
+        """Launch the helper through pkexec and connect to its socket."""
+        # The helper only accepts a socket directly inside this directory
+        runtime_dir = f"/run/user/{os.getuid()}"
+        if not os.path.isdir(runtime_dir):
+            raise RuntimeError(f"{runtime_dir} does not exist")
+        socket_path = os.path.join(runtime_dir, f"minios-kernel-{os.getpid()}.sock")
+        self.process = subprocess.Popen(['pkexec', 'minios-kernel', '--daemon', socket_path],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        deadline = time.monotonic() + self.START_TIMEOUT
+        while not self.closing and time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                code, self.process = self.process.returncode, None
+                # pkexec exits with 126/127 when authentication is dismissed or fails
+                if code in (126, 127):
+                    raise HelperNotAuthorized(f"pkexec exited with code {code}")
+                raise RuntimeError(f"helper exited with code {code}")
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(socket_path)
+            except (FileNotFoundError, ConnectionRefusedError):
+                sock.close()
+                time.sleep(0.05)
+                continue
+            self.sock = sock
+            self.stream = sock.makefile('rwb')
+            return
+
+        # A helper that never came up must not be left running as root
+        self._stop_process(timeout=1)
+        self._disconnect()
+        raise RuntimeError("timed out waiting for helper")
+
+    def _stop_process(self, timeout=None):
+        """Terminate the helper process, killing it if it outlives timeout.
+
+        Once authenticated the helper runs as root and cannot be signalled;
+        it then exits by itself when its socket is closed or nobody connects.
+        """
+        process, self.process = self.process, None
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.terminate()
+            if timeout is not None:
+                try:
+                    process.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+        except OSError:
+            pass
+
+    def call(self, args):
+        """Run minios-kernel with args and return a CompletedProcess."""
+        with self.lock:
+            # Without pkexec to amortize, a root session runs the CLI directly
+            if self.stream is None and not self.failed and not self.closing and os.geteuid() != 0:
+                self.denied = False
+                try:
+                    self._start()
+                except HelperNotAuthorized as e:
+                    # Running pkexec again would only show another auth dialog
+                    self.denied = True
+                    return subprocess.CompletedProcess(['minios-kernel'] + args, 126,
+                                                       b"", str(e).encode('utf-8'))
+                except (OSError, RuntimeError) as e:
+                    if not self.closing:
+                        print(f"Privileged helper unavailable, using pkexec per call: {e}")
+                    self.failed = True
+
+            if self.stream is not None:
+                try:
+                    self.stream.write(json.dumps({"argv": args}).encode('utf-8') + b"\n")
+                    self.stream.flush()
+                    reply = json_loads(self.stream.readline())
+                    return subprocess.CompletedProcess(['minios-kernel'] + args, reply['returncode'],
+                                                       reply['stdout'], reply['stderr'])
+                except (OSError, ValueError, KeyError) as e:
+                    if not self.closing:
+                        print(f"Privileged helper failed, using pkexec per call: {e}")
+                    self._disconnect()
+                    self.failed = True
+
+            # Do not ask for authentication again while the window is closing
+            if self.closing:
+                return subprocess.CompletedProcess(['minios-kernel'] + args, 1,
+                                                   b"", b"Kernel manager is closing")
+
+        # Output is kept as bytes: json_loads() decodes UTF-8 itself, and the
+        # locale encoding used by universal_newlines may not be UTF-8
+        cmd = privileged_command(['minios-kernel'] + args)
+        return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def _disconnect(self):
+        """Close the helper socket; the helper exits when it sees EOF."""
+        if self.stream is not None:
+            try:
+                self.stream.close()
+            except OSError:
+                pass
+            self.stream = None
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+        self._stop_process()
+
+    def close(self):
+        """Shut the helper down without blocking the calling thread.
+
+        If a worker is inside call(), the socket is only shut down: that wakes
+        the worker, which then disconnects under the lock itself.
+        """
+        self.closing = True
+        if self.lock.acquire(blocking=False):
+            try:
+                self._disconnect()
+            finally:
+                self.lock.release()
+            return
+
+        sock, process = self.sock, self.process
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if process is not None:
+            try:
+                process.terminate()
+            except OSError:
+                pass
+
+_priv_helper = PrivHelper()
+
+def _decode_output(data):
+    """Return CLI output as text, decoding bytes as UTF-8"""
+    if isinstance(data, bytes):
+        return data.decode('utf-8', 'replace')
+    return data
+
 def run_minios_kernel(args):
-    """Execute minios-kernel command with pkexec for administrative privileges"""
-    # Always use pkexec for kernel operations to ensure proper privileges
-    cmd = ['pkexec', 'minios-kernel'] + args
-    
-    return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    """Execute minios-kernel command with administrative privileges"""
+    return _priv_helper.call(args)
+
+def _cli_json_result(result, success_message):
+    """Return (success, message) from the output of a --json CLI call"""
+    try:
+        data = json_loads(result.stdout)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        error = _decode_output(result.stderr).strip() or _decode_output(result.stdout).strip()
+        return False, error or f"Command failed with return code {result.returncode}"
+    if result.returncode == 0 and data.get('success'):
+        return True, data.get('message', success_message)
+    return False, data.get('error') or data.get('message') or 'Unknown error'
 
 def activate_kernel_cli(kernel_version):
     """Activate kernel using minios-kernel CLI with JSON output"""
     try:
-        # Use pkexec to execute the script with JSON output
         result = run_minios_kernel(['--json', 'activate', kernel_version])
-        
-        if result.returncode == 0:
-            # Parse JSON response
-            data = json.loads(result.stdout)
-            
-            if data.get('success'):
-                return True, data.get('message', 'Kernel activated successfully')
-            else:
-                return False, data.get('error', 'Unknown error')
-        else:
-            # Try to parse JSON error response
-            try:
-                error_data = json.loads(result.stderr)
-                return False, error_data.get('error', result.stderr)
-            except json.JSONDecodeError:
-                return False, result.stderr or f"Command failed with return code {result.returncode}"
-            
-    except json.JSONDecodeError as e:
-        # Fallback to text parsing if JSON fails
-        try:
-            result = run_minios_kernel(['activate', kernel_version])
-            if result.returncode == 0:
-                return True, result.stdout
-            else:
-                return False, result.stderr or f"Command failed with return code {result.returncode}"
-        except Exception as fallback_e:
-            return False, str(fallback_e)
+        success, message = _cli_json_result(result, 'Kernel activated successfully')
+        if success:
+            invalidate_kernels_cache()
+        return success, message
     except Exception as e:
         return False, str(e)
 
-def list_kernels_cli():
-    """List available kernels using minios-kernel CLI with JSON output"""
+# Last list_kernels_cli() result as (stamp, (kernels, active_kernel))
+_kernels_cache = None
+
+def _kernels_cache_stamp(minios_path):
+    """Return modification times that change whenever the kernel list can change"""
+    stamp = [minios_path]
+    for path in (os.path.join(minios_path, "kernels"),
+                 os.path.join(minios_path, "boot"),
+                 os.path.join(minios_path, "boot", "active-kernel")):
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+def invalidate_kernels_cache():
+    """Forget the cached kernel list after an operation that changes it"""
+    global _kernels_cache
+    _kernels_cache = None
+
+def list_kernels_cli(minios_path=None):
+    """List available kernels using minios-kernel CLI with JSON output
+
+    When minios_path is given, the result is cached and reused while the
+    kernel repository and boot directory are unchanged.
+    """
+    global _kernels_cache
+
+    stamp = _kernels_cache_stamp(minios_path) if minios_path else None
+    if stamp is not None and _kernels_cache is not None and _kernels_cache[0] == stamp:
+        kernels, active_kernel = _kernels_cache[1]
+        return list(kernels), active_kernel
+
+    kernels, active_kernel = _list_kernels_uncached()
+    if stamp is not None and kernels:
+        _kernels_cache = (stamp, (list(kernels), active_kernel))
+    return kernels, active_kernel
+
+# Message level prefix of CLI log lines, dropped in the packaging log
+_LOG_PREFIX_RE = re.compile(r'^[IEW]: ')
+
+# Kernel entries and the active kernel line of the plain "minios-kernel list" output
+_LIST_TEXT_RE = re.compile(
+    r'^\s*-\s+(?P<kernel>\S+?)(?P<active>\s+\(active\))?\s*$'
+    r'|^\s*Currently active kernel:\s*(?P<current>\S+)\s*$',
+    re.MULTILINE
+)
+
+def _list_kernels_uncached():
+    """Run minios-kernel list and parse its output"""
     try:
         # Use pkexec to execute the script with JSON output
         result = run_minios_kernel(['--json', 'list'])
         
         if result.returncode == 0:
             # Parse JSON response
-            data = json.loads(result.stdout)
-            
-            kernels = []
-            active_kernel = data.get('active_kernel')
-            
-            for kernel_info in data.get('kernels', []):
-                kernels.append(kernel_info['version'])
-            
-            return kernels, active_kernel
+            data = json_loads(result.stdout)
+            kernels = [kernel_info['version'] for kernel_info in data.get('kernels', [])]
+            return kernels, data.get('active_kernel')
         else:
             return [], None
     except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
@@ -133,29 +345,15 @@ def list_kernels_cli():
             # Parse the output to extract kernel list
             kernels = []
             active_kernel = None
-            
-            lines = result.stdout.strip().split('\n')
-            in_kernel_list = False
-            
-            for line in lines:
-                line = line.strip()
-                if line.startswith('Available kernels:'):
-                    in_kernel_list = True
-                    continue
-                elif line.startswith('Currently active kernel:'):
-                    if ':' in line:
-                        active_kernel = line.split(':', 1)[1].strip()
-                    in_kernel_list = False
-                    continue
-                elif in_kernel_list and line.startswith('- '):
-                    kernel_info = line[2:].strip()  # Remove '- ' prefix
-                    if ' (active)' in kernel_info:
-                        kernel = kernel_info.replace(' (active)', '')
-                        active_kernel = kernel
-                    else:
-                        kernel = kernel_info
-                    kernels.append(kernel)
-            
+
+            for match in _LIST_TEXT_RE.finditer(result.stdout):
+                if match.group('current'):
+                    active_kernel = match.group('current')
+                else:
+                    kernels.append(match.group('kernel'))
+                    if match.group('active'):
+                        active_kernel = match.group('kernel')
+
             return kernels, active_kernel
         except Exception:
             print(f"Error listing kernels: {str(e)}")
@@ -164,11 +362,39 @@ def list_kernels_cli():
         print(f"Error listing kernels: {str(e)}")
         return [], None
 
-def package_kernel_cli(source_type, source_path, output_dir, squashfs_comp="zstd", initrd_comp="zstd"):
+def sqfs_cli_args(choice):
+    """Return package CLI arguments for a SquashFS preset or compression name"""
+    if choice in SQFS_PRESETS:
+        compression, level, block_size = SQFS_PRESETS[choice]
+        return ['--sqfs-comp', compression, '--sqfs-level', str(level), '--sqfs-bs', str(block_size)]
+    return ['--sqfs-comp', choice]
+
+# Installed compressors do not change while the manager runs
+_sqfs_choices = None
+
+def sqfs_choices():
+    """Return the (id, label) entries of the SquashFS compression selector"""
+    global _sqfs_choices
+    if _sqfs_choices is None:
+        # Presets replace the plain entry of the compressor they are based on
+        preset_labels = {
+            'zstd-ultra-fast': _("zstd (ultra-fast)"),
+            'zstd-fast': _("zstd (fast)"),
+            'zstd-balanced': _("zstd (balanced)"),
+            'zstd-max': _("zstd (max)")
+        }
+        presets = get_available_sqfs_presets()
+        preset_compressions = {SQFS_PRESETS[name][0] for name in presets}
+        _sqfs_choices = [(name, preset_labels.get(name, name)) for name in presets]
+        _sqfs_choices += [(comp, comp) for comp in get_available_compressions()
+                          if comp not in preset_compressions]
+    return _sqfs_choices
+
+def package_kernel_cli(source_type, source_path, output_dir, squashfs_comp=DEFAULT_SQFS_PRESET, initrd_comp="zstd"):
     """Package kernel using minios-kernel CLI with JSON output"""
     try:
         # Build command arguments
-        cmd_args = ['--json', 'package', '-o', output_dir, '--sqfs-comp', squashfs_comp]
+        cmd_args = ['--json', 'package', '-o', output_dir] + sqfs_cli_args(squashfs_comp)
         
         if source_type == 'repo':
             cmd_args.extend(['--repo', source_path])
@@ -183,51 +409,37 @@ def package_kernel_cli(source_type, source_path, output_dir, squashfs_comp="zstd
         result = run_minios_kernel(cmd_args)
         
         if result.returncode == 0:
-            return True, result.stdout
+            invalidate_kernels_cache()
+            return True, _decode_output(result.stdout)
         else:
             # Try to parse JSON error response
             try:
-                error_data = json.loads(result.stderr)
-                return False, error_data.get('error', result.stderr)
+                error_data = json_loads(result.stderr)
+                return False, error_data.get('error', _decode_output(result.stderr))
             except json.JSONDecodeError:
-                return False, result.stderr or f"Command failed with return code {result.returncode}"
+                return False, _decode_output(result.stderr) or f"Command failed with return code {result.returncode}"
     except Exception as e:
         return False, str(e)
 
 def update_package_lists_gui():
     """Update package lists directly via pkexec apt update"""
     try:
-        result = subprocess.run([
-            'pkexec', 'apt', 'update'
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        result = subprocess.run(privileged_command([
+            'apt', 'update'
+        ]), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         
-        return result.returncode == 0, result.stderr if result.returncode != 0 else "Package lists updated"
+        return result.returncode == 0, _decode_output(result.stderr) if result.returncode != 0 else "Package lists updated"
     except Exception as e:
         return False, str(e)
 
 def delete_kernel_cli(kernel_version):
     """Delete kernel using minios-kernel CLI with administrative privileges"""
     try:
-        # Use pkexec to execute the script with JSON output
         result = run_minios_kernel(['--json', 'delete', kernel_version])
-        
-        if result.returncode == 0:
-            response_data = json.loads(result.stdout)
-            success = response_data.get('success', False)
-            message = response_data.get('message', '')
-            error = response_data.get('error', '')
-            
-            if success:
-                return True, message
-            else:
-                return False, error
-        else:
-            # Try to parse error from stderr or stdout
-            error_msg = result.stderr.strip() or result.stdout.strip()
-            return False, f"Command failed with exit code {result.returncode}: {error_msg}"
-            
-    except json.JSONDecodeError as e:
-        return False, f"Failed to parse command output: {e}"
+        success, message = _cli_json_result(result, 'Kernel deleted successfully')
+        if success:
+            invalidate_kernels_cache()
+        return success, message
     except Exception as e:
         return False, str(e)
 
@@ -236,14 +448,14 @@ def check_minios_status_cli():
     try:
         result = run_minios_kernel(['status', '--json'])
         if result.returncode == 0:
-            status_data = json.loads(result.stdout)
+            status_data = json_loads(result.stdout)
             return status_data
         else:
             return {
                 'success': False,
                 'found': False,
                 'writable': False,
-                'error': f'CLI command failed: {result.stderr}'
+                'error': f'CLI command failed: {_decode_output(result.stderr)}'
             }
     except json.JSONDecodeError as e:
         return {
@@ -288,7 +500,9 @@ try:
     
     gettext.bindtextdomain(APP_NAME, locale_dir)
     gettext.textdomain(APP_NAME)
-    _ = gettext.gettext
+    # Load the catalog once; gettext.gettext() searches the locale
+    # directories again on every call
+    _ = gettext.translation(APP_NAME, locale_dir, fallback=True).gettext
 except Exception as e:
     print(f"Could not set up translation: {e}")
     _ = lambda s: s
@@ -296,21 +510,126 @@ except Exception as e:
 # ──────────────────────────────────────────────────────────────────────────────
 # Helper Functions
 # ──────────────────────────────────────────────────────────────────────────────
+_css_provider = None
+
 def apply_css_if_exists():
-    """Apply CSS styling to the application if the file exists."""
+    """Apply CSS styling to the application if the file exists.
+
+    The stylesheet is loaded and installed only once per process.
+    """
+    global _css_provider
+    if _css_provider is not None:
+        return
     if os.path.exists(CSS_FILE_PATH):
         provider = Gtk.CssProvider()
         provider.load_from_path(CSS_FILE_PATH)
         Gtk.StyleContext.add_provider_for_screen(
-            Gtk.Widget.get_screen(Gtk.Window()),
+            Gdk.Screen.get_default(),
             provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
+        _css_provider = provider
+
+# Kernel flavours recognised as a "-"-separated part of the package name
+KERNEL_TYPE_TAGS = (
+    ('rt', "Real-time"),
+    ('cloud', "Cloud-optimized"),
+    ('lowlatency', "Low-latency"),
+    ('generic', "Generic"),
+)
+_kernel_types_cache = {}
+
+# Control fields shown for a selected .deb, in display order
+CONTROL_INFO_FIELDS = ('Package', 'Version', 'Architecture', 'Description')
+
+def kernel_types(package_name):
+    """Return the kernel type labels for a kernel package name"""
+    types = _kernel_types_cache.get(package_name)
+    if types is None:
+        parts = set(package_name.lower().split('-'))
+        types = tuple(label for tag, label in KERNEL_TYPE_TAGS if tag in parts)
+        _kernel_types_cache[package_name] = types
+    return types
+
+def kernel_row_texts(kernel_name, kernel_info, source_type):
+    """Return (name, description, details) texts for a kernel selection row"""
+    display_name = kernel_name[len('linux-image-'):] if kernel_name.startswith('linux-image-') else kernel_name
+    
+    if not (kernel_info and source_type == "repository"):
+        desc_text = _("Manual package") if source_type == "manual" else _("Repository kernel")
+        return display_name, desc_text, ""
+    
+    desc_parts = []
+    if kernel_info.get('description'):
+        desc_parts.append(kernel_info['description'])
+    if kernel_info.get('architecture'):
+        desc_parts.append(f"({kernel_info['architecture']})")
+    if kernel_info.get('size_text'):
+        desc_parts.append(f"• {kernel_info['size_text']}")
+    
+    # Kernel type detection from package name
+    tech_parts = [t for t in kernel_types(kernel_info['package']) if t != "Generic"]
+    return display_name, " ".join(desc_parts), " • ".join(tech_parts)
+
+def label_attrs(bold=False, scale=None, color=None):
+    """Return a Pango.AttrList for bold, scaled and/or colored label text"""
+    attrs = Pango.AttrList()
+    if bold:
+        attrs.insert(Pango.attr_weight_new(Pango.Weight.BOLD))
+    if scale:
+        attrs.insert(Pango.attr_scale_new(scale))
+    if color:
+        red, green, blue = (int(color[i:i + 2], 16) * 257 for i in (1, 3, 5))
+        attrs.insert(Pango.attr_foreground_new(red, green, blue))
+    return attrs
+
+# Shared label styles, used instead of parsing the same markup for every row.
+# Scales match the Pango markup sizes "large", "small" and "x-small".
+ATTRS_BOLD = label_attrs(bold=True)
+ATTRS_ROW_TITLE = label_attrs(bold=True, scale=1.2)
+ATTRS_ROW_DESC = label_attrs(scale=0.8333, color="#555555")
+ATTRS_ROW_DETAIL = label_attrs(scale=0.6944, color="#777777")
+ATTRS_BADGE = label_attrs(bold=True, scale=0.8333)
+ATTRS_HINT = label_attrs(scale=0.8333, color="#666666")
+
+# Themed icon surfaces by (icon name, Gtk.IconSize, scale); cleared on theme change
+_icon_surfaces = {}
+_icon_theme = None
+
+def icon_surface(icon_name, size, scale):
+    """Return the surface for a themed icon at a scale factor, loading it only once"""
+    global _icon_theme
+    key = (icon_name, size, scale)
+    surface = _icon_surfaces.get(key)
+    if surface is None:
+        if _icon_theme is None:
+            _icon_theme = Gtk.IconTheme.get_default()
+            _icon_theme.connect('changed', lambda theme: _icon_surfaces.clear())
+        width = Gtk.icon_size_lookup(size)[1]
+        try:
+            surface = _icon_theme.load_surface(icon_name, width, scale, None, 0)
+        except (GLib.Error, TypeError):
+            # TypeError: cairo surfaces need python3-gi-cairo
+            return None
+        _icon_surfaces[key] = surface
+    return surface
+
+def icon_image(icon_name, size, scale):
+    """Return a Gtk.Image for a themed icon, sharing the loaded surface"""
+    surface = icon_surface(icon_name, size, scale)
+    if surface is None:
+        return Gtk.Image.new_from_icon_name(icon_name, size)
+    return Gtk.Image.new_from_surface(surface)
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Main Application Window
 # ──────────────────────────────────────────────────────────────────────────────
 class KernelPackWindow(Gtk.ApplicationWindow):
+    # Bytes of CLI output requested per read
+    CLI_READ_SIZE = 65536
+    # Kernel selection rows built at once; more are added while scrolling
+    KERNEL_ROWS_BATCH = 60
+
     def __init__(self, application: Gtk.Application):
         super().__init__(application=application)
         self.set_default_size(750, 550)
@@ -320,13 +639,62 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         self.selected_kernel = None
         self.selected_deb_files = []
         self.kernel_source = "manual"
-        self.sqfs_compression = "zstd"
+        self.sqfs_compression = DEFAULT_SQFS_PRESET
         self.is_building = False
         self.cancel_requested = False
         self.minios_path = None
         self.minios_writable = False
+        self.minios_status_known = False
         self.system_type = get_system_type()
+        # The running kernel cannot change while the manager is open
+        self.running_kernel = get_currently_running_kernel()
+        self.process = None
         self.active_pid = None
+        self._cli_watch_id = None
+        self._cancel_kill_id = None
+        # Button row at the bottom of the packaging progress view
+        self._bottom_button_box = None
+        self.saved_state = None
+        self.selected_file_path = None
+        self.selected_packaged_kernel = None
+
+        # Widgets that only exist while their view is built
+        self.build_button = None
+        self.cancel_button = None
+        self.sqfs_combo = None
+        self.local_radio = None
+        self.repo_radio = None
+        self.selected_file_label = None
+        self.activate_loading_box = None
+        self.cancel_loading_box = None
+        self.cancel_loading_spinner = None
+        self.cancel_loading_label = None
+
+        # Worker threads for CLI calls, apt and file reads
+        self._pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="mkm-worker")
+
+        # dpkg-deb info lines by (path, mtime_ns, size) and the files on display
+        self._pkg_info_cache = {}
+        self._pkg_info_request = None
+
+        # Callbacks posted from worker threads, run by one idle source
+        self._ui_queue = collections.deque()
+        self._ui_lock = threading.Lock()
+        self._ui_drain_pending = False
+
+        # Latest arguments of list rebuilds waiting for an idle slot
+        self._populate_pending = {}
+
+        # Kernel list loading row, built on first use
+        self._loading_row = None
+
+        # Packaging log view and the lines waiting to be appended to it
+        self.log_textview = None
+        self.log_buffer = None
+        self._log_pending = []
+        self._log_flush_scheduled = False
+        self._log_stamp_time = None
+        self._log_stamp = ''
 
         # UI components
         self.main_vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
@@ -339,28 +707,112 @@ class KernelPackWindow(Gtk.ApplicationWindow):
 
         # Build the user interface
         self._build_header_bar()
-        self._detect_minios_directory()
         self._build_main_ui()
         self._update_buttons_state()  # Update button states after UI is built
 
+        # Detect MiniOS directory and list kernels without blocking the window
+        self._start_startup_probes()
+
         self.connect("destroy", self._on_destroy)
 
     def _on_destroy(self, widget):
         # widget parameter is not used
+        self._pool.shutdown(wait=False)
+        _priv_helper.close()
         self.get_application().quit()
 
-    def _detect_minios_directory(self):
-        """Detect MiniOS directory and check write permissions"""
+    def _post_to_ui(self, func, *args):
+        """Run func(*args) on the GTK main thread; callable from any thread"""
+        with self._ui_lock:
+            self._ui_queue.append((func, args))
+            if self._ui_drain_pending:
+                return
+            self._ui_drain_pending = True
+        # Results should not wait behind redraws and other idle work
+        GLib.idle_add(self._drain_ui_queue, priority=GLib.PRIORITY_DEFAULT)
+
+    def _drain_ui_queue(self):
+        """Run every callback posted since the last drain"""
+        with self._ui_lock:
+            pending = list(self._ui_queue)
+            self._ui_queue.clear()
+            self._ui_drain_pending = False
+        for func, args in pending:
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Error in UI callback {func.__name__}: {e}")
+        return False
+
+    def _schedule_populate(self, populate, *args):
+        """Run a list rebuild once at idle, with the most recent arguments"""
+        scheduled = populate in self._populate_pending
+        self._populate_pending[populate] = args
+        if not scheduled:
+            GLib.idle_add(self._run_populate, populate, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _run_populate(self, populate):
+        """Rebuild a list with the arguments stored by _schedule_populate"""
+        args = self._populate_pending.pop(populate, None)
+        if args is not None:
+            populate(*args)
+        return False
+
+    def _start_startup_probes(self):
+        """Run the MiniOS status probe, then the kernel list probe, in the background
+
+        Both probes go through the privileged helper, which serves one call at
+        a time, so the kernel list is only requested once the status is in.
+        """
+        self._show_activate_loading(True, _("Loading kernels..."))
+
+        status_future = self._pool.submit(self._probe_minios_directory)
+        status_future.add_done_callback(lambda f: self._post_to_ui(self._on_minios_status_probed, f))
+
+    def _probe_minios_directory(self):
+        """Detect MiniOS directory and check write permissions (worker thread)"""
         # Use CLI command to check status
         status_data = check_minios_status_cli()
-        
+
         if status_data.get('success', False) and status_data.get('found', False):
-            self.minios_path = status_data.get('minios_path')
-            self.minios_writable = status_data.get('writable', False)
-        else:
-            # Fallback to direct detection if CLI fails
-            self.minios_path = find_minios_directory()
-            self.minios_writable = False  # Assume not writable if CLI check fails
+            return status_data.get('minios_path'), status_data.get('writable', False)
+
+        # Fallback to direct detection if CLI fails
+        return find_minios_directory(), False  # Assume not writable if CLI check fails
+
+    def _on_minios_status_probed(self, future):
+        """Apply the MiniOS directory status in the main thread"""
+        try:
+            self.minios_path, self.minios_writable = future.result()
+        except Exception as e:
+            print(f"Error detecting MiniOS directory: {e}")
+            self.minios_path, self.minios_writable = None, False
+        self.minios_status_known = True
+
+        self._update_system_status_info()
+        self._update_buttons_state()
+
+        # Do not follow a dismissed auth dialog with another one
+        if _priv_helper.denied:
+            self._show_activate_loading(False)
+            self._schedule_populate(self._populate_packaged_kernels, ([], None))
+            return False
+
+        # With the path known the result also fills the kernel list cache
+        kernels_future = self._pool.submit(list_kernels_cli, self.minios_path)
+        kernels_future.add_done_callback(lambda f: self._post_to_ui(self._on_kernels_probed, f))
+        return False
+
+    def _on_kernels_probed(self, future):
+        """Populate the startup kernel list in the main thread"""
+        try:
+            kernels = future.result()
+        except Exception as e:
+            print(f"Error listing kernels: {e}")
+            kernels = ([], None)
+        self._show_activate_loading(False)
+        self._schedule_populate(self._populate_packaged_kernels, kernels)
+        return False
 
     def _build_header_bar(self):
         """Build the header bar"""
@@ -374,7 +826,25 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         minios_hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
         minios_hbox.set_margin_bottom(12)
         
-        if self.minios_path and self.minios_writable:
+        # Status icon
+        self.minios_status_icon = Gtk.Image()
+        minios_hbox.pack_start(self.minios_status_icon, False, False, 0)
+        
+        # Status text - clean and simple
+        self.minios_status_label = Gtk.Label()
+        self.minios_status_label.set_halign(Gtk.Align.START)
+        minios_hbox.pack_start(self.minios_status_label, False, False, 0)
+        
+        self.main_vbox.pack_start(minios_hbox, False, False, 0)
+        self._update_system_status_info()
+
+    def _update_system_status_info(self):
+        """Refresh the MiniOS directory status icon and text"""
+        if not self.minios_status_known:
+            minios_icon_name = "dialog-information"
+            minios_color = "#666666"  # Gray
+            status_text = _("Checking MiniOS directory...")
+        elif self.minios_path and self.minios_writable:
             minios_icon_name = "emblem-default"  # Green checkmark
             minios_color = "#2E7D32"  # Green
             status_text = _("MiniOS directory is writable")
@@ -386,31 +856,25 @@ class KernelPackWindow(Gtk.ApplicationWindow):
             else:
                 status_text = _("MiniOS directory not found")
         
-        # Status icon
-        status_icon = Gtk.Image.new_from_icon_name(minios_icon_name, Gtk.IconSize.MENU)
-        minios_hbox.pack_start(status_icon, False, False, 0)
-        
-        # Status text - clean and simple
-        minios_status_label = Gtk.Label()
-        minios_status_label.set_markup(f'<span color="{minios_color}"><b>{status_text}</b></span>')
-        minios_status_label.set_halign(Gtk.Align.START)
-        minios_hbox.pack_start(minios_status_label, False, False, 0)
-        
-        self.main_vbox.pack_start(minios_hbox, False, False, 0)
+        surface = icon_surface(minios_icon_name, Gtk.IconSize.MENU, self.get_scale_factor())
+        if surface is not None:
+            self.minios_status_icon.set_from_surface(surface)
+        else:
+            self.minios_status_icon.set_from_icon_name(minios_icon_name, Gtk.IconSize.MENU)
+        self.minios_status_label.set_text(status_text)
+        self.minios_status_label.set_attributes(label_attrs(bold=True, color=minios_color))
 
     def _build_main_ui(self):
         """Build main interface with tabs"""
         # Clear existing UI
         for child in self.main_vbox.get_children():
             self.main_vbox.remove(child)
+        self._bottom_button_box = None
             
         # Clear references to progress UI overlays
-        if hasattr(self, 'cancel_loading_box'):
-            delattr(self, 'cancel_loading_box')
-        if hasattr(self, 'cancel_loading_spinner'):
-            delattr(self, 'cancel_loading_spinner')
-        if hasattr(self, 'cancel_loading_label'):
-            delattr(self, 'cancel_loading_label')
+        self.cancel_loading_box = None
+        self.cancel_loading_spinner = None
+        self.cancel_loading_label = None
 
         # System status info
         self._build_system_status_info()
@@ -470,6 +934,8 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         
         # Packaged kernels list
         self.packaged_kernel_list = Gtk.ListBox(selection_mode=Gtk.SelectionMode.SINGLE)
+        # Rows built by _populate_packaged_kernels, keyed by (kernel, is_active, is_running)
+        self._kernel_rows = {}
         self.packaged_kernel_list.connect("row-selected", self._on_packaged_kernel_selected)
         self.packaged_kernel_list.connect("button-press-event", self._on_list_button_press)
         
@@ -498,7 +964,7 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         tab_box.pack_start(overlay, True, True, 0)
         
         # Populate packaged kernels
-        self._populate_packaged_kernels()
+        self._refresh_packaged_kernels()
         
         # Create context menu
         self._create_context_menu()
@@ -523,15 +989,11 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         # Add compression selection aligned to the right (reverse order for pack_end)
         self.sqfs_combo = Gtk.ComboBoxText()
         self.sqfs_combo.set_size_request(120, -1)  # Set minimum width to 120 pixels
-        compressions = get_available_compressions()
-        for comp in compressions:
-            self.sqfs_combo.append_text(comp)
-        # Set default to zstd
-        try:
-            default_index = compressions.index("zstd")
-        except ValueError:
-            default_index = 0
-        self.sqfs_combo.set_active(default_index)
+        for choice_id, label in sqfs_choices():
+            self.sqfs_combo.append(choice_id, label)
+        if not self.sqfs_combo.set_active_id(DEFAULT_SQFS_PRESET):
+            self.sqfs_combo.set_active(0)
+        self.sqfs_compression = self.sqfs_combo.get_active_id() or DEFAULT_SQFS_PRESET
         self.sqfs_combo.connect("changed", self._on_sqfs_compression_changed)
         source_box.pack_end(self.sqfs_combo, False, False, 0)
         
@@ -607,12 +1069,19 @@ class KernelPackWindow(Gtk.ApplicationWindow):
 
         self.kernel_list = Gtk.ListBox(selection_mode=Gtk.SelectionMode.SINGLE)
         self.kernel_list.connect("row-selected", self._on_kernel_selected)
+        # Kernels whose rows have not been built yet (see _add_kernel_rows_batch)
+        self._pending_kernels = []
+        self._kernel_batch_scheduled = False
 
         sw = Gtk.ScrolledWindow()
         sw.set_min_content_width(650)
         sw.set_min_content_height(200)
         sw.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         sw.add(self.kernel_list)
+        # "changed" covers lists that do not fill the view, which never scroll
+        vadjustment = sw.get_vadjustment()
+        vadjustment.connect("value-changed", self._on_kernel_list_scrolled)
+        vadjustment.connect("changed", self._on_kernel_list_scrolled)
         self.repo_selection_box.pack_start(sw, True, True, 0)
         
         kernel_selection_box.pack_start(self.repo_selection_box, True, True, 0)
@@ -643,12 +1112,12 @@ class KernelPackWindow(Gtk.ApplicationWindow):
     def _update_buttons_state(self):
         """Update buttons state based on MiniOS directory writeability and selection"""
         # Check if build button should be enabled
-        if hasattr(self, 'build_button') and self.build_button is not None:
-            selected_kernel = getattr(self, 'selected_kernel', None)
-            selected_deb_files = getattr(self, 'selected_deb_files', [])
-            minios_path = getattr(self, 'minios_path', None)
-            minios_writable = getattr(self, 'minios_writable', False)
-            is_building = getattr(self, 'is_building', False)
+        if self.build_button is not None:
+            selected_kernel = self.selected_kernel
+            selected_deb_files = self.selected_deb_files
+            minios_path = self.minios_path
+            minios_writable = self.minios_writable
+            is_building = self.is_building
 
             if self.repo_radio.get_active():
                 has_selection = bool(selected_kernel)
@@ -674,8 +1143,47 @@ class KernelPackWindow(Gtk.ApplicationWindow):
                 tooltip = _("Package kernel and add to repository")
             self.build_button.set_tooltip_text(tooltip)
 
-    def _populate_packaged_kernels(self):
-        """Populate list of packaged kernels"""
+    def _refresh_packaged_kernels(self):
+        """Fetch the kernel list in the worker pool, then repopulate in one pass"""
+        if not self.minios_path:
+            self._schedule_populate(self._populate_packaged_kernels, ([], None))
+            return False
+        future = self._pool.submit(list_kernels_cli, self.minios_path)
+        future.add_done_callback(lambda f: self._post_to_ui(self._on_packaged_kernels_fetched, f))
+        return False
+
+    def _on_packaged_kernels_fetched(self, future):
+        """Apply a kernel list fetched by _refresh_packaged_kernels"""
+        try:
+            kernels_data = future.result()
+        except Exception as e:
+            print(f"Error listing kernels: {e}")
+            kernels_data = ([], None)
+        self._schedule_populate(self._populate_packaged_kernels, kernels_data)
+        return False
+
+    def _populate_packaged_kernels(self, kernels_data):
+        """Populate list of packaged kernels
+
+        kernels_data is the (kernels, active_kernel) tuple fetched with
+        list_kernels_cli() off the main thread.
+        """
+        # Coalesce child property notifications while the rows are rebuilt
+        self.packaged_kernel_list.freeze_child_notify()
+        try:
+            self._fill_packaged_kernel_list(kernels_data)
+        finally:
+            self.packaged_kernel_list.thaw_child_notify()
+        self.packaged_kernel_list.show_all()
+
+    def _fill_packaged_kernel_list(self, kernels_data):
+        """Update the packaged kernel rows to match kernels_data"""
+        current = self.packaged_kernel_list.get_children()
+        if self.minios_path and kernels_data[0] and \
+                [getattr(row, 'kernel_version', None) for row in current] == kernels_data[0]:
+            self._update_packaged_kernel_rows(current, *kernels_data)
+            return
+
         # Clear existing kernels
         for child in self.packaged_kernel_list.get_children():
             self.packaged_kernel_list.remove(child)
@@ -683,7 +1191,7 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         if not self.minios_path:
             return
         
-        all_kernels, active_kernel = list_kernels_cli()
+        all_kernels, active_kernel = kernels_data
         
         if not all_kernels:
             # Show no kernels message
@@ -693,18 +1201,20 @@ class KernelPackWindow(Gtk.ApplicationWindow):
             main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
             main_box.set_halign(Gtk.Align.CENTER)
             
-            icon = Gtk.Image.new_from_icon_name("dialog-information", Gtk.IconSize.DND)
+            icon = icon_image("dialog-information", Gtk.IconSize.DND, self.get_scale_factor())
             main_box.pack_start(icon, False, False, 0)
             
             info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
             
             title_label = Gtk.Label()
-            title_label.set_markup(f'<b>{_("No kernels packaged")}</b>')
+            title_label.set_text(_("No kernels packaged"))
+            title_label.set_attributes(ATTRS_BOLD)
             title_label.set_halign(Gtk.Align.START)
             info_box.pack_start(title_label, False, False, 0)
             
             detail_label = Gtk.Label()
-            detail_label.set_markup(f'<span size="small" color="#666666">{_("Package a kernel first using the Package Kernel tab")}</span>')
+            detail_label.set_text(_("Package a kernel first using the Package Kernel tab"))
+            detail_label.set_attributes(ATTRS_HINT)
             detail_label.set_halign(Gtk.Align.START)
             info_box.pack_start(detail_label, False, False, 0)
             
@@ -713,111 +1223,119 @@ class KernelPackWindow(Gtk.ApplicationWindow):
             self.packaged_kernel_list.add(no_kernels_row)
             
         else:
+            # Rows whose kernel and status did not change are reused as built
+            rows = {}
             for kernel in all_kernels:
-                # For CLI compatibility, create simplified kernel_info
-                is_active = kernel == active_kernel
-                is_running = is_kernel_currently_running(kernel)
-                
-                kernel_info = {
-                    'display_name': kernel,
-                    'description': f"Kernel version {kernel}",
-                    'is_active': is_active,
-                    'is_running': is_running,
-                    'icon_name': 'package-x-generic',
-                    'status': 'active' if is_active else 'available'
-                }
-
-                row = Gtk.ListBoxRow()
-                
-                # Add CSS classes based on kernel status
-                if kernel_info.get('is_running'):
-                    row.get_style_context().add_class('kernel-status-running')
-                elif kernel_info.get('is_active'):
-                    row.get_style_context().add_class('kernel-status-active')
-                else:
-                    row.get_style_context().add_class('kernel-status-available')
-                
-                main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=15)
-                main_box.get_style_context().add_class('kernel-item')
-                
-                # Use the new icon from kernel_info
-                img = Gtk.Image.new_from_icon_name(kernel_info.get('icon_name', 'package-x-generic'), Gtk.IconSize.DND)
-                main_box.pack_start(img, False, False, 0)
-                
-                info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
-                info_box.set_hexpand(True)
-                
-                # Main kernel name with better formatting
-                kernel_label = Gtk.Label()
-                kernel_label.set_markup(f'<b><span size="large">{GLib.markup_escape_text(kernel_info["display_name"])}</span></b>')
-                kernel_label.set_halign(Gtk.Align.START)
-                kernel_label.set_ellipsize(Pango.EllipsizeMode.END)
-                info_box.pack_start(kernel_label, False, False, 0)
-                
-                # Description with kernel type and size
-                desc_label = Gtk.Label()
-                desc_label.set_markup(f'<span size="small" color="#555555">{GLib.markup_escape_text(kernel_info["description"])}</span>')
-                desc_label.set_halign(Gtk.Align.START)
-                desc_label.set_ellipsize(Pango.EllipsizeMode.END)
-                info_box.pack_start(desc_label, False, False, 0)
-                
-                main_box.pack_start(info_box, True, True, 0)
-                
-                # Status badges on the right - in horizontal line
-                status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
-                status_box.set_valign(Gtk.Align.CENTER)
-                status_box.set_halign(Gtk.Align.END)
-                
-                # Primary status badge
-                status_label = Gtk.Label()
-                if kernel_info.get('is_active'):
-                    status_text = _('ACTIVE')
-                    status_label.get_style_context().add_class('active-kernel-badge')
-                else:
-                    status_text = _('AVAILABLE')
-                    status_label.get_style_context().add_class('available-kernel-badge')
-                
-                status_label.set_markup(f'<span size="small" weight="bold">{GLib.markup_escape_text(status_text)}</span>')
-                status_label.set_halign(Gtk.Align.CENTER)
-                status_box.pack_start(status_label, False, False, 0)
-                
-                # Running badge (secondary) - in same line
-                if kernel_info.get('is_running'):
-                    running_label = Gtk.Label()
-                    running_text = _('RUNNING')
-                    running_label.get_style_context().add_class('running-kernel-badge')
-                    running_label.set_markup(f'<span size="small" weight="bold">{GLib.markup_escape_text(running_text)}</span>')
-                    running_label.set_halign(Gtk.Align.CENTER)
-                    status_box.pack_start(running_label, False, False, 0)
-                
-                main_box.pack_start(status_box, False, False, 0)
-                
-                row.add(main_box)
-                row.kernel_version = kernel
+                key = (kernel, kernel == active_kernel, kernel == self.running_kernel)
+                row = self._kernel_rows.get(key) or self._build_packaged_kernel_row(*key)
+                rows[key] = row
                 self.packaged_kernel_list.add(row)
+            self._kernel_rows = rows
+
+    def _update_packaged_kernel_rows(self, rows, all_kernels, active_kernel):
+        """Swap only the rows whose status changed; the kernels are unchanged"""
+        for index, (row, kernel) in enumerate(zip(rows, all_kernels)):
+            key = (kernel, kernel == active_kernel, kernel == self.running_kernel)
+            if row.kernel_key == key:
+                continue
+            new_row = self._kernel_rows.get(key) or self._build_packaged_kernel_row(*key)
+            # The selected kernel stays the same, so the swap must not
+            # deselect and reselect it through the handler
+            self.packaged_kernel_list.handler_block_by_func(self._on_packaged_kernel_selected)
+            try:
+                was_selected = row.is_selected()
+                self.packaged_kernel_list.remove(row)
+                self.packaged_kernel_list.insert(new_row, index)
+                if was_selected:
+                    self.packaged_kernel_list.select_row(new_row)
+            finally:
+                self.packaged_kernel_list.handler_unblock_by_func(self._on_packaged_kernel_selected)
+            rows[index] = new_row
+        self._kernel_rows = {row.kernel_key: row for row in rows}
+
+    def _build_row_grid(self, icon_name, title, description, detail, badges):
+        """Build the icon, text lines and (text, css class) badges of a kernel row"""
+        # One grid instead of nested boxes keeps the row's widget tree flat
+        grid = Gtk.Grid(column_spacing=5, row_spacing=3)
+        grid.get_style_context().add_class('kernel-item')
+        
+        lines = [(title, ATTRS_ROW_TITLE), (description, ATTRS_ROW_DESC)]
+        if detail:
+            lines.append((detail, ATTRS_ROW_DETAIL))
+        
+        icon = icon_image(icon_name, Gtk.IconSize.DND, self.get_scale_factor())
+        icon.set_margin_end(10)
+        grid.attach(icon, 0, 0, 1, len(lines))
+        
+        for top, (text, attrs) in enumerate(lines):
+            label = Gtk.Label()
+            label.set_text(text)
+            label.set_attributes(attrs)
+            label.set_halign(Gtk.Align.START)
+            label.set_hexpand(True)
+            label.set_ellipsize(Pango.EllipsizeMode.END)
+            grid.attach(label, 1, top, 1, 1)
+        
+        # Status badges on the right - in horizontal line
+        for column, (text, css_class) in enumerate(badges, 2):
+            badge = Gtk.Label()
+            badge.get_style_context().add_class(css_class)
+            badge.set_text(text)
+            badge.set_attributes(ATTRS_BADGE)
+            badge.set_valign(Gtk.Align.CENTER)
+            if column == 2:
+                badge.set_margin_start(10)
+            grid.attach(badge, column, 0, 1, len(lines))
+        
+        return grid
+
+    def _build_packaged_kernel_row(self, kernel, is_active, is_running):
+        """Build the list row for a packaged kernel"""
+        # For CLI compatibility, create simplified kernel_info
+        kernel_info = {
+            'display_name': kernel,
+            'description': f"Kernel version {kernel}",
+            'is_active': is_active,
+            'is_running': is_running,
+            'icon_name': 'package-x-generic',
+            'status': 'active' if is_active else 'available'
+        }
+
+        row = Gtk.ListBoxRow()
         
-        self.packaged_kernel_list.show_all()
+        # Add CSS classes based on kernel status
+        if kernel_info.get('is_running'):
+            row.get_style_context().add_class('kernel-status-running')
+        elif kernel_info.get('is_active'):
+            row.get_style_context().add_class('kernel-status-active')
+        else:
+            row.get_style_context().add_class('kernel-status-available')
+        
+        # Primary status badge, then the running badge on the same line
+        if is_active:
+            badges = [(_('ACTIVE'), 'active-kernel-badge')]
+        else:
+            badges = [(_('AVAILABLE'), 'available-kernel-badge')]
+        if is_running:
+            badges.append((_('RUNNING'), 'running-kernel-badge'))
+        
+        main_box = self._build_row_grid(kernel_info['icon_name'], kernel_info['display_name'],
+                                        kernel_info['description'], None, badges)
+        
+        row.add(main_box)
+        row.kernel_version = kernel
+        row.kernel_key = (kernel, is_active, is_running)
+        row.kernel_info = kernel_info
+        return row
 
     def _on_packaged_kernel_selected(self, listbox, row):
         """Handle packaged kernel selection"""
-        if row and hasattr(row, 'kernel_version'):
-            self.selected_packaged_kernel = row.kernel_version
-            
-            kernel_info = get_kernel_info(self.minios_path, self.selected_packaged_kernel)
-            if not kernel_info:
-                return
-
-            # Kernel status tracking (buttons removed, only context menu now)
-            is_active = kernel_info['status'] == 'active'
-            is_running = is_kernel_currently_running(self.selected_packaged_kernel)
-            # Context menu will handle sensitivity based on kernel status
-        else:
-            self.selected_packaged_kernel = None
-            # No buttons to update - using context menu only
+        # Context menu will handle sensitivity based on kernel status
+        self.selected_packaged_kernel = getattr(row, 'kernel_version', None) if row else None
 
     def _on_activate_clicked(self, button):
         """Handle activate kernel button click"""
-        if not hasattr(self, 'selected_packaged_kernel') or not self.selected_packaged_kernel:
+        if not self.selected_packaged_kernel:
             self._show_error(_("Please select a kernel to activate"))
             return
         
@@ -827,7 +1345,7 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         
         dialog = Gtk.MessageDialog(
             transient_for=self,
-            flags=0,
+            modal=True,
             message_type=Gtk.MessageType.QUESTION,
             buttons=Gtk.ButtonsType.YES_NO,
             text=_("Activate Kernel")
@@ -838,42 +1356,42 @@ class KernelPackWindow(Gtk.ApplicationWindow):
                 self.selected_packaged_kernel)
         )
         
-        response = dialog.run()
-        dialog.destroy()
+        def on_response(dialog, response_id):
+            dialog.destroy()
+            if response_id == Gtk.ResponseType.YES:
+                self._activate_kernel()
         
-        if response == Gtk.ResponseType.YES:
-            self._activate_kernel()
+        dialog.connect('response', on_response)
+        dialog.show()
 
     def _activate_kernel(self):
         """Activate the selected kernel with loading overlay"""
         # Show loading overlay
         self._show_activate_loading(True, _("Activating kernel, please wait..."))
         
-        # Activate kernel in background thread
-        def activate_kernel_bg():
-            try:
-                success, output = activate_kernel_cli(self.selected_packaged_kernel)
-                
-                # Update UI in main thread
-                if success:
-                    GLib.idle_add(self._on_kernel_activation_complete, True, None, self.selected_packaged_kernel)
-                else:
-                    GLib.idle_add(self._on_kernel_activation_complete, False, output, self.selected_packaged_kernel)
-                
-            except Exception as e:
-                GLib.idle_add(self._on_kernel_activation_complete, False, str(e), self.selected_packaged_kernel)
-        
-        thread = threading.Thread(target=activate_kernel_bg, daemon=True)
-        thread.start()
-    
+        kernel_version = self.selected_packaged_kernel
+        future = self._pool.submit(activate_kernel_cli, kernel_version)
+        future.add_done_callback(
+            lambda f: self._post_to_ui(self._on_kernel_activation_done, f, kernel_version))
+
+    def _on_kernel_activation_done(self, future, kernel_version):
+        """Unpack the activation result in the main thread"""
+        try:
+            success, output = future.result()
+        except Exception as e:
+            success, output = False, str(e)
+        return self._on_kernel_activation_complete(success, None if success else output, kernel_version)
+
     def _on_kernel_activation_complete(self, success, error, kernel_version):
         """Handle kernel activation completion"""
         # Hide loading overlay
         self._show_activate_loading(False)
         
         if success:
-            # Refresh kernel list - no dialog needed, user can see the result in badges
-            self._populate_packaged_kernels()
+            # Only the active badge moved; update the rows without a CLI round-trip
+            kernels = [row.kernel_version for row in self.packaged_kernel_list.get_children()
+                       if hasattr(row, 'kernel_version')]
+            self._schedule_populate(self._populate_packaged_kernels, (kernels, kernel_version))
         else:
             error_message = f"Failed to activate kernel"
             if error:
@@ -884,7 +1402,7 @@ class KernelPackWindow(Gtk.ApplicationWindow):
 
     def _on_delete_clicked(self, button):
         """Handle delete kernel button click"""
-        if not hasattr(self, 'selected_packaged_kernel') or not self.selected_packaged_kernel:
+        if not self.selected_packaged_kernel:
             self._show_error(_("Please select a kernel to delete"))
             return
         
@@ -894,7 +1412,7 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         
         dialog = Gtk.MessageDialog(
             transient_for=self,
-            flags=0,
+            modal=True,
             message_type=Gtk.MessageType.WARNING,
             buttons=Gtk.ButtonsType.YES_NO,
             text=_("Delete Kernel")
@@ -903,24 +1421,34 @@ class KernelPackWindow(Gtk.ApplicationWindow):
             _("Are you sure you want to delete kernel '{}'?\n\nThis action cannot be undone.").format(self.selected_packaged_kernel)
         )
         
-        response = dialog.run()
-        dialog.destroy()
+        def on_response(dialog, response_id):
+            dialog.destroy()
+            if response_id == Gtk.ResponseType.YES:
+                self._delete_kernel()
         
-        if response == Gtk.ResponseType.YES:
-            self._delete_kernel()
+        dialog.connect('response', on_response)
+        dialog.show()
 
     def _delete_kernel(self):
-        """Delete the selected kernel"""
+        """Delete the selected kernel without blocking the UI"""
+        self._show_activate_loading(True, _("Deleting kernel, please wait..."))
+        future = self._pool.submit(delete_kernel_cli, self.selected_packaged_kernel)
+        future.add_done_callback(lambda f: self._post_to_ui(self._on_kernel_deleted, f))
+
+    def _on_kernel_deleted(self, future):
+        """Handle kernel deletion completion in the main thread"""
+        self._show_activate_loading(False)
         try:
-            success, message = delete_kernel_cli(self.selected_packaged_kernel)
-            
+            success, message = future.result()
+
             if success:
-                self._populate_packaged_kernels()
+                self._refresh_packaged_kernels()
             else:
                 self._show_error(f"Failed to delete kernel")
-                
+
         except Exception as e:
             self._show_error(f"Error deleting kernel: {str(e)}")
+        return False
 
 
     def _on_browse_clicked(self, button):
@@ -957,140 +1485,126 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         filter_all.add_pattern("*" )
         dialog.add_filter(filter_all)
         
-        response = dialog.run()
+        dialog.connect('response', self._on_browse_response)
+        dialog.show()
+
+    def _on_browse_response(self, dialog, response_id):
+        """Take the chosen package files from the file chooser"""
+        selected_files = dialog.get_filenames() if response_id == Gtk.ResponseType.OK else None
+        dialog.destroy()
         
-        if response == Gtk.ResponseType.OK:
-            selected_files = dialog.get_filenames()
-            if selected_files:
-                selected_files = sorted(selected_files)
-                self.selected_deb_files = selected_files
-                self.selected_kernel = selected_files[0]
+        if selected_files:
+            selected_files = sorted(selected_files)
+            self.selected_deb_files = selected_files
+            self.selected_kernel = selected_files[0]
 
-                if len(selected_files) == 1:
-                    self.selected_file_label.set_text(os.path.basename(selected_files[0]))
-                else:
-                    self.selected_file_label.set_text(_("{} files selected").format(len(selected_files)))
+            if len(selected_files) == 1:
+                self.selected_file_label.set_text(os.path.basename(selected_files[0]))
+            else:
+                self.selected_file_label.set_text(_("{} files selected").format(len(selected_files)))
 
-                self._update_buttons_state()  # Use centralized button state update
+            self._update_buttons_state()  # Use centralized button state update
 
-                # Show package information
-                self._show_package_info(selected_files)
-        
-        dialog.destroy()
+            # Show package information
+            self._show_package_info(selected_files)
 
     def _show_package_info(self, package_paths):
         """Show information about selected package(s)"""
+        if isinstance(package_paths, str):
+            package_paths = [package_paths]
+        if not package_paths:
+            self._pkg_info_request = None
+            self.package_info_box.hide()
+            return
+        
+        # Files may sit on slow removable media, so they are only touched
+        # in the worker pool
+        request = tuple(package_paths)
+        self._pkg_info_request = request
+        self._set_package_info([f"<i>{_('Reading package...')}</i>"])
+        future = self._pool.submit(self._read_package_info, request)
+        future.add_done_callback(lambda f: self._post_to_ui(self._on_package_info_read, request, f))
+
+    def _set_package_info(self, info_lines):
+        """Show the package information lines"""
+        self.package_info_label.set_markup('\n'.join(info_lines))
+        self.package_info_box.show_all()
+
+    def _on_package_info_read(self, request, future):
+        """Show package information read by _read_package_info"""
         try:
-            if isinstance(package_paths, str):
-                package_paths = [package_paths]
-
-            if not package_paths:
-                self.package_info_box.hide()
-                return
-
-            total_size = 0
-            for path in package_paths:
-                total_size += os.stat(path).st_size
-
-            info_lines = [
-                f"<b>{_('Files')}:</b> {len(package_paths)}",
-                f"<b>{_('Total size')}:</b> {self._format_file_size(total_size)}",
-            ]
-
-            if len(package_paths) > 1:
-                info_lines.append(f"<b>{_('Selected files')}:</b>")
-                for package_path in package_paths:
-                    info_lines.append(f"• {os.path.basename(package_path)}")
-                self.package_info_label.set_markup('\n'.join(info_lines))
-                self.package_info_box.show_all()
-                return
+            info_lines = future.result()
+        except Exception as e:
+            info_lines = [f"<i>Error reading package: {GLib.markup_escape_text(str(e))}</i>"]
+        # Ignore results for packages that are no longer selected
+        if request == self._pkg_info_request:
+            self._set_package_info(info_lines)
+        return False
 
-            package_path = package_paths[0]
-            # Get basic file info
-            file_stat = os.stat(package_path)
-            file_size = file_stat.st_size
-            file_size_text = self._format_file_size(file_size)
-            
-            # Try to get package info using dpkg-deb
-            info_lines.append(f"<b>File:</b> {os.path.basename(package_path)}")
-            info_lines.append(f"<b>Size:</b> {file_size_text}")
-            
-            try:
-                # Get package control info
-                result = subprocess.run(['dpkg-deb', '-I', package_path], 
-                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
-                
-                # Parse control information
-                control_info = result.stdout
-                package_name = ""
-                version = ""
-                architecture = ""
-                description = ""
-                maintainer = ""
-                depends = ""
-                
-                for line in control_info.split('\n'):
-                    line = line.strip()
-                    if line.startswith('Package: '):
-                        package_name = line.split(':', 1)[1].strip()
-                    elif line.startswith('Version: '):
-                        version = line.split(':', 1)[1].strip()
-                    elif line.startswith('Architecture: '):
-                        architecture = line.split(':', 1)[1].strip()
-                    elif line.startswith('Description: '):
-                        description = line.split(':', 1)[1].strip()
-                    elif line.startswith('Maintainer: '):
-                        maintainer = line.split(':', 1)[1].strip()
-                        # Extract just name part before email
-                        if '<' in maintainer:
-                            maintainer = maintainer.split('<')[0].strip()
-                    elif line.startswith('Depends: '):
-                        depends = line.split(':', 1)[1].strip()
-                
-                if package_name:
-                    info_lines.append(f"<b>Package:</b> {package_name}")
-                if version:
-                    info_lines.append(f"<b>Version:</b> {version}")
-                if architecture:
-                    info_lines.append(f"<b>Architecture:</b> {architecture}")
-                if description:
-                    info_lines.append(f"<b>Description:</b> {description}")
-                    
-                # Detect kernel type from package name
-                if package_name:
-                    pkg_lower = package_name.lower()
-                    kernel_types = []
-                    if 'rt' in pkg_lower:
-                        kernel_types.append("Real-time")
-                    if 'cloud' in pkg_lower:
-                        kernel_types.append("Cloud-optimized")
-                    if 'lowlatency' in pkg_lower:
-                        kernel_types.append("Low-latency")
-                    if 'generic' in pkg_lower:
-                        kernel_types.append("Generic")
-                    
-                    if kernel_types:
-                        info_lines.append(f"<b>Type:</b> {', '.join(kernel_types)}")
+    def _read_package_info(self, package_paths):
+        """Return package information lines for the selected files (worker thread)"""
+        file_stats = [os.stat(path) for path in package_paths]
+        info_lines = [
+            f"<b>{_('Files')}:</b> {len(package_paths)}",
+            f"<b>{_('Total size')}:</b> {self._format_file_size(sum(st.st_size for st in file_stats))}",
+        ]
+        
+        if len(package_paths) > 1:
+            info_lines.append(f"<b>{_('Selected files')}:</b>")
+            for package_path in package_paths:
+                info_lines.append(f"• {GLib.markup_escape_text(os.path.basename(package_path))}")
+            return info_lines
+        
+        package_path = package_paths[0]
+        file_stat = file_stats[0]
+        info_lines.append(f"<b>File:</b> {GLib.markup_escape_text(os.path.basename(package_path))}")
+        info_lines.append(f"<b>Size:</b> {self._format_file_size(file_stat.st_size)}")
+        
+        # dpkg-deb output is cached until the file changes
+        key = (package_path, file_stat.st_mtime_ns, file_stat.st_size)
+        control_lines = self._pkg_info_cache.get(key)
+        if control_lines is None:
+            control_lines = self._read_package_control(package_path)
+            self._pkg_info_cache[key] = control_lines
+        return info_lines + control_lines
+
+    def _read_package_control(self, package_path):
+        """Return package info lines from dpkg-deb control data (worker thread)"""
+        info_lines = []
+        try:
+            # Get package control info
+            result = subprocess.run(['dpkg-deb', '-I', package_path], 
+                                  stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+            
+            # dpkg-deb indents the control fields by one space; deeper
+            # indentation marks continuation lines, which are skipped
+            fields = {}
+            for line in result.stdout.splitlines():
+                if not line.startswith(' ') or line.startswith('  '):
+                    continue
+                key, sep, value = line[1:].partition(': ')
+                if sep and key in CONTROL_INFO_FIELDS:
+                    fields[key] = value.strip()
+            
+            package_name = fields.get('Package', '')
+            for field in CONTROL_INFO_FIELDS:
+                if fields.get(field):
+                    info_lines.append(f"<b>{field}:</b> {GLib.markup_escape_text(fields[field])}")
                 
-            except subprocess.CalledProcessError:
-                info_lines.append("<i>Could not read package metadata</i>")
-            
-            # Set the info text
-            info_text = '\n'.join(info_lines)
-            self.package_info_label.set_markup(info_text)
-            self.package_info_box.show_all()
+            # Detect kernel type from package name
+            if package_name:
+                types = kernel_types(package_name)
+                if types:
+                    info_lines.append(f"<b>Type:</b> {', '.join(types)}")
             
-        except Exception as e:
-            self.package_info_label.set_markup(f"<i>Error reading package: {str(e)}</i>")
-            self.package_info_box.show_all()
+        except subprocess.CalledProcessError:
+            info_lines.append("<i>Could not read package metadata</i>")
+        
+        return info_lines
 
     def _format_file_size(self, size_bytes):
         """Format file size in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        return _format_size(size_bytes)
 
     def _populate_kernels(self):
         """Populate kernel list for manual packages (quick operation)"""
@@ -1103,36 +1617,48 @@ class KernelPackWindow(Gtk.ApplicationWindow):
 
     def _show_kernel_loading(self):
         """Show loading indicator in kernel list"""
-        # Clear existing kernels
-        for child in self.kernel_list.get_children():
-            self.kernel_list.remove(child)
-        
-        loading_row = Gtk.ListBoxRow()
-        loading_row.set_sensitive(False)
-        
-        main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        main_box.set_halign(Gtk.Align.CENTER)
+        # A fresh fetch follows; drop any rebuild still waiting for idle
+        self._populate_pending.pop(self._populate_kernels_with_data, None)
         
-        spinner = Gtk.Spinner()
-        spinner.start()
-        main_box.pack_start(spinner, False, False, 0)
-        
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        # Clear existing kernels
+        self._clear_kernel_list()
         
         if self.repo_radio.get_active():
-            status_text = _("Fetching kernel list from repository...")
+            self._show_list_loading(_("Fetching kernel list from repository..."))
         else:
-            status_text = _("Scanning for manual packages...")
-        
-        status_label = Gtk.Label()
-        status_label.set_markup(f'<b>{status_text}</b>')
-        status_label.set_halign(Gtk.Align.START)
-        info_box.pack_start(status_label, False, False, 0)
-        
-        main_box.pack_start(info_box, False, False, 0)
+            self._show_list_loading(_("Scanning for manual packages..."))
+
+    def _clear_kernel_list(self):
+        """Remove every kernel list row and stop the loading spinner"""
+        if self._loading_row is not None:
+            self._loading_spinner.stop()
+        for child in self.kernel_list.get_children():
+            self.kernel_list.remove(child)
+        self._pending_kernels = []
+
+    def _show_list_loading(self, status_text):
+        """Show the kernel list's loading row with status_text"""
+        # The row is built once and re-added while loading
+        if self._loading_row is None:
+            self._loading_row = Gtk.ListBoxRow()
+            self._loading_row.set_sensitive(False)
+            
+            main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+            main_box.set_halign(Gtk.Align.CENTER)
+            
+            self._loading_spinner = Gtk.Spinner()
+            main_box.pack_start(self._loading_spinner, False, False, 0)
+            
+            self._loading_label = Gtk.Label()
+            self._loading_label.set_attributes(ATTRS_BOLD)
+            self._loading_label.set_halign(Gtk.Align.START)
+            main_box.pack_start(self._loading_label, False, False, 0)
+            
+            self._loading_row.add(main_box)
         
-        loading_row.add(main_box)
-        self.kernel_list.add(loading_row)
+        self._loading_label.set_text(status_text)
+        self._loading_spinner.start()
+        self.kernel_list.add(self._loading_row)
         self.kernel_list.show_all()
 
     def _fetch_repository_kernels_threaded(self):
@@ -1142,17 +1668,31 @@ class KernelPackWindow(Gtk.ApplicationWindow):
             
             # Check if kernels list is empty (may indicate outdated package cache)
             if not kernels:
-                GLib.idle_add(self._show_package_cache_outdated_dialog)
+                self._post_to_ui(self._show_package_cache_outdated_dialog)
                 return
+            
+            # Prepare the row texts here rather than on the UI thread
+            for kernel_data in kernels:
+                if isinstance(kernel_data, dict):
+                    kernel_data['row_texts'] = kernel_row_texts(
+                        kernel_data['package'], kernel_data, "repository")
                 
-            GLib.idle_add(self._populate_kernels_with_data, kernels, "repository")
+            self._post_to_ui(self._schedule_populate, self._populate_kernels_with_data, kernels, "repository")
         except Exception as e:
-            GLib.idle_add(self._show_kernel_fetch_error, str(e))
+            self._post_to_ui(self._show_kernel_fetch_error, str(e))
 
     def _populate_kernels_with_data(self, kernels, source_type):
         """Populate kernel list with pre-fetched data"""
-        for child in self.kernel_list.get_children():
-            self.kernel_list.remove(child)
+        # Coalesce child property notifications while the rows are rebuilt
+        self.kernel_list.freeze_child_notify()
+        try:
+            self._fill_kernel_list(kernels, source_type)
+        finally:
+            self.kernel_list.thaw_child_notify()
+
+    def _fill_kernel_list(self, kernels, source_type):
+        """Replace the kernel selection rows with kernels"""
+        self._clear_kernel_list()
         
         self.kernel_source = source_type
         
@@ -1160,101 +1700,67 @@ class KernelPackWindow(Gtk.ApplicationWindow):
             self._show_no_kernels_found()
             return
         
-        for kernel_data in kernels:
-            # Handle both old format (strings) and new format (dicts)
-            if isinstance(kernel_data, dict):
-                kernel_name = kernel_data['package']
-                kernel_info = kernel_data
-            else:
-                kernel_name = kernel_data
-                kernel_info = None
-                
-            row = Gtk.ListBoxRow()
-            
-            main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=15)
-            main_box.get_style_context().add_class('kernel-item')
-            
-            # Use unified icon for all kernels
-            icon_name = "package-x-generic"
-            img = Gtk.Image.new_from_icon_name(icon_name, Gtk.IconSize.DND)
-            main_box.pack_start(img, False, False, 0)
-            
-            info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=3)
-            info_box.set_hexpand(True)
-            
-            # Main kernel name
-            kernel_label = Gtk.Label()
-            display_name = kernel_name.replace('linux-image-', '') if kernel_name.startswith('linux-image-') else kernel_name
-            kernel_label.set_markup(f'<b><span size="large">{GLib.markup_escape_text(display_name)}</span></b>')
-            kernel_label.set_halign(Gtk.Align.START)
-            kernel_label.set_ellipsize(Pango.EllipsizeMode.END)
-            info_box.pack_start(kernel_label, False, False, 0)
-            
-            # Description and details
-            if kernel_info and source_type == "repository":
-                desc_parts = []
-                if kernel_info.get('description'):
-                    desc_parts.append(kernel_info['description'])
-                if kernel_info.get('architecture'):
-                    desc_parts.append(f"({kernel_info['architecture']})")
-                if kernel_info.get('size_text'):
-                    desc_parts.append(f"• {kernel_info['size_text']}")
-                
-                desc_text = " ".join(desc_parts)
-            else:
-                desc_text = _("Manual package") if source_type == "manual" else _("Repository kernel")
-            
-            desc_label = Gtk.Label()
-            desc_label.set_markup(f'<span size="small" color="#555555">{GLib.markup_escape_text(desc_text)}</span>')
-            desc_label.set_halign(Gtk.Align.START)
-            desc_label.set_ellipsize(Pango.EllipsizeMode.END)
-            info_box.pack_start(desc_label, False, False, 0)
-            
-            # Technical info for repository packages
-            if kernel_info and source_type == "repository":
-                tech_parts = []
-                
-                # Add kernel type detection from package name
-                pkg_name = kernel_info['package'].lower()
-                if 'rt' in pkg_name:
-                    tech_parts.append("Real-time")
-                elif 'cloud' in pkg_name:
-                    tech_parts.append("Cloud-optimized")
-                elif 'lowlatency' in pkg_name:
-                    tech_parts.append("Low-latency")
-                
-                if tech_parts:
-                    version_label = Gtk.Label()
-                    version_text = " • ".join(tech_parts)
-                    version_label.set_markup(f'<span size="x-small" color="#777777">{GLib.markup_escape_text(version_text)}</span>')
-                    version_label.set_halign(Gtk.Align.START)
-                    version_label.set_ellipsize(Pango.EllipsizeMode.END)
-                    info_box.pack_start(version_label, False, False, 0)
-            
-            main_box.pack_start(info_box, True, True, 0)
-            
-            # Status badges on the right - repository kernels are always available
-            status_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
-            status_box.set_valign(Gtk.Align.CENTER)
-            status_box.set_halign(Gtk.Align.END)
-            
-            # Repository kernels are always available for download
-            status_label = Gtk.Label()
-            status_text = _('AVAILABLE')
-            status_label.get_style_context().add_class('available-kernel-badge')
-            status_label.set_markup(f'<span size="small" weight="bold">{GLib.markup_escape_text(status_text)}</span>')
-            status_label.set_halign(Gtk.Align.CENTER)
-            status_box.pack_start(status_label, False, False, 0)
-            
-            main_box.pack_start(status_box, False, False, 0)
-            
-            row.add(main_box)
-            row.kernel_version = kernel_name
-            row.kernel_info = kernel_info
-            self.kernel_list.add(row)
-            
+        # Rows are built in batches as the list is scrolled
+        self._pending_kernels = list(kernels)
+        self._add_kernel_rows_batch()
         self.kernel_list.show_all()
 
+    def _add_kernel_rows_batch(self):
+        """Build and add the next batch of pending kernel rows"""
+        batch = self._pending_kernels[:self.KERNEL_ROWS_BATCH]
+        del self._pending_kernels[:self.KERNEL_ROWS_BATCH]
+        for kernel_data in batch:
+            self.kernel_list.add(self._build_kernel_row(kernel_data, self.kernel_source))
+
+    def _on_kernel_list_scrolled(self, adjustment):
+        """Schedule the next batch of kernel rows when nearing the list end
+
+        Also runs when the list size or view size changes, so batches keep
+        coming until the rows overflow the view.
+        """
+        if not self._pending_kernels or self._kernel_batch_scheduled:
+            return
+        if adjustment.get_value() + adjustment.get_page_size() >= 0.8 * adjustment.get_upper():
+            self._kernel_batch_scheduled = True
+            GLib.idle_add(self._add_next_kernel_rows, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _add_next_kernel_rows(self):
+        """Append one batch of pending kernel rows (idle callback)"""
+        self._kernel_batch_scheduled = False
+        self.kernel_list.freeze_child_notify()
+        try:
+            self._add_kernel_rows_batch()
+        finally:
+            self.kernel_list.thaw_child_notify()
+        self.kernel_list.show_all()
+        return False
+
+    def _build_kernel_row(self, kernel_data, source_type):
+        """Build the selection list row for a repository or manual kernel"""
+        # Handle both old format (strings) and new format (dicts)
+        if isinstance(kernel_data, dict):
+            kernel_name = kernel_data['package']
+            kernel_info = kernel_data
+        else:
+            kernel_name = kernel_data
+            kernel_info = None
+            
+        # Row texts are normally prepared by the fetching thread
+        texts = kernel_info.get('row_texts') if kernel_info else None
+        if texts is None:
+            texts = kernel_row_texts(kernel_name, kernel_info, source_type)
+        display_name, desc_text, version_text = texts
+        
+        # Repository kernels are always available for download
+        row = Gtk.ListBoxRow()
+        main_box = self._build_row_grid("package-x-generic", display_name, desc_text, version_text,
+                                        [(_('AVAILABLE'), 'available-kernel-badge')])
+        
+        row.add(main_box)
+        row.kernel_version = kernel_name
+        row.kernel_info = kernel_info
+        return row
+
     def _show_package_cache_outdated_dialog(self):
         """Show dialog when package cache appears to be outdated"""
         dialog = Gtk.MessageDialog(
@@ -1280,50 +1786,27 @@ class KernelPackWindow(Gtk.ApplicationWindow):
     def _update_package_lists_with_progress(self):
         """Update package lists with progress indication"""
         # Show loading message
-        for child in self.kernel_list.get_children():
-            self.kernel_list.remove(child)
-        
-        loading_row = Gtk.ListBoxRow()
-        loading_row.set_sensitive(False)
-        
-        main_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        main_box.set_halign(Gtk.Align.CENTER)
-        
-        spinner = Gtk.Spinner()
-        spinner.start()
-        main_box.pack_start(spinner, False, False, 0)
-        
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        
-        title_label = Gtk.Label()
-        title_label.set_markup(f'<b>{_("Updating package lists...")}</b>')
-        title_label.set_halign(Gtk.Align.START)
-        info_box.pack_start(title_label, False, False, 0)
+        self._clear_kernel_list()
         
-        main_box.pack_start(info_box, True, True, 0)
-        loading_row.add(main_box)
-        self.kernel_list.add(loading_row)
-        self.kernel_list.show_all()
+        self._show_list_loading(_("Updating package lists..."))
         
-        # Run update in background thread
-        def update_thread():
-            success, message = update_package_lists_gui()
-            GLib.idle_add(self._on_package_lists_updated, success, message)
-        
-        threading.Thread(target=update_thread, daemon=True).start()
+        future = self._pool.submit(update_package_lists_gui)
+        future.add_done_callback(lambda f: self._post_to_ui(self._on_package_lists_updated, f))
 
-    def _on_package_lists_updated(self, success, message):
+    def _on_package_lists_updated(self, future):
         """Handle package lists update completion"""
+        try:
+            success, message = future.result()
+        except Exception as e:
+            success, message = False, str(e)
+        
         if success:
             # Refresh repository kernels list
             self._show_kernel_loading()
-            thread = threading.Thread(target=self._fetch_repository_kernels_threaded)
-            thread.daemon = True
-            thread.start()
+            self._pool.submit(self._fetch_repository_kernels_threaded)
         else:
             # Show error and empty list
-            for child in self.kernel_list.get_children():
-                self.kernel_list.remove(child)
+            self._clear_kernel_list()
             
             error_dialog = Gtk.MessageDialog(
                 transient_for=self,
@@ -1333,13 +1816,15 @@ class KernelPackWindow(Gtk.ApplicationWindow):
                 text=_("Failed to update package lists")
             )
             error_dialog.format_secondary_text(message)
-            error_dialog.run()
-            error_dialog.destroy()
+            error_dialog.connect('response', lambda dialog, response_id: dialog.destroy())
+            error_dialog.show()
             
             self._show_no_kernels_found()
 
     def _show_no_kernels_found(self):
         """Show message when no kernels are found"""
+        self._clear_kernel_list()
+        
         no_kernels_row = Gtk.ListBoxRow()
         no_kernels_row.set_sensitive(False)
         
@@ -1369,6 +1854,8 @@ class KernelPackWindow(Gtk.ApplicationWindow):
 
     def _show_kernel_fetch_error(self, error_msg):
         """Show error when kernel fetching fails"""
+        self._clear_kernel_list()
+        
         error_row = Gtk.ListBoxRow()
         error_row.set_sensitive(False)
         
@@ -1410,9 +1897,7 @@ class KernelPackWindow(Gtk.ApplicationWindow):
             self.selected_kernel = None
             self.selected_deb_files = []
             self._show_kernel_loading()
-            thread = threading.Thread(target=self._fetch_repository_kernels_threaded)
-            thread.daemon = True
-            thread.start()
+            self._pool.submit(self._fetch_repository_kernels_threaded)
         elif self.local_radio.get_active():
             # Show manual selection, hide repository kernel list
             self.manual_selection_box.show()
@@ -1436,7 +1921,7 @@ class KernelPackWindow(Gtk.ApplicationWindow):
 
     def _on_sqfs_compression_changed(self, combo):
         """Handle SquashFS compression change"""
-        self.sqfs_compression = combo.get_active_text()
+        self.sqfs_compression = combo.get_active_id()
 
 
     def _on_build_clicked(self, button):
@@ -1485,41 +1970,45 @@ class KernelPackWindow(Gtk.ApplicationWindow):
             
             # The kernel version is not known before packaging, so we pass a placeholder
             # The CLI tool will determine the actual version
-            cmd_args.extend([
-                '-o', self.temp_output_dir,
-                '--sqfs-comp', self.sqfs_compression
-            ])
+            cmd_args.extend(['-o', self.temp_output_dir] + sqfs_cli_args(self.sqfs_compression))
 
             # Build pkexec command
-            cmd = ['pkexec', 'minios-kernel'] + cmd_args
+            cmd = privileged_command(['minios-kernel'] + cmd_args)
 
             # Log the command being executed
             self._log_message(_("Executing command: {}").format(" ".join(cmd)))
             
-            # Set environment for unbuffered output
+            # Set environment for unbuffered output; the CLI also flushes
+            # every message itself, which is what counts under pkexec
             env = os.environ.copy()
             env['PYTHONUNBUFFERED'] = '1'
             env['PYTHONIOENCODING'] = 'utf-8'
             
-            # Use stdbuf to disable all buffering, then run our CLI command
-            stdbuf_cmd = ['stdbuf', '-oL', '-eL'] + cmd  # Line buffered for stdout/stderr
-            
             self.process = subprocess.Popen(
-                stdbuf_cmd,
+                cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1,  # Line buffered
                 env=env
             )
             self.active_pid = self.process.pid
-            self._partial_line = ''
+            # Output bytes after the last complete line
+            self._cli_buffer = bytearray()
             
-            # Set up a timer to read output periodically
-            GLib.timeout_add(10, self._read_cli_output)  # Check every 10ms for responsiveness
+            # Output is read whenever the pipe becomes readable
+            fd = self.process.stdout.fileno()
+            os.set_blocking(fd, False)
+            self._cli_watch_id = GLib.io_add_watch(
+                fd, GLib.PRIORITY_DEFAULT, GLib.IO_IN | GLib.IO_HUP | GLib.IO_ERR, self._on_cli_output)
             
-            # Watch for process exit using polling
-            GLib.timeout_add(500, self._check_process_exit)  # Check every 500ms
+            # A pidfd becomes readable when the CLI exits (Linux 5.3+,
+            # Python 3.9+); otherwise poll for the exit
+            try:
+                pidfd = os.pidfd_open(self.process.pid)
+            except (AttributeError, OSError):
+                GLib.timeout_add(1000, self._check_process_exit, self.process)
+            else:
+                GLib.io_add_watch(pidfd, GLib.PRIORITY_DEFAULT, GLib.IO_IN,
+                                  self._on_cli_pidfd_ready, self.process)
 
         except Exception as e:
             # Log detailed error information
@@ -1531,102 +2020,71 @@ class KernelPackWindow(Gtk.ApplicationWindow):
             self._show_error(_("Failed to start packaging process. Please check the log for detailed error information.") + f"\n\nError: {str(e)}")
             self._build_finished()
 
-    def _on_cli_output(self, source, condition):
-        """Callback to handle CLI output in real-time."""
-        if condition == GLib.IO_IN:
-            # Read all available data, not just one line
+    def _on_cli_output(self, fd, condition):
+        """Handle all CLI output available on the pipe"""
+        while True:
             try:
-                data = source.read(1024)  # Read up to 1KB at a time
-                if data:
-                    # Split into lines and process each
-                    lines = data.split('\n')
-                    
-                    # Handle partial line from previous read
-                    if hasattr(self, '_partial_line'):
-                        lines[0] = self._partial_line + lines[0]
-                    
-                    # Save incomplete last line
-                    if not data.endswith('\n'):
-                        self._partial_line = lines.pop()
-                    else:
-                        self._partial_line = ''
-                    
-                    # Process complete lines
-                    for line in lines:
-                        line_text = line.strip()
-                        if line_text:  # Skip empty lines
-                            # Try to update progress based on JSON output
-                            is_json_processed = self._update_progress_from_cli_output(line_text)
-                            
-                            # Only log non-JSON messages to keep log readable
-                            if not is_json_processed:
-                                # Remove log prefixes (I:, E:, W:) for cleaner output
-                                clean_message = line_text
-                                for prefix in ['I: ', 'E: ', 'W: ']:
-                                    if clean_message.startswith(prefix):
-                                        clean_message = clean_message[len(prefix):]
-                                        break
-                                self._log_message(clean_message)
-                    
-                    return True
-            except Exception as e:
+                chunk = os.read(fd, self.CLI_READ_SIZE)
+            except BlockingIOError:
+                return True  # Drained; wait for more output
+            except OSError as e:
                 print(f"Error reading CLI output: {e}", flush=True)
-        return False
-
-    def _read_cli_output(self):
-        """Read CLI output in real-time using subprocess"""
-        if not hasattr(self, 'process') or self.process is None:
-            return False
+                chunk = b''
+            
+            buffer = self._cli_buffer
+            if not chunk:
+                # End of output; handle a final line without newline
+                self._handle_cli_line(buffer.decode('utf-8', 'replace'))
+                buffer.clear()
+                self._cli_watch_id = None
+                return False
+            
+            # Decode only complete lines, so no character is cut in half
+            buffer += chunk
+            end = buffer.rfind(b'\n') + 1
+            if end:
+                lines = buffer[:end].decode('utf-8', 'replace').split('\n')
+                del buffer[:end]
+                for line in lines:
+                    self._handle_cli_line(line)
+
+    def _stop_cli_output(self):
+        """Handle remaining CLI output and remove the pipe watch"""
+        watch_id = self._cli_watch_id
+        if watch_id is not None:
+            self._on_cli_output(self.process.stdout.fileno(), GLib.IO_HUP)
+            GLib.source_remove(watch_id)
+            self._cli_watch_id = None
+
+    def _handle_cli_line(self, line):
+        """Update progress or log from one line of CLI output"""
+        line_text = line.strip()
+        if not line_text:
+            return
         
-        try:
-            # Try to read a line without blocking using poll
-            import os
-            import fcntl
-            
-            # Set stdout to non-blocking
-            fd = self.process.stdout.fileno()
-            fl = fcntl.fcntl(fd, fcntl.F_GETFL)
-            fcntl.fcntl(fd, fcntl.F_SETFL, fl | os.O_NONBLOCK)
-            
-            try:
-                line = self.process.stdout.readline()
-                if line:
-                    line_text = line.strip()
-                    if line_text:
-                        # Update progress based on CLI output (JSON format)
-                        self._update_progress_from_cli_output(line_text)
-                        
-                        # Only log non-JSON messages to keep log readable
-                        if not (line_text.strip().startswith('{') and line_text.strip().endswith('}')):
-                            # Remove log prefixes (I:, E:, W:) for cleaner output
-                            clean_message = line_text
-                            for prefix in ['I: ', 'E: ', 'W: ']:
-                                if clean_message.startswith(prefix):
-                                    clean_message = clean_message[len(prefix):]
-                                    break
-                            self._log_message(clean_message)
-                        
-                        # Force GUI update
-                        while Gtk.events_pending():
-                            Gtk.main_iteration()
-                        
-                        return True
-            except IOError:
-                # No data available, that's okay
-                pass
-            
-            return True  # Continue timer
-            
-        except Exception as e:
-            print(f"Error reading CLI output: {e}", flush=True)
-            return True  # Continue trying
+        # JSON lines update the progress; only other messages are logged
+        # to keep the log readable
+        if line_text[0] == '{' and line_text[-1] == '}':
+            self._update_progress_from_cli_output(line_text)
+        else:
+            # Remove log prefixes (I:, E:, W:) for cleaner output
+            self._log_message(_LOG_PREFIX_RE.sub('', line_text, count=1))
     
-    def _check_process_exit(self):
+    def _on_cli_pidfd_ready(self, pidfd, condition, process):
+        """Reap the CLI process once its pidfd reports the exit"""
+        os.close(pidfd)
+        status = process.wait()
+        # Only the current build may finish the view
+        if process is self.process:
+            self._on_cli_exit(self.active_pid, status)
+        return False
+
+    def _check_process_exit(self, process):
         """Check if process has exited"""
-        if not hasattr(self, 'process') or self.process is None:
+        if process is not self.process:
             return False
         
-        poll = self.process.poll()
+        poll = process.poll()
         if poll is not None:
             # Process has exited
             self._on_cli_exit(self.active_pid, poll)
@@ -1635,39 +2093,42 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         return True  # Continue timer
 
     def _update_progress_from_cli_output(self, line_text):
-        """Update progress bar based on CLI output. Returns True if line was processed as JSON."""
-        # Try to parse JSON progress output first
-        if line_text.strip().startswith('{') and line_text.strip().endswith('}'):
-            try:
-                data = json.loads(line_text)
-                if data.get('type') == 'progress':
-                    percent = data.get('percent', 0)
-                    message = data.get('message', '')
-                    progress = percent / 100.0
-                    
-                    # Translate the message 
-                    if message:
-                        translated_message = _(message)
-                        self._update_progress(progress, translated_message)
-                    else:
-                        self._update_progress(progress, "")
-                    return True
-                elif data.get('type') == 'success':
-                    self._update_progress(1.0, _("Kernel packaging completed successfully!"))
-                    return True
-                elif data.get('type') == 'error':
-                    error_msg = data.get('error', 'Unknown error')
-                    self._log_message(f"E: {error_msg}")
-                    return True
-            except (json.JSONDecodeError, KeyError):
-                # Not JSON or invalid JSON, continue with legacy parsing
-                pass
+        """Update progress bar from a stripped JSON line of CLI output. Returns True if it was handled."""
+        try:
+            data = json_loads(line_text)
+        except json.JSONDecodeError:
+            # Not JSON after all
+            return False
+        
+        if data.get('type') == 'progress':
+            percent = data.get('percent', 0)
+            message = data.get('message', '')
+            progress = percent / 100.0
+            
+            # Translate the message 
+            if message:
+                translated_message = _(message)
+                self._update_progress(progress, translated_message)
+            else:
+                self._update_progress(progress, "")
+            return True
+        elif data.get('type') == 'success':
+            self._update_progress(1.0, _("Kernel packaging completed successfully!"))
+            return True
+        elif data.get('type') == 'error':
+            error_msg = data.get('error', 'Unknown error')
+            self._log_message(f"E: {error_msg}")
+            return True
         
         return False
 
     def _on_cli_exit(self, pid, status):
         """Callback for when the CLI process finishes."""
-        if hasattr(self, 'process') and self.process:
+        self._stop_cli_output()
+        if self._cancel_kill_id is not None:
+            GLib.source_remove(self._cancel_kill_id)
+            self._cancel_kill_id = None
+        if self.process is not None:
             # Using subprocess.Popen
             self.process = None
         else:
@@ -1675,7 +2136,10 @@ class KernelPackWindow(Gtk.ApplicationWindow):
             GLib.spawn_close_pid(pid)
         self.active_pid = None
 
-        if os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
+        if self.cancel_requested:
+            # Cancelled by the user; nothing to install or report
+            pass
+        elif os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0:
             
             # Pre-define translatable messages
             MSG_CLI_SUCCESS = _("CLI tool finished successfully, installing to repository...")
@@ -1689,8 +2153,9 @@ class KernelPackWindow(Gtk.ApplicationWindow):
                 self._update_progress(0.98, MSG_INSTALLING_TO_REPO)
                 # When using CLI, files should already be in the right place
                 # Just verify they exist and refresh the kernel list
-                packaged_files = os.listdir(self.temp_output_dir)
-                vmlinuz_file = next((f for f in packaged_files if f.startswith('vmlinuz-')), None)
+                with os.scandir(self.temp_output_dir) as entries:
+                    vmlinuz_file = next((entry.name for entry in entries
+                                         if entry.name.startswith('vmlinuz-')), None)
                 if not vmlinuz_file:
                     raise Exception("Could not find vmlinuz file in package output")
                 
@@ -1698,7 +2163,8 @@ class KernelPackWindow(Gtk.ApplicationWindow):
                 self._log_message(f"Kernel {kernel_version} packaged successfully to {self.temp_output_dir}")
                 
                 self._update_progress(1.0, MSG_COMPLETED)
-                GLib.idle_add(self._populate_packaged_kernels)
+                invalidate_kernels_cache()
+                GLib.idle_add(self._refresh_packaged_kernels)
                 GLib.idle_add(self._show_completion_message)
             except Exception as e:
                 GLib.idle_add(self._show_error, f"Failed to process package output: {str(e)}")
@@ -1731,6 +2197,8 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         # Progress bar
         self.progress_bar = Gtk.ProgressBar()
         self.progress_bar.set_show_text(True)
+        self.progress_bar.set_text("")
+        self._last_progress_text = None
         self.main_vbox.pack_start(self.progress_bar, False, False, 0)
 
         # Log output
@@ -1768,6 +2236,7 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
         button_box.set_halign(Gtk.Align.END)
         self.main_vbox.pack_start(button_box, False, False, 0)
+        self._bottom_button_box = button_box
 
         self.cancel_button = Gtk.Button.new_with_label(_("Cancel"))
         self.cancel_button.connect("clicked", self._on_cancel_clicked)
@@ -1783,15 +2252,15 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         """Save current UI state before build"""
         self.saved_state = {
             'selected_kernel': self.selected_kernel,
-            'selected_deb_files': list(getattr(self, 'selected_deb_files', [])),
+            'selected_deb_files': list(self.selected_deb_files),
             'kernel_source': self.kernel_source,
             'sqfs_compression': self.sqfs_compression,
-            'selected_file_path': getattr(self, 'selected_file_path', None)
+            'selected_file_path': self.selected_file_path
         }
 
     def _restore_ui_state(self):
         """Restore UI state after build completion/cancellation"""
-        if hasattr(self, 'saved_state') and self.saved_state:
+        if self.saved_state:
             # Restore data
             self.selected_kernel = self.saved_state['selected_kernel']
             self.selected_deb_files = self.saved_state.get('selected_deb_files', [])
@@ -1801,21 +2270,19 @@ class KernelPackWindow(Gtk.ApplicationWindow):
                 self.selected_file_path = self.saved_state['selected_file_path']
             
             # Restore UI elements
-            if hasattr(self, 'sqfs_combo'):
-                compressions = get_available_compressions()
-                if self.sqfs_compression in compressions:
-                    self.sqfs_combo.set_active(compressions.index(self.sqfs_compression))
+            if self.sqfs_combo is not None:
+                self.sqfs_combo.set_active_id(self.sqfs_compression)
                     
                     
             # Restore radio buttons
-            if hasattr(self, 'local_radio') and hasattr(self, 'repo_radio'):
+            if self.local_radio is not None and self.repo_radio is not None:
                 if self.kernel_source == 'manual':
                     self.local_radio.set_active(True)
                 else:
                     self.repo_radio.set_active(True)
                     
             # Restore selected file label
-            if hasattr(self, 'selected_file_label'):
+            if self.selected_file_label is not None:
                 if self.selected_deb_files:
                     if len(self.selected_deb_files) == 1:
                         self.selected_file_label.set_text(os.path.basename(self.selected_deb_files[0]))
@@ -1826,12 +2293,10 @@ class KernelPackWindow(Gtk.ApplicationWindow):
                     self.selected_file_label.set_text(filename)
 
     def _show_back_button(self):
-        """Replace cancel button with back button after cancellation"""
-        # Find and remove the current button box
-        for child in self.main_vbox.get_children():
-            if isinstance(child, Gtk.Box) and any(isinstance(grandchild, Gtk.Button) for grandchild in child.get_children()):
-                self.main_vbox.remove(child)
-                break
+        """Replace the progress view's cancel button with a back button"""
+        if self._bottom_button_box is None:
+            return
+        self.main_vbox.remove(self._bottom_button_box)
         
         # Create new button box with Back button
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
@@ -1843,6 +2308,7 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         button_box.pack_start(back_button, False, False, 0)
         
         self.main_vbox.pack_start(button_box, False, False, 0)
+        self._bottom_button_box = button_box
         self.show_all()
         
         # Ensure overlays remain hidden after show_all()
@@ -1856,62 +2322,51 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         self._show_cancel_overlay()
         
         # Disable the cancel button to prevent multiple clicks
-        if hasattr(self, 'cancel_button') and self.cancel_button is not None:
+        if self.cancel_button is not None:
             self.cancel_button.set_sensitive(False)
         
         self.cancel_requested = True
-        self.is_building = False
         self._log_message(_("Cancelling packaging..."))
         
-        # Use GLib.timeout_add to handle process termination without freezing UI
-        def handle_cancellation():
-            if self.active_pid:
-                # First try graceful termination (SIGTERM)
-                try:
-                    os.kill(self.active_pid, 15)  # SIGTERM
-                    # Wait a bit for graceful shutdown
-                    time.sleep(2)
-                    # If still running, force kill
-                    try:
-                        os.kill(self.active_pid, 0)  # Check if process still exists
-                        os.kill(self.active_pid, 9)  # SIGKILL if still alive
-                    except ProcessLookupError:
-                        # Process already terminated gracefully
-                        pass
-                except ProcessLookupError:
-                    # Process already dead
-                    pass
-            
-            # CLI handles all cleanup when it receives termination signal
-            
-            # Hide cancellation overlay first, then proceed with finishing
-            self._hide_cancel_overlay()
-            
-            # Force GUI update to ensure overlay is hidden before showing result
-            while Gtk.events_pending():
-                Gtk.main_iteration()
-            
-            # Complete the build process
+        # Ask the CLI to stop; _on_cli_exit() finishes once it has exited.
+        # The CLI handles all cleanup when it receives the signal.
+        pid = self.active_pid
+        if not pid:
             self._build_finished()
-            
-            return False  # Don't repeat this timeout
-        
-        # Run cancellation in a brief timeout to allow UI to update
-        GLib.timeout_add(100, handle_cancellation)
+            return
+        try:
+            os.kill(pid, 15)  # SIGTERM
+        except ProcessLookupError:
+            # Process already dead; its exit is being reported
+            return
+        except OSError as e:
+            # A CLI started through pkexec runs as root and cannot be
+            # signalled; the build keeps running and is reported as usual
+            self._log_message(_("Could not stop the packaging process: {}").format(e))
+            self.cancel_requested = False
+            self._hide_cancel_overlay()
+            return
+        self._cancel_kill_id = GLib.timeout_add(2000, self._kill_cli, pid)
+
+    def _kill_cli(self, pid):
+        """Force kill a CLI process that ignored SIGTERM"""
+        self._cancel_kill_id = None
+        if pid == self.active_pid:
+            try:
+                os.kill(pid, 9)  # SIGKILL
+            except OSError:
+                pass
+        return False
 
     def _show_cancel_overlay(self):
         """Show cancellation overlay with spinner"""
-        if hasattr(self, 'cancel_loading_box'):
+        if self.cancel_loading_box is not None:
             self.cancel_loading_box.set_visible(True)
             self.cancel_loading_spinner.start()
-            
-            # Force GUI update
-            while Gtk.events_pending():
-                Gtk.main_iteration()
 
     def _hide_cancel_overlay(self):
         """Hide cancellation overlay"""
-        if hasattr(self, 'cancel_loading_box'):
+        if self.cancel_loading_box is not None:
             self.cancel_loading_box.set_visible(False)
             self.cancel_loading_spinner.stop()
 
@@ -1922,34 +2377,18 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         # Ensure cancel overlay is hidden
         self._hide_cancel_overlay()
         
-        if self.cancel_requested:
-            # Don't hide the log on cancel, just change the buttons
-            self._show_back_button()
-            return
-            
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        button_box.set_halign(Gtk.Align.END)
-        
-        back_button = Gtk.Button.new_with_label(_("Back to Selection"))
-        back_button.connect("clicked", lambda _: self._build_selection_ui())
-        back_button.get_style_context().add_class('suggested-action')
-        button_box.pack_start(back_button, False, False, 0)
-        
-        for child in self.main_vbox.get_children():
-            if isinstance(child, Gtk.Box):
-                for btn_child in child.get_children():
-                    if isinstance(btn_child, Gtk.Button) and btn_child.get_label() == _("Cancel"):
-                        self.main_vbox.remove(child)
-                        self.main_vbox.pack_start(button_box, False, False, 0)
-                        self.show_all()
-                        # Ensure overlays remain hidden after show_all()
-                        self._initialize_loading_overlays()
-                        return
+        # The log stays visible; only the buttons change
+        self._show_back_button()
 
     def _update_progress(self, fraction, text):
         """Update progress bar and status"""
-        self.progress_bar.set_fraction(fraction)
-        self.progress_bar.set_text("")
+        # Repeated updates are skipped; a change below half a percent is
+        # not visible but would still redraw the bar
+        if fraction >= 1.0 or abs(fraction - self.progress_bar.get_fraction()) >= 0.005:
+            self.progress_bar.set_fraction(fraction)
+        if text == self._last_progress_text:
+            return
+        self._last_progress_text = text
         self.status_label.set_text(text)
         # Only log progress text if it's meaningful and not empty
         if text and text.strip():
@@ -1957,16 +2396,29 @@ class KernelPackWindow(Gtk.ApplicationWindow):
 
     def _log_message(self, message):
         """Add message to log"""
-        timestamp = time.strftime("%H:%M:%S")
-        full_message = f"[{timestamp}] {message}\n"
-        
-        end_iter = self.log_buffer.get_end_iter()
-        self.log_buffer.insert(end_iter, full_message)
-        
-        # Scroll to end safely
-        if hasattr(self, 'log_textview') and self.log_textview.get_buffer() == self.log_buffer:
-            end_iter = self.log_buffer.get_end_iter()
-            self.log_textview.scroll_to_iter(end_iter, 0.0, False, 0.0, 0.0)
+        # The timestamp string is formatted once per second
+        now = int(time.time())
+        if now != self._log_stamp_time:
+            self._log_stamp_time = now
+            self._log_stamp = time.strftime("%H:%M:%S", time.localtime(now))
+        self._log_pending.append(f"[{self._log_stamp}] {message}\n")
+        
+        # Lines are appended to the view in one batch once the loop is idle
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            GLib.idle_add(self._flush_log, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _flush_log(self):
+        """Append the pending log lines and scroll to the end"""
+        self._log_flush_scheduled = False
+        text = ''.join(self._log_pending)
+        self._log_pending.clear()
+        
+        # Messages logged before the progress view exists are dropped
+        if self.log_buffer is not None:
+            self.log_buffer.insert(self.log_buffer.get_end_iter(), text)
+            self.log_textview.scroll_to_iter(self.log_buffer.get_end_iter(), 0.0, False, 0.0, 0.0)
+        return False
 
     def _show_error(self, message):
         """Show error dialog"""
@@ -1975,21 +2427,21 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         
         dialog = Gtk.MessageDialog(
             transient_for=self,
-            flags=0,
+            modal=True,
             message_type=Gtk.MessageType.ERROR,
             buttons=Gtk.ButtonsType.OK,
             text=_("Error")
         )
         dialog.format_secondary_text(message)
         
-        dialog.run()
-        dialog.destroy()
+        dialog.connect('response', lambda dialog, response_id: dialog.destroy())
+        dialog.show()
 
     def _show_completion_message(self):
         """Show completion message with instructions"""
         dialog = Gtk.MessageDialog(
             transient_for=self,
-            flags=0,
+            modal=True,
             message_type=Gtk.MessageType.INFO,
             buttons=Gtk.ButtonsType.OK,
             text=_("Packaging Complete")
@@ -2001,8 +2453,8 @@ class KernelPackWindow(Gtk.ApplicationWindow):
         )
         
         dialog.format_secondary_text(instructions)
-        dialog.run()
-        dialog.destroy()
+        dialog.connect('response', lambda dialog, response_id: dialog.destroy())
+        dialog.show()
 
     def _show_activate_loading(self, show, text=None):
         """Show or hide kernel activation loading indicator"""
@@ -2024,12 +2476,12 @@ class KernelPackWindow(Gtk.ApplicationWindow):
     def _initialize_loading_overlays(self):
         """Initialize loading overlays visibility after show_all()"""
         # Hide activation loading overlay (this must be called after show_all)
-        if hasattr(self, 'activate_loading_box'):
+        if self.activate_loading_box is not None:
             self.activate_loading_box.set_visible(False)
             self.activate_loading_spinner.stop()
             
         # Hide cancellation loading overlay (only exists in progress UI)
-        if hasattr(self, 'cancel_loading_box'):
+        if self.cancel_loading_box is not None:
             self.cancel_loading_box.set_visible(False)
             self.cancel_loading_spinner.stop()
     
@@ -2062,7 +2514,7 @@ class KernelPackWindow(Gtk.ApplicationWindow):
             # Get the row under cursor
             row = self.packaged_kernel_list.get_row_at_y(int(event.y))
             
-            if row:
+            if row and hasattr(row, 'kernel_version'):
                 # Select the row
                 self.packaged_kernel_list.select_row(row)
                 self.selected_packaged_kernel = row.kernel_version
@@ -2075,39 +2527,16 @@ class KernelPackWindow(Gtk.ApplicationWindow):
                 else:
                     return True  # Skip if menu items are not available
                 
-                # Get kernel info to check status
-                kernel_info = get_kernel_info(self.minios_path, row.kernel_version)
+                # Kernel status as shown in the row, captured when it was built
+                kernel_info = row.kernel_info
+                is_active = kernel_info['is_active']
+                is_running = kernel_info['is_running']
                 
-                if kernel_info:
-                    is_active = kernel_info.get('is_active', False)
-                    is_running = kernel_info.get('is_running', False)
-                    
-                    # Check if MiniOS directory is writable
-                    minios_writable = self.minios_writable
-                    
-                    # Disable activate if already active or directory not writable
-                    if activate_item is not None:
-                        if is_active:
-                            activate_item.set_sensitive(False)
-                        elif not minios_writable:
-                            activate_item.set_sensitive(False)
-                        else:
-                            activate_item.set_sensitive(True)
-                    
-                    # Disable delete if active or running or directory not writable
-                    if delete_item is not None:
-                        if is_active or is_running:
-                            delete_item.set_sensitive(False)
-                        elif not minios_writable:
-                            delete_item.set_sensitive(False)
-                        else:
-                            delete_item.set_sensitive(True)
-                else:
-                    # If we can't get kernel info, check writeability
-                    if activate_item is not None:
-                        activate_item.set_sensitive(self.minios_writable)
-                    if delete_item is not None:
-                        delete_item.set_sensitive(self.minios_writable)
+                # Disable activate if already active or directory not writable
+                activate_item.set_sensitive(self.minios_writable and not is_active)
+                
+                # Disable delete if active or running or directory not writable
+                delete_item.set_sensitive(self.minios_writable and not (is_active or is_running))
                 
                 # Show context menu
                 self.context_menu.popup_at_pointer(event)
@@ -2116,13 +2545,13 @@ class KernelPackWindow(Gtk.ApplicationWindow):
     
     def _on_context_activate(self, menu_item):
         """Handle activate from context menu"""
-        if hasattr(self, 'selected_packaged_kernel') and self.selected_packaged_kernel:
+        if self.selected_packaged_kernel:
             # Trigger the same action as the activate button
             self._on_activate_clicked(None)
     
     def _on_context_delete(self, menu_item):
         """Handle delete from context menu"""
-        if hasattr(self, 'selected_packaged_kernel') and self.selected_packaged_kernel:
+        if self.selected_packaged_kernel:
             # Trigger the same action as the delete button
             self._on_delete_clicked(None)
 
@@ -2151,10 +2580,23 @@ def main():
         """Handle SIGINT (Ctrl+C) gracefully"""
         sys.exit(0)
     
-    signal.signal(signal.SIGINT, signal_handler)
-    
     try:
         app = MiniOSKernelManager()
+        
+        def on_sigint():
+            """Close the windows on SIGINT (Ctrl+C) so their cleanup runs"""
+            for window in app.get_windows():
+                window.destroy()
+            app.quit()
+            return GLib.SOURCE_REMOVE
+        
+        # GLib delivers the signal through the main loop, so it is handled
+        # right away instead of at the next Python callback
+        if hasattr(GLib, 'unix_signal_add'):
+            GLib.unix_signal_add(GLib.PRIORITY_HIGH, signal.SIGINT, on_sigint)
+        else:
+            signal.signal(signal.SIGINT, signal_handler)
+        
         exit_status = app.run(sys.argv)
         sys.exit(exit_status)
     except KeyboardInterrupt:
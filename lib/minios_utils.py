@@ -6,23 +6,32 @@ Handles MiniOS directory detection, permission checks, and file operations
 """
 
 import os
+import errno
 import shutil
+import functools
 import subprocess
 import glob
+import time
 import tempfile
 import gettext
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Tuple
 
 try:
     from .bootloader_utils import update_bootloader_configs as _update_bootloader_configs_impl
+    from .kernel_utils import _format_size
 except ImportError:
     from bootloader_utils import update_bootloader_configs as _update_bootloader_configs_impl
+    from kernel_utils import _format_size
 
 # Initialize gettext
 gettext.bindtextdomain('minios-kernel-manager', '/usr/share/locale')
 gettext.textdomain('minios-kernel-manager')
 _ = gettext.gettext
 
+# Filesystems MiniOS media can be formatted with
+_MINIOS_MEDIA_FS_TYPES = frozenset(('vfat', 'ext4', 'ext2', 'btrfs', 'ntfs', 'ntfs3', 'exfat'))
+
 def find_minios_directory() -> Optional[str]:
     """Find MiniOS directory on the system"""
     common_paths = [
@@ -30,57 +39,45 @@ def find_minios_directory() -> Optional[str]:
         "/lib/live/mount/medium/minios"
     ]
 
-    # Check each path
-    for path_pattern in common_paths:
-        if '*' in path_pattern:
-            # Handle wildcard paths
-            for path in glob.glob(path_pattern):
-                if _is_valid_minios_directory(path):
-                    return path
-        else:
-            # Direct path check
-            if _is_valid_minios_directory(path_pattern):
-                return path_pattern
+    for path in common_paths:
+        if _is_valid_minios_directory(path):
+            return path
 
     # Try to find mounted filesystems with minios folder
-    try:
-        result = subprocess.run(['findmnt', '-t', 'vfat,ext4,ext2,btrfs,ntfs,ntfs3,exfat'],
-                              stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-        for line in result.stdout.split('\n')[1:]:  # Skip header
-            if line.strip():
-                parts = line.split()
-                if len(parts) >= 2:
-                    mount_point = parts[1]
-                    minios_path = os.path.join(mount_point, 'minios')
-                    if _is_valid_minios_directory(minios_path):
-                        return minios_path
-    except Exception:
-        pass
+    for mount_point, fs_type in _read_mounts():
+        if fs_type in _MINIOS_MEDIA_FS_TYPES:
+            minios_path = os.path.join(mount_point, 'minios')
+            if _is_valid_minios_directory(minios_path):
+                return minios_path
 
     return None
 
 def _is_valid_minios_directory(path: str) -> bool:
     """Check if directory looks like a valid MiniOS directory"""
-    if not os.path.exists(path):
+    try:
+        st = os.stat(path)
+    except OSError:
         return False
-
-    # Check for typical MiniOS structure
-    expected_items = ['boot', '01-kernel*', '02-firmware*']
-    found_items = 0
-
+    # Any change to the directory bumps its mtime and invalidates the entry
+    return _validate_minios_directory((path, st.st_mtime_ns, st.st_ino))
+
+@functools.lru_cache(maxsize=128)
+def _validate_minios_directory(path_key: Tuple[str, int, int]) -> bool:
+    """Scan a MiniOS directory candidate keyed by (path, mtime_ns, inode)"""
+    path = path_key[0]
+    # Check for typical MiniOS structure: boot, 01-kernel*, 02-firmware*
     try:
-        items = os.listdir(path)
-        for item in items:
-            if item == 'boot':
-                found_items += 1
-            elif item.startswith('01-kernel'):
-                found_items += 1
-            elif item.startswith('02-firmware'):
-                found_items += 1
-    except PermissionError:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name == 'boot' or name.startswith('01-kernel')
+                        or name.startswith('02-firmware')):
+                    return True
+    except OSError:
+        # Missing path, not a directory or no permission
         return False
 
-    return found_items >= 1  # At least one expected item
+    return False
 
 def get_kernel_repository_path(minios_path: str) -> str:
     """Get the path to the kernel repository."""
@@ -90,6 +87,45 @@ def get_kernel_path(minios_path: str, kernel_version: str) -> str:
     """Get the path to a specific kernel version in the repository."""
     return os.path.join(get_kernel_repository_path(minios_path), kernel_version)
 
+def _copy_file(src: str, dst: str) -> None:
+    """Copy a file with its metadata, letting the kernel move the data.
+
+    copy_file_range() avoids bouncing the data through userspace and can
+    reflink on btrfs/XFS; shutil.copy2() is used where it is unavailable.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            src_fd = os.open(src, os.O_RDONLY | os.O_CLOEXEC)
+            try:
+                dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o644)
+                try:
+                    src_st = os.fstat(src_fd)
+                    if os.path.samestat(src_st, os.fstat(dst_fd)):
+                        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+                    os.ftruncate(dst_fd, 0)
+                    remaining = src_st.st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+            shutil.copystat(src, dst)
+            return
+        except OSError as e:
+            # Cross-device on older kernels or unsupported by the filesystem
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                raise
+    shutil.copy2(src, dst)
+
+def _copy_files(pairs: List[Tuple[str, str]]) -> None:
+    """Copy (src, dst) pairs concurrently; re-raises the first failure."""
+    with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+        list(executor.map(lambda pair: _copy_file(*pair), pairs))
+
 def package_kernel_to_repository(minios_path: str, kernel_version: str,
                                  squashfs_file: str, vmlinuz_file: str, initramfs_file: str) -> bool:
     """Packages a kernel and places it in the inactive kernel repository."""
@@ -99,9 +135,8 @@ def package_kernel_to_repository(minios_path: str, kernel_version: str,
     try:
         os.makedirs(kernel_version_path, exist_ok=True)
 
-        shutil.copy2(squashfs_file, os.path.join(kernel_version_path, os.path.basename(squashfs_file)))
-        shutil.copy2(vmlinuz_file, os.path.join(kernel_version_path, os.path.basename(vmlinuz_file)))
-        shutil.copy2(initramfs_file, os.path.join(kernel_version_path, os.path.basename(initramfs_file)))
+        _copy_files([(f, os.path.join(kernel_version_path, os.path.basename(f)))
+                     for f in (squashfs_file, vmlinuz_file, initramfs_file)])
 
         return True
     except Exception as e:
@@ -116,14 +151,14 @@ def get_active_kernel(minios_path: str) -> Optional[str]:
     # First try to get active kernel from boot marker
     marker_file = os.path.join(minios_path, "boot", "active-kernel")
 
-    if os.path.exists(marker_file):
-        try:
-            with open(marker_file, 'r') as f:
-                kernel_version = f.read().strip()
-                if kernel_version:
-                    return kernel_version
-        except Exception as e:
-            print(f"Warning: Error reading active kernel marker {marker_file}: {e}")
+    try:
+        st = os.stat(marker_file)
+    except OSError:
+        st = None
+    if st is not None:
+        kernel_version = _read_active_kernel_marker((marker_file, st.st_mtime_ns, st.st_size))
+        if kernel_version:
+            return kernel_version
 
     # Fallback: check for vmlinuz files in boot directory
     boot_path = os.path.join(minios_path, "boot")
@@ -140,71 +175,93 @@ def get_active_kernel(minios_path: str) -> Optional[str]:
     except IndexError:
         return None
 
+def _scan_names(path: str) -> dict:
+    """Map entry names of a directory to their paths; empty if unreadable."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.path for entry in entries}
+    except OSError:
+        return {}
+
+@functools.lru_cache(maxsize=8)
+def _read_active_kernel_marker(marker_key: Tuple[str, int, int]) -> Optional[str]:
+    """Read an active-kernel marker keyed by (path, mtime_ns, size)"""
+    marker_file = marker_key[0]
+    try:
+        # The marker holds one version string; read it raw in a single call
+        with open(marker_file, 'rb') as f:
+            return f.read(256).strip().decode() or None
+    except Exception as e:
+        print(f"Warning: Error reading active kernel marker {marker_file}: {e}")
+        return None
+
 def get_active_kernel_files(minios_path: str, kernel_version: str = None) -> List[str]:
     """Gets list of active kernel files (vmlinuz, initramfs, squashfs)."""
-    files = []
+    boot_entries = _scan_names(os.path.join(minios_path, "boot"))
+    root_entries = _scan_names(minios_path)
 
     if kernel_version:
         # Get files for specific kernel version
-        boot_path = os.path.join(minios_path, "boot")
-        if os.path.exists(boot_path):
-            vmlinuz_file = os.path.join(boot_path, f"vmlinuz-{kernel_version}")
-            if os.path.exists(vmlinuz_file):
-                files.append(vmlinuz_file)
-
-            initramfs_file = os.path.join(boot_path, f"initrfs-{kernel_version}.img")
-            if os.path.exists(initramfs_file):
-                files.append(initramfs_file)
-
-        squashfs_file = os.path.join(minios_path, f"01-kernel-{kernel_version}.sb")
-        if os.path.exists(squashfs_file):
-            files.append(squashfs_file)
-    else:
-        # Get all active files (original behavior)
-        boot_path = os.path.join(minios_path, "boot")
-        if os.path.exists(boot_path):
-            vmlinuz_files = glob.glob(os.path.join(boot_path, "vmlinuz-*"))
-            files.extend(vmlinuz_files)
+        wanted = ((boot_entries, f"vmlinuz-{kernel_version}"),
+                  (boot_entries, f"initrfs-{kernel_version}.img"),
+                  (root_entries, f"01-kernel-{kernel_version}.sb"))
+        return [entries[name] for entries, name in wanted if name in entries]
+
+    # Get all active files (original behavior)
+    files = [path for name, path in boot_entries.items() if name.startswith("vmlinuz-")]
+    files.extend(path for name, path in boot_entries.items()
+                 if name.startswith("initrfs-") and name.endswith(".img"))
+    # Check for squashfs files in minios root
+    files.extend(path for name, path in root_entries.items()
+                 if name.startswith("01-kernel-") and name.endswith(".sb"))
+    return files
 
-            # Check for initramfs files
-            initramfs_files = glob.glob(os.path.join(boot_path, "initrfs-*.img"))
-            files.extend(initramfs_files)
+_mounts_cache = None
 
-        # Check for squashfs files in minios root
-        squashfs_files = glob.glob(os.path.join(minios_path, "01-kernel-*.sb"))
-        files.extend(squashfs_files)
+def _read_mounts(refresh: bool = False) -> List[Tuple[str, str]]:
+    """Return (mount point, fs type) pairs from /proc/mounts, longest first.
 
-    return files
-
-def _get_filesystem_type(path: str) -> str:
-    """Get filesystem type for a given path."""
-    try:
-        result = subprocess.run(['stat', '-f', '-c', '%T', path],
-                              stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
-        return result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        # Fallback method using /proc/mounts
+    The table is parsed once per process; pass refresh=True after mounting.
+    """
+    global _mounts_cache
+    if _mounts_cache is None or refresh:
+        mounts = []
         try:
             with open('/proc/mounts', 'r') as f:
                 for line in f:
                     parts = line.split()
                     if len(parts) >= 3:
-                        mount_point, fs_type = parts[1], parts[2]
-                        if path.startswith(mount_point):
-                            return fs_type
-        except Exception:
+                        # Spaces in mount points are escaped as \040
+                        mounts.append((parts[1].replace('\\040', ' '), parts[2]))
+        except OSError:
             pass
+        # Later entries shadow earlier mounts on the same point
+        mounts.reverse()
+        mounts.sort(key=lambda m: len(m[0]), reverse=True)
+        _mounts_cache = mounts
+    return _mounts_cache
+
+def _get_filesystem_type(path: str) -> str:
+    """Get filesystem type for a given path."""
+    path = os.path.realpath(path)
+    for mount_point, fs_type in _read_mounts():
+        if (path == mount_point or mount_point == '/'
+                or path.startswith(mount_point + '/')):
+            return fs_type
     return "unknown"
 
 def _update_bootloader_configs(minios_path: str, kernel_version: str) -> bool:
     """Update GRUB and Syslinux configuration files with new kernel version."""
     fs_type = _get_filesystem_type(minios_path)
     print(f"Updating bootloader configs on filesystem type: {fs_type}")
-    return _update_bootloader_configs_impl(minios_path, kernel_version)
+    return _update_bootloader_configs_impl(minios_path, kernel_version, fs_type)
 
-def deactivate_current_kernel(minios_path: str) -> bool:
-    """Moves or copies the currently active kernel files to the kernel repository."""
-    active_kernel_version = get_active_kernel(minios_path)
+def deactivate_current_kernel(minios_path: str, active_kernel: Optional[str] = None) -> bool:
+    """Moves or copies the currently active kernel files to the kernel repository.
+
+    If active_kernel is given, it is used instead of re-reading the boot marker.
+    """
+    active_kernel_version = active_kernel or get_active_kernel(minios_path)
     if not active_kernel_version:
         return True # Nothing to do
 
@@ -227,18 +284,23 @@ def deactivate_current_kernel(minios_path: str) -> bool:
         print(f"Deactivating kernel {active_kernel_version}: will {operation} {len(active_files)} file(s)")
 
         for f in active_files:
-            if os.path.exists(f):
-                dest_path = os.path.join(kernel_version_path, os.path.basename(f))
-
+            name = os.path.basename(f)
+            dest_path = os.path.join(kernel_version_path, name)
+            try:
                 if is_running:
                     # Copy files if kernel is running (keep originals)
-                    shutil.copy2(f, dest_path)
-                    print(f"Copied {os.path.basename(f)} to repository (running kernel)")
+                    _copy_file(f, dest_path)
+                    print(f"Copied {name} to repository (running kernel)")
                 else:
                     # Move files if kernel is not running
-                    shutil.move(f, dest_path)
-                    print(f"Moved {os.path.basename(f)} to repository")
-            else:
+                    try:
+                        os.rename(f, dest_path)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        shutil.move(f, dest_path)
+                    print(f"Moved {name} to repository")
+            except FileNotFoundError:
                 print(f"Warning: Expected file {f} not found")
 
         if is_running:
@@ -252,17 +314,22 @@ def deactivate_current_kernel(minios_path: str) -> bool:
         # Attempt to rollback is complex, for now we fail
         return False
 
-def activate_kernel(minios_path: str, kernel_version: str) -> bool:
-    """Activates a kernel from the repository."""
+def activate_kernel(minios_path: str, kernel_version: str, active_kernel: Optional[str] = None) -> bool:
+    """Activates a kernel from the repository.
+
+    Callers that already looked up the active kernel can pass it as
+    active_kernel to avoid reading the boot marker again.
+    """
+    current_active = active_kernel or get_active_kernel(minios_path)
+
     # Handle running kernel activation
     if is_kernel_currently_running(kernel_version):
-        current_active = get_active_kernel(minios_path)
         if current_active == kernel_version:
             print(f"Kernel {kernel_version} is already active and running.")
             return True
         else:
             # Deactivate current and use running kernel files
-            if not deactivate_current_kernel(minios_path):
+            if not deactivate_current_kernel(minios_path, current_active):
                 return False
 
             # Update bootloader configurations
@@ -277,7 +344,7 @@ def activate_kernel(minios_path: str, kernel_version: str) -> bool:
             print(f"Activated running kernel {kernel_version} (files already in place).")
             return True
 
-    if not deactivate_current_kernel(minios_path):
+    if not deactivate_current_kernel(minios_path, current_active):
         return False
 
     kernel_version_path = get_kernel_path(minios_path, kernel_version)
@@ -291,18 +358,16 @@ def activate_kernel(minios_path: str, kernel_version: str) -> bool:
         vmlinuz_file = os.path.join(kernel_version_path, f"vmlinuz-{kernel_version}")
         initramfs_file = os.path.join(kernel_version_path, f"initrfs-{kernel_version}.img")
 
-        # Verify all required files exist before copying
-        if not os.path.exists(squashfs_file):
-            raise FileNotFoundError(f"SquashFS file not found: {squashfs_file}")
-        if not os.path.exists(vmlinuz_file):
-            raise FileNotFoundError(f"Kernel file not found: {vmlinuz_file}")
-        if not os.path.exists(initramfs_file):
-            raise FileNotFoundError(f"Initramfs file not found: {initramfs_file}")
-
-        # Copy kernel files to active locations
-        shutil.copy2(squashfs_file, os.path.join(minios_path, os.path.basename(squashfs_file)))
-        shutil.copy2(vmlinuz_file, os.path.join(minios_path, "boot", os.path.basename(vmlinuz_file)))
-        shutil.copy2(initramfs_file, os.path.join(minios_path, "boot", os.path.basename(initramfs_file)))
+        # Copy kernel files to active locations; a missing file fails the copy
+        boot_path = os.path.join(minios_path, "boot")
+        try:
+            _copy_files([
+                (squashfs_file, os.path.join(minios_path, os.path.basename(squashfs_file))),
+                (vmlinuz_file, os.path.join(boot_path, os.path.basename(vmlinuz_file))),
+                (initramfs_file, os.path.join(boot_path, os.path.basename(initramfs_file))),
+            ])
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Required kernel file missing: {e.filename}") from e
 
         # Update bootloader configurations
         _update_bootloader_configs(minios_path, kernel_version)
@@ -325,8 +390,11 @@ def list_all_kernels(minios_path: str) -> List[str]:
 
     # Add packaged kernels
     kernel_repo_path = get_kernel_repository_path(minios_path)
-    if os.path.exists(kernel_repo_path):
-        kernels.update([d for d in os.listdir(kernel_repo_path) if os.path.isdir(os.path.join(kernel_repo_path, d))])
+    try:
+        with os.scandir(kernel_repo_path) as entries:
+            kernels.update(entry.name for entry in entries if entry.is_dir())
+    except FileNotFoundError:
+        pass
 
     # Add active kernel
     active_kernel = get_active_kernel(minios_path)
@@ -353,6 +421,23 @@ def delete_packaged_kernel(minios_path: str, kernel_version: str) -> bool:
         print(f"Failed to delete packaged kernel {kernel_version}: {e}")
         return False
 
+# Kernel flavors by '-'-separated version parts, checked in priority order
+_KERNEL_FLAVORS = (
+    (('rt',), "Real-time", "Low-latency kernel for real-time applications"),
+    (('cloud',), "Cloud", "Optimized for virtualized environments"),
+    (('mos', 'minios'), "MiniOS", "Custom kernel for MiniOS distribution"),
+    (('generic',), "Generic", "General purpose kernel"),
+    (('lowlatency',), "Low-latency", "Reduced latency for audio/video applications"),
+)
+
+def _kernel_squashfs_size(path: str) -> Optional[int]:
+    """Size of the first 01-kernel-*.sb bundle in a directory, if any."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith("01-kernel-") and entry.name.endswith(".sb"):
+                return entry.stat().st_size
+    return None
+
 def get_kernel_info(minios_path: str, kernel_id: str) -> dict:
     """Get detailed information about a kernel."""
     active_kernel_id = get_active_kernel(minios_path)
@@ -396,44 +481,24 @@ def get_kernel_info(minios_path: str, kernel_id: str) -> dict:
         return None
 
     # Determine kernel type and description
-    kernel_type = "Standard"
-    kernel_desc = ""
-
-    kernel_lower = kernel_id.lower()
-    if 'rt' in kernel_lower:
-        kernel_type = "Real-time"
-        kernel_desc = "Low-latency kernel for real-time applications"
-    elif 'cloud' in kernel_lower:
-        kernel_type = "Cloud"
-        kernel_desc = "Optimized for virtualized environments"
-    elif 'mos' in kernel_lower or 'minios' in kernel_lower:
-        kernel_type = "MiniOS"
-        kernel_desc = "Custom kernel for MiniOS distribution"
-    elif 'generic' in kernel_lower:
-        kernel_type = "Generic"
-        kernel_desc = "General purpose kernel"
-    elif 'lowlatency' in kernel_lower:
-        kernel_type = "Low-latency"
-        kernel_desc = "Reduced latency for audio/video applications"
-    else:
-        kernel_desc = "Linux kernel"
+    kernel_type, kernel_desc = "Standard", "Linux kernel"
+
+    # Whole parts only, so that e.g. "virtual" does not match "rt"
+    kernel_parts = set(kernel_id.lower().split('-'))
+    for markers, marker_type, marker_desc in _KERNEL_FLAVORS:
+        if not kernel_parts.isdisjoint(markers):
+            kernel_type, kernel_desc = marker_type, marker_desc
+            break
 
     # Get file sizes for additional info
     size_info = ""
     if is_active or is_packaged:
         try:
+            # Active kernel files are in different locations
             kernel_path = get_kernel_path(minios_path, kernel_id) if is_packaged else minios_path
-            if is_active and not is_packaged:
-                # Active kernel files are in different locations
-                sb_files = glob.glob(os.path.join(minios_path, "01-kernel-*.sb"))
-                if sb_files:
-                    sb_size = os.path.getsize(sb_files[0])
-                    size_info = f" • {_format_size(sb_size)}"
-            elif is_packaged:
-                sb_files = glob.glob(os.path.join(kernel_path, "01-kernel-*.sb"))
-                if sb_files:
-                    sb_size = os.path.getsize(sb_files[0])
-                    size_info = f" • {_format_size(sb_size)}"
+            sb_size = _kernel_squashfs_size(kernel_path)
+            if sb_size is not None:
+                size_info = f" • {_format_size(sb_size)}"
         except Exception:
             pass
 
@@ -454,58 +519,48 @@ def get_kernel_info(minios_path: str, kernel_id: str) -> dict:
 
     return info
 
-def _format_size(size_bytes: int) -> str:
-    """Format file size in human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
-
 def get_kernel_file_info(file_path: str) -> dict:
     """Get file information (size, date) for a kernel file"""
     file_info = {'size': 0, 'size_text': 'Unknown', 'date': 'Unknown'}
 
     try:
-        if os.path.exists(file_path):
-            stat = os.stat(file_path)
-            file_info['size'] = stat.st_size
-
-            # Format size in human readable format
-            size = stat.st_size
-            for unit in ['B', 'KB', 'MB', 'GB']:
-                if size < 1024.0:
-                    file_info['size_text'] = f"{size:.1f} {unit}"
-                    break
-                size /= 1024.0
-
-            # Format date
-            import time
-            file_info['date'] = time.strftime('%Y-%m-%d %H:%M', time.localtime(stat.st_mtime))
+        stat = os.stat(file_path)
+        file_info['size'] = stat.st_size
+        file_info['size_text'] = _format_size(stat.st_size)
+
+        # Format date
+        file_info['date'] = time.strftime('%Y-%m-%d %H:%M', time.localtime(stat.st_mtime))
     except Exception:
         pass
 
     return file_info
 
+_running_kernel = None
+
+def invalidate_running_kernel() -> None:
+    """Forget the cached running kernel so the next lookup probes again."""
+    global _running_kernel
+    _running_kernel = None
+
 def get_currently_running_kernel() -> str:
-    """Get the kernel version currently running on the system with comprehensive analysis"""
-    import re
+    """Get the kernel version currently running on the system.
+
+    The result cannot change without a reboot, so it is looked up once per
+    process; see invalidate_running_kernel().
+    """
+    global _running_kernel
+    if _running_kernel is None:
+        _running_kernel = _probe_running_kernel()
+    return _running_kernel
 
+def _probe_running_kernel() -> str:
+    """Get the kernel version currently running on the system with comprehensive analysis"""
     # Method 1: Check mounted .sb modules to see which kernel module is active
-    try:
-        result = subprocess.run(['mount'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
-        mount_output = result.stdout
-
-        # Look for mounted kernel .sb files
-        for line in mount_output.split('\n'):
-            if '01-kernel-' in line and '.sb' in line and 'squashfs' in line:
-                match = re.search(r'01-kernel-([^/\s]+\.sb)', line)
-                if match:
-                    kernel_sb = match.group(1)
-                    kernel_version = kernel_sb.replace('.sb', '')
-                    return kernel_version
-    except subprocess.CalledProcessError:
-        pass
+    for mount_point, fs_type in _read_mounts():
+        if fs_type == 'squashfs':
+            bundle = os.path.basename(mount_point)
+            if bundle.startswith('01-kernel-') and bundle.endswith('.sb'):
+                return bundle[len('01-kernel-'):-len('.sb')]
 
     # Method 2: Fallback to uname -r
     try:
@@ -521,6 +576,7 @@ def is_kernel_currently_running(kernel_version: str, minios_path: str = None) ->
     """Check if a specific kernel version is currently running"""
     return kernel_version == get_currently_running_kernel()
 
+@functools.lru_cache(maxsize=1)
 def get_system_type() -> str:
     """Get type of system (live, installed, etc.)"""
     if os.path.exists('/run/initramfs/memory'):
@@ -532,30 +588,23 @@ def get_system_type() -> str:
 
 def get_union_filesystem_type() -> str:
     """Get the type of union filesystem used by MiniOS (aufs or overlayfs)"""
-    try:
-        # Check mount output for root filesystem
-        result = subprocess.run(['mount'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-        for line in result.stdout.split('\n'):
-            if ' on / type ' in line:
-                if 'aufs' in line:
-                    return 'aufs'
-                elif 'overlay' in line:
-                    return 'overlayfs'
-
-        # Fallback: check /proc/mounts
-        with open('/proc/mounts', 'r') as f:
-            for line in f:
-                if line.startswith('aufs / aufs') or line.startswith('none / aufs'):
-                    return 'aufs'
-                elif line.startswith('overlay / overlay') or line.startswith('none / overlay'):
-                    return 'overlayfs'
-
-        # Default fallback
-        return 'overlayfs'
-
-    except (OSError, IOError, subprocess.CalledProcessError):
-        # Default to overlayfs if detection fails
-        return 'overlayfs'
+    # Check the filesystem mounted on /
+    for mount_point, fs_type in _read_mounts():
+        if mount_point == '/':
+            if fs_type == 'aufs':
+                return 'aufs'
+            elif fs_type == 'overlay':
+                return 'overlayfs'
+
+    # Default fallback
+    return 'overlayfs'
+
+# Bytes per megabyte in space checks and messages
+_MIB = 1 << 20
+
+def _available_space(path: str) -> int:
+    """Bytes available to unprivileged users on the filesystem holding path."""
+    return shutil.disk_usage(path).free
 
 def get_temp_dir_with_space_check(required_mb: int = 1024, prefix: str = "minios-kernel-", operation_type: str = "kernel_packaging", custom_temp_dir: str = None) -> str:
     """Get temporary directory with sufficient space.
@@ -574,27 +623,29 @@ def get_temp_dir_with_space_check(required_mb: int = 1024, prefix: str = "minios
     Raises:
         RuntimeError: If insufficient space is available in all locations
     """
-    REQUIRED_SPACE = int(required_mb * 1024 * 1024)  # Convert MB to bytes
+    REQUIRED_SPACE = int(required_mb * _MIB)  # Convert MB to bytes
 
     # Check custom temporary directory first if provided
     if custom_temp_dir:
-        if not os.path.exists(custom_temp_dir):
+        # A single statvfs both proves the directory exists and sizes it
+        try:
+            available_space_custom = _available_space(custom_temp_dir)
+        except FileNotFoundError:
             raise RuntimeError(_("Custom temporary directory does not exist: {}").format(custom_temp_dir))
+        except (OSError, IOError) as e:
+            raise RuntimeError(_("Cannot check space in custom temporary directory '{}': {}").format(custom_temp_dir, str(e)))
 
         if not os.access(custom_temp_dir, os.W_OK):
             raise RuntimeError(_("Custom temporary directory is not writable: {}").format(custom_temp_dir))
 
-        try:
-            statvfs_custom = os.statvfs(custom_temp_dir)
-            available_space_custom = statvfs_custom.f_bavail * statvfs_custom.f_frsize
+        if available_space_custom < REQUIRED_SPACE:
+            raise RuntimeError(_("Insufficient space in custom temporary directory '{}' for {}: {:.1f}MB available, {:.1f}MB needed").format(
+                custom_temp_dir, operation_type, available_space_custom / _MIB, REQUIRED_SPACE / _MIB))
 
-            if available_space_custom >= REQUIRED_SPACE:
-                print("I: {}".format(_('Using custom temporary directory for {operation} ({available:.1f}MB available, {needed:.1f}MB needed)')).format(
-                    operation=operation_type, available=available_space_custom / (1024*1024), needed=REQUIRED_SPACE / (1024*1024)), flush=True)
-                return tempfile.mkdtemp(dir=custom_temp_dir, prefix=prefix)
-            else:
-                raise RuntimeError(_("Insufficient space in custom temporary directory '{}' for {}: {:.1f}MB available, {:.1f}MB needed").format(
-                    custom_temp_dir, operation_type, available_space_custom / (1024*1024), REQUIRED_SPACE / (1024*1024)))
+        print("I: " + _('Using custom temporary directory for {operation} ({available:.1f}MB available, {needed:.1f}MB needed)').format(
+            operation=operation_type, available=available_space_custom / _MIB, needed=REQUIRED_SPACE / _MIB), flush=True)
+        try:
+            return tempfile.mkdtemp(dir=custom_temp_dir, prefix=prefix)
         except (OSError, IOError) as e:
             raise RuntimeError(_("Cannot check space in custom temporary directory '{}': {}").format(custom_temp_dir, str(e)))
 
@@ -603,49 +654,53 @@ def get_temp_dir_with_space_check(required_mb: int = 1024, prefix: str = "minios
 
     try:
         # Check available space in /tmp
-        statvfs = os.statvfs(default_tmp)
-        available_space = statvfs.f_bavail * statvfs.f_frsize
+        available_space = _available_space(default_tmp)
 
         if available_space >= REQUIRED_SPACE:
             # Sufficient space in /tmp
-            print("I: {}".format(_('Using /tmp for {operation} ({available:.1f}MB available, {needed:.1f}MB needed)')).format(
-                operation=operation_type, available=available_space / (1024*1024), needed=REQUIRED_SPACE / (1024*1024)), flush=True)
+            print("I: " + _('Using /tmp for {operation} ({available:.1f}MB available, {needed:.1f}MB needed)').format(
+                operation=operation_type, available=available_space / _MIB, needed=REQUIRED_SPACE / _MIB), flush=True)
             return tempfile.mkdtemp(dir=default_tmp, prefix=prefix)
         else:
-            print("I: {}".format(_('Insufficient space in /tmp for {operation} ({available:.1f}MB available, {needed:.1f}MB needed)')).format(
-                operation=operation_type, available=available_space / (1024*1024), needed=REQUIRED_SPACE / (1024*1024)), flush=True)
+            print("I: " + _('Insufficient space in /tmp for {operation} ({available:.1f}MB available, {needed:.1f}MB needed)').format(
+                operation=operation_type, available=available_space / _MIB, needed=REQUIRED_SPACE / _MIB), flush=True)
 
             # Alternative directory depends on filesystem type and initramfs type
-            fs_type = get_union_filesystem_type()
             if os.path.exists('/run/initramfs/memory/changes'):
-                if fs_type == 'aufs':
-                    alt_tmp = "/run/initramfs/memory/changes/tmp"
-                else:  # overlayfs
-                    alt_tmp = "/run/initramfs/memory/changes/changes/tmp"
+                changes_dir = "/run/initramfs/memory/changes"
             elif os.path.exists('/lib/live/mount/changes'):
-                if fs_type == 'aufs':
-                    alt_tmp = "/lib/live/mount/changes/tmp"
-                else:  # overlayfs
-                    alt_tmp = "/lib/live/mount/changes/changes/tmp"
+                changes_dir = "/lib/live/mount/changes"
             else:
                 print("W: {}".format(_('No live system changes directory found, using /tmp anyway')), flush=True)
                 return tempfile.mkdtemp(dir=default_tmp, prefix=prefix)
 
-            print("I: {}".format(_('Detected {} filesystem, using alternative: {}')).format(
+            fs_type = get_union_filesystem_type()
+            if fs_type == 'aufs':
+                alt_tmp = os.path.join(changes_dir, "tmp")
+            else:  # overlayfs
+                alt_tmp = os.path.join(changes_dir, "changes", "tmp")
+
+            print("I: " + _('Detected {} filesystem, using alternative: {}').format(
                 fs_type, alt_tmp), flush=True)
 
-            # Create alternative directory if it doesn't exist
-            if not os.path.exists(alt_tmp):
+            # Create alternative directory if it doesn't exist; only a
+            # missing parent needs the recursive makedirs walk
+            created = True
+            try:
+                os.mkdir(alt_tmp)
+            except FileExistsError:
+                created = False
+            except FileNotFoundError:
                 os.makedirs(alt_tmp, exist_ok=True)
-                print("I: {}".format(_('Created alternative temporary directory: {}')).format(alt_tmp), flush=True)
+            if created:
+                print("I: " + _('Created alternative temporary directory: {}').format(alt_tmp), flush=True)
 
             # Check space in alternative location
-            statvfs_alt = os.statvfs(alt_tmp)
-            available_space_alt = statvfs_alt.f_bavail * statvfs_alt.f_frsize
+            available_space_alt = _available_space(alt_tmp)
 
             if available_space_alt >= REQUIRED_SPACE:
-                print("I: {}".format(_('Using alternative temporary directory: {} ({:.1f}MB available)')).format(
-                    alt_tmp, available_space_alt / (1024*1024)), flush=True)
+                print("I: " + _('Using alternative temporary directory: {} ({:.1f}MB available)').format(
+                    alt_tmp, available_space_alt / _MIB), flush=True)
                 return tempfile.mkdtemp(dir=alt_tmp, prefix=prefix)
             else:
                 # Not enough space anywhere
@@ -653,12 +708,12 @@ def get_temp_dir_with_space_check(required_mb: int = 1024, prefix: str = "minios
                     "Insufficient disk space for operation. Need {:.1f}MB, but only {:.1f}MB available in /tmp and {:.1f}MB in {}"
                 ).format(
                     required_mb,
-                    available_space / (1024*1024),
-                    available_space_alt / (1024*1024),
+                    available_space / _MIB,
+                    available_space_alt / _MIB,
                     alt_tmp
                 ))
 
     except (OSError, IOError) as e:
         # Fallback to default behavior if space checking fails
-        print("W: {}".format(_('Could not check disk space: {}. Using default temporary directory.')).format(str(e)), flush=True)
+        print("W: " + _('Could not check disk space: {}. Using default temporary directory.').format(str(e)), flush=True)
         return tempfile.mkdtemp(prefix=prefix)
@@ -11,42 +11,102 @@ import tempfile
 import shutil
 from unittest.mock import MagicMock, patch
 
-# Add lib directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+# Add lib directory to path for imports; test modules rely on this
+LIB_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'lib'))
+if LIB_DIR not in sys.path:
+    sys.path.insert(0, LIB_DIR)
+
+
+MINIOS_SKELETON = ("boot", "01-kernel", "02-firmware", "kernels")
+MODULES_SKELETON = ("6.1.0-1", "6.1.0-2", "6.5.0-1")
+
+
+def _reset_tree(root, skeleton):
+    """Return a pooled tree to its skeleton of empty directories."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
+    for name in skeleton:
+        os.mkdir(os.path.join(root, name))
+
+
+# Keep scratch trees in memory where tmpfs is available
+SCRATCH_PARENT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+@pytest.fixture(scope="session")
+def _tree_pool():
+    """Session-wide parent for the pooled test trees."""
+    pool = tempfile.mkdtemp(prefix="minios-test-pool-", dir=SCRATCH_PARENT)
+    yield pool
+    shutil.rmtree(pool, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def kernel_blobs(_tree_pool):
+    """Squashfs, vmlinuz and initramfs files written once per session."""
+    root = os.path.join(_tree_pool, "blobs")
+    os.mkdir(root)
+    paths = []
+    for name, content in (("01-kernel-6.1.0-test.sb", b'squashfs content'),
+                          ("vmlinuz-6.1.0-test", b'vmlinuz content'),
+                          ("initrfs-6.1.0-test.img", b'initramfs content')):
+        path = os.path.join(root, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        paths.append(path)
+    return tuple(paths)
+
+
+def _pooled_tree(pool, name, skeleton):
+    """Yield a pooled tree in its skeleton state, resetting it afterwards."""
+    root = os.path.join(pool, name)
+    if not os.path.isdir(root):
+        os.mkdir(root)
+        _reset_tree(root, skeleton)
+    try:
+        yield root
+    finally:
+        _reset_tree(root, skeleton)
 
 
 @pytest.fixture
-def temp_minios_dir():
+def temp_minios_dir(_tree_pool):
     """Create a temporary MiniOS directory structure for testing."""
-    tmpdir = tempfile.mkdtemp(prefix="minios-test-")
-    
-    # Create typical MiniOS structure
-    os.makedirs(os.path.join(tmpdir, "boot"))
-    os.makedirs(os.path.join(tmpdir, "01-kernel"))
-    os.makedirs(os.path.join(tmpdir, "02-firmware"))
-    os.makedirs(os.path.join(tmpdir, "kernels"))
-    
-    yield tmpdir
-    
-    # Cleanup
-    shutil.rmtree(tmpdir, ignore_errors=True)
+    # Typical MiniOS structure: boot, 01-kernel, 02-firmware, kernels
+    yield from _pooled_tree(_tree_pool, "minios", MINIOS_SKELETON)
 
 
 @pytest.fixture
-def temp_modules_dir():
+def temp_modules_dir(_tree_pool):
     """Create a temporary /lib/modules directory structure."""
-    tmpdir = tempfile.mkdtemp(prefix="minios-modules-")
-    
-    # Create sample kernel module directories
-    for version in ["6.1.0-1", "6.1.0-2", "6.5.0-1"]:
-        os.makedirs(os.path.join(tmpdir, version))
-    
-    yield tmpdir
-    
-    shutil.rmtree(tmpdir, ignore_errors=True)
+    # Sample kernel module directories
+    yield from _pooled_tree(_tree_pool, "modules", MODULES_SKELETON)
+
+
+class TempArena:
+    """Scratch directory whose files are all released together."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, name):
+        """Return the path for a scratch entry; nothing is created."""
+        return os.path.join(self.root, name)
 
 
 @pytest.fixture
+def tmp_arena(_tree_pool):
+    """Per-test scratch directory removed in one sweep at teardown."""
+    root = tempfile.mkdtemp(prefix="arena-", dir=_tree_pool)
+    yield TempArena(root)
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
 def sample_apt_cache_show():
     """Sample apt-cache show output."""
     return '''Package: linux-image-6.1.0-18-amd64
@@ -61,7 +121,7 @@ Description: Linux 6.1 for 64-bit PCs (signed)
 '''
 
 
-@pytest.fixture  
+@pytest.fixture(scope="session")
 def sample_apt_cache_search():
     """Sample apt-cache search output."""
     return '''linux-image-6.1.0-18-amd64 - Linux 6.1 for 64-bit PCs (signed)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for compression_utils module.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from compression_utils import (
+    get_compression_params, get_available_sqfs_presets, SQFS_PRESETS, DEFAULT_SQFS_PRESET,
+)
+
+
+class TestGetCompressionParams:
+    """Tests for get_compression_params function."""
+
+    def test_default_squashfs_params(self):
+        """Test default parameters are used without a level."""
+        assert get_compression_params('zstd') == '-Xcompression-level 19'
+        assert get_compression_params('xz') == '-Xbcj x86'
+
+    def test_level_overrides_params(self):
+        """Test an explicit level replaces the default parameters."""
+        assert get_compression_params('zstd', 'squashfs', 8) == '-Xcompression-level 8'
+
+    def test_level_out_of_range(self):
+        """Test out of range levels are rejected."""
+        with pytest.raises(ValueError):
+            get_compression_params('gzip', 'squashfs', 19)
+
+    def test_level_not_supported(self):
+        """Test compressors without levels are rejected."""
+        with pytest.raises(ValueError):
+            get_compression_params('xz', 'squashfs', 5)
+
+
+class TestGetAvailableSqfsPresets:
+    """Tests for get_available_sqfs_presets function."""
+
+    def test_presets_need_compressor(self):
+        """Test presets are hidden when their compressor is missing."""
+        with patch('shutil.which', return_value=None):
+            assert get_available_sqfs_presets() == []
+
+    def test_default_preset_available(self):
+        """Test the default preset is listed when zstd is installed."""
+        with patch('shutil.which', return_value='/usr/bin/tool'):
+            assert DEFAULT_SQFS_PRESET in get_available_sqfs_presets()
+
+    def test_preset_levels_are_valid(self):
+        """Test every preset level is accepted by mksquashfs."""
+        for compression, level, block_size in SQFS_PRESETS.values():
+            assert get_compression_params(compression, 'squashfs', level)
+            assert block_size & (block_size - 1) == 0
@@ -4,14 +4,17 @@
 Tests for kernel_utils module.
 """
 
-import sys
 import os
+import functools
 import pytest
-import tempfile
 from unittest.mock import patch, MagicMock
 
-# Add lib directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+from kernel_utils import (
+    get_available_kernels, get_manual_packages, get_repository_kernels,
+    _parse_package_info, _format_size, check_package_cache,
+    get_non_symlink_modules_dir, locate_kernel_modules,
+    resolve_kernel_dependencies, process_manual_packages,
+)
 
 
 class TestGetAvailableKernels:
@@ -19,8 +22,6 @@ class TestGetAvailableKernels:
 
     def test_lists_kernel_modules(self, temp_modules_dir):
         """Test listing kernel module directories."""
-        from kernel_utils import get_available_kernels
-        
         with patch('os.path.exists', return_value=True), \
              patch('os.listdir', return_value=['6.1.0-1', '6.1.0-2', '6.5.0-1']), \
              patch('os.path.isdir', return_value=True):
@@ -33,8 +34,6 @@ class TestGetAvailableKernels:
 
     def test_empty_modules_dir(self):
         """Test handling of empty modules directory."""
-        from kernel_utils import get_available_kernels
-        
         with patch('os.path.exists', return_value=True), \
              patch('os.listdir', return_value=[]):
             
@@ -43,16 +42,12 @@ class TestGetAvailableKernels:
 
     def test_missing_modules_dir(self):
         """Test handling of missing modules directory."""
-        from kernel_utils import get_available_kernels
-        
         with patch('os.path.exists', return_value=False):
             kernels = get_available_kernels()
             assert kernels == []
 
     def test_returns_sorted_list(self):
         """Test that kernel list is sorted."""
-        from kernel_utils import get_available_kernels
-        
         with patch('os.path.exists', return_value=True), \
              patch('os.listdir', return_value=['6.5.0-1', '6.1.0-1', '6.1.0-2']), \
              patch('os.path.isdir', return_value=True):
@@ -66,8 +61,6 @@ class TestGetManualPackages:
 
     def test_returns_empty_list(self):
         """Test that function returns empty list (compatibility stub)."""
-        from kernel_utils import get_manual_packages
-        
         result = get_manual_packages()
         assert result == []
 
@@ -77,14 +70,17 @@ class TestGetRepositoryKernels:
 
     def test_parses_apt_search_output(self, sample_apt_cache_search, sample_apt_cache_show):
         """Test parsing apt-cache output."""
-        from kernel_utils import get_repository_kernels
-        
+        # Results are read-only, so one instance per kind serves every call
+        search_result = MagicMock(stdout=sample_apt_cache_search, returncode=0)
+        show_result = MagicMock(stdout=sample_apt_cache_show, returncode=0)
+        empty_result = MagicMock(stdout='', returncode=0)
+
         def run_side_effect(cmd, **kwargs):
             if 'search' in cmd:
-                return MagicMock(stdout=sample_apt_cache_search, returncode=0)
+                return search_result
             elif 'show' in cmd:
-                return MagicMock(stdout=sample_apt_cache_show, returncode=0)
-            return MagicMock(stdout='', returncode=0)
+                return show_result
+            return empty_result
         
         with patch('subprocess.run', side_effect=run_side_effect):
             packages = get_repository_kernels()
@@ -94,12 +90,13 @@ class TestGetRepositoryKernels:
 
     def test_excludes_debug_packages(self, sample_apt_cache_search):
         """Test that debug packages are excluded."""
-        from kernel_utils import get_repository_kernels
-        
+        search_result = MagicMock(stdout=sample_apt_cache_search, returncode=0)
+        empty_result = MagicMock(stdout='Size: 0', returncode=0)
+
         def run_side_effect(cmd, **kwargs):
             if 'search' in cmd:
-                return MagicMock(stdout=sample_apt_cache_search, returncode=0)
-            return MagicMock(stdout='Size: 0', returncode=0)
+                return search_result
+            return empty_result
         
         with patch('subprocess.run', side_effect=run_side_effect):
             packages = get_repository_kernels()
@@ -110,8 +107,6 @@ class TestGetRepositoryKernels:
     def test_handles_apt_error(self):
         """Test handling of apt-cache errors."""
         import subprocess
-        from kernel_utils import get_repository_kernels
-        
         with patch('subprocess.run', side_effect=subprocess.CalledProcessError(1, 'apt-cache')):
             packages = get_repository_kernels()
             assert packages == []
@@ -122,8 +117,6 @@ class TestResolveKernelDependencies:
 
     def test_ubuntu_split_kernel_dependencies(self):
         """Extract linux-modules* dependencies from apt-cache depends output."""
-        from kernel_utils import resolve_kernel_dependencies
-
         apt_depends_output = '''linux-image-6.8.0-60-generic
   Depends: kmod
   Depends: linux-base
@@ -141,8 +134,6 @@ class TestResolveKernelDependencies:
 
     def test_debian_monolithic_kernel_dependencies(self):
         """Return empty list when no linux-modules* dependencies are present."""
-        from kernel_utils import resolve_kernel_dependencies
-
         apt_depends_output = '''linux-image-6.1.0-18-amd64
   Depends: kmod
   Depends: linux-base
@@ -158,30 +149,29 @@ class TestResolveKernelDependencies:
 class TestProcessManualPackages:
     """Tests for process_manual_packages function."""
 
-    def test_single_package_without_modules_raises_clear_error(self):
+    def test_single_package_without_modules_raises_clear_error(self, tmp_arena):
         """Single .deb without modules should ask for linux-modules packages."""
-        from kernel_utils import process_manual_packages
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            deb_path = os.path.join(temp_dir, 'linux-image-6.8.0-60-generic_1_amd64.deb')
-            open(deb_path, 'w').close()
-            real_exists = os.path.exists
+        temp_dir = tmp_arena.root
+        deb_path = tmp_arena.path('linux-image-6.8.0-60-generic_1_amd64.deb')
+        open(deb_path, 'w').close()
+        # The tree is fixed for the whole test; stat each real path once
+        real_exists = functools.lru_cache(maxsize=None)(os.path.exists)
 
-            def exists_side_effect(path):
-                if path in (deb_path, temp_dir):
-                    return True
-                if path.endswith('/boot') or path.endswith('/usr/boot'):
-                    return False
-                if path.endswith('/lib/modules') or path.endswith('/usr/lib/modules'):
-                    return False
-                return real_exists(path)
+        def exists_side_effect(path):
+            if path in (deb_path, temp_dir):
+                return True
+            if path.endswith('/boot') or path.endswith('/usr/boot'):
+                return False
+            if path.endswith('/lib/modules') or path.endswith('/usr/lib/modules'):
+                return False
+            return real_exists(path)
 
-            with patch('subprocess.run', return_value=MagicMock(returncode=0)), \
-                 patch('os.path.exists', side_effect=exists_side_effect):
-                with pytest.raises(RuntimeError) as exc:
-                    process_manual_packages([deb_path], temp_dir)
+        with patch('subprocess.run', return_value=MagicMock(returncode=0)), \
+             patch('os.path.exists', side_effect=exists_side_effect):
+            with pytest.raises(RuntimeError) as exc:
+                process_manual_packages([deb_path], temp_dir)
 
-            assert 'linux-modules' in str(exc.value)
+        assert 'linux-modules' in str(exc.value)
 
 
 class TestParsePackageInfo:
@@ -189,8 +179,6 @@ class TestParsePackageInfo:
 
     def test_parses_complete_info(self, sample_apt_cache_show):
         """Test parsing complete package information."""
-        from kernel_utils import _parse_package_info
-        
         result = _parse_package_info(
             sample_apt_cache_show,
             'linux-image-6.1.0-18-amd64',
@@ -205,8 +193,6 @@ class TestParsePackageInfo:
 
     def test_returns_none_for_zero_size(self):
         """Test returning None when size is 0."""
-        from kernel_utils import _parse_package_info
-        
         apt_output = '''Package: test-package
 Version: 1.0
 Size: 0
@@ -218,33 +204,15 @@ Size: 0
 class TestFormatSize:
     """Tests for _format_size function."""
 
-    def test_format_bytes(self):
-        """Test formatting byte values."""
-        from kernel_utils import _format_size
-        
-        assert '500' in _format_size(500)
-        assert 'B' in _format_size(500)
-
-    def test_format_kilobytes(self):
-        """Test formatting kilobyte values."""
-        from kernel_utils import _format_size
-        
-        result = _format_size(1024)
-        assert 'KB' in result
-
-    def test_format_megabytes(self):
-        """Test formatting megabyte values."""
-        from kernel_utils import _format_size
-        
-        result = _format_size(1024 * 1024)
-        assert 'MB' in result
-
-    def test_format_gigabytes(self):
-        """Test formatting gigabyte values."""
-        from kernel_utils import _format_size
-        
-        result = _format_size(1024 * 1024 * 1024)
-        assert 'GB' in result
+    @pytest.mark.parametrize("size,expected", [
+        (500, '500.0 B'),
+        (1024, '1.0 KB'),
+        (1024 ** 2, '1.0 MB'),
+        (1024 ** 3, '1.0 GB'),
+    ])
+    def test_format(self, size, expected):
+        """Test formatting byte, kilobyte, megabyte and gigabyte values."""
+        assert _format_size(size) == expected
 
 
 class TestCheckPackageCache:
@@ -253,8 +221,6 @@ class TestCheckPackageCache:
     def test_cache_exists_and_recent(self):
         """Test when cache exists and is recent."""
         import time
-        from kernel_utils import check_package_cache
-        
         with patch('os.path.exists', return_value=True), \
              patch('os.listdir', return_value=['Packages']), \
              patch('os.path.getmtime', return_value=time.time()):
@@ -267,8 +233,6 @@ class TestCheckPackageCache:
     def test_cache_outdated(self):
         """Test when cache is outdated."""
         import time
-        from kernel_utils import check_package_cache
-        
         old_time = time.time() - (8 * 24 * 60 * 60)  # 8 days ago
         
         with patch('os.path.exists', return_value=True), \
@@ -281,8 +245,6 @@ class TestCheckPackageCache:
 
     def test_empty_lists_directory(self):
         """Test when lists directory is empty."""
-        from kernel_utils import check_package_cache
-        
         with patch('os.path.exists', return_value=True), \
              patch('os.listdir', return_value=[]):
             
@@ -296,8 +258,6 @@ class TestGetNonSymlinkModulesDir:
 
     def test_returns_lib_modules(self):
         """Test returning /lib/modules path."""
-        from kernel_utils import get_non_symlink_modules_dir
-        
         with patch('os.path.islink', return_value=False), \
              patch('os.path.exists', return_value=True):
             
@@ -310,17 +270,12 @@ class TestLocateKernelModules:
 
     def test_finds_modules_directory(self):
         """Test finding kernel modules directory."""
-        from kernel_utils import locate_kernel_modules
-        
         with patch('os.path.exists', return_value=True):
             result = locate_kernel_modules('6.1.0-18-amd64')
             assert '/lib/modules' in result or '/usr/lib/modules' in result
 
     def test_module_not_found(self):
         """Test handling of missing modules."""
-        import pytest
-        from kernel_utils import locate_kernel_modules
-        
         with patch('os.path.exists', return_value=False):
             with pytest.raises(RuntimeError):
                 locate_kernel_modules('nonexistent-kernel')
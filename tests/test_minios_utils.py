@@ -4,13 +4,19 @@
 Tests for minios_utils module.
 """
 
-import sys
 import os
 import pytest
+from pathlib import Path
 from unittest.mock import patch, MagicMock, mock_open
 
-# Add lib directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lib'))
+from minios_utils import (
+    _is_valid_minios_directory, find_minios_directory,
+    get_kernel_repository_path, get_kernel_path, get_active_kernel,
+    get_active_kernel_files, package_kernel_to_repository, _format_size,
+    get_currently_running_kernel, invalidate_running_kernel, get_system_type,
+    _get_filesystem_type, _read_mounts, get_union_filesystem_type,
+    get_kernel_info,
+)
 
 
 class TestIsValidMiniosDirectory:
@@ -18,31 +24,31 @@ class TestIsValidMiniosDirectory:
 
     def test_valid_directory(self, temp_minios_dir):
         """Test detection of valid MiniOS directory."""
-        from minios_utils import _is_valid_minios_directory
-        
         assert _is_valid_minios_directory(temp_minios_dir) is True
 
-    def test_invalid_empty_directory(self):
+    def test_invalid_empty_directory(self, tmp_arena):
         """Test detection of invalid (empty) directory."""
-        import tempfile
-        from minios_utils import _is_valid_minios_directory
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            assert _is_valid_minios_directory(tmpdir) is False
+        assert _is_valid_minios_directory(tmp_arena.root) is False
 
     def test_nonexistent_directory(self):
         """Test handling of nonexistent directory."""
-        from minios_utils import _is_valid_minios_directory
-        
         assert _is_valid_minios_directory("/nonexistent/path") is False
 
-    def test_permission_error(self):
+    def test_permission_error(self, tmp_arena):
         """Test handling of permission errors."""
-        from minios_utils import _is_valid_minios_directory
-        
-        with patch('os.listdir', side_effect=PermissionError("Access denied")):
-            with patch('os.path.exists', return_value=True):
-                assert _is_valid_minios_directory("/some/path") is False
+        with patch('os.scandir', side_effect=PermissionError("Access denied")):
+            assert _is_valid_minios_directory(tmp_arena.root) is False
+
+    def test_result_cached_until_directory_changes(self, temp_minios_dir):
+        """Test repeated checks reuse the scan until the directory changes."""
+        assert _is_valid_minios_directory(temp_minios_dir) is True
+        with patch('os.scandir', side_effect=AssertionError("rescanned")):
+            assert _is_valid_minios_directory(temp_minios_dir) is True
+
+        for name in ("boot", "01-kernel", "02-firmware"):
+            os.rmdir(os.path.join(temp_minios_dir, name))
+        os.utime(temp_minios_dir, ns=(0, 0))
+        assert _is_valid_minios_directory(temp_minios_dir) is False
 
 
 class TestFindMiniosDirectory:
@@ -50,8 +56,6 @@ class TestFindMiniosDirectory:
 
     def test_finds_standard_path(self, temp_minios_dir):
         """Test finding MiniOS directory at standard path."""
-        from minios_utils import find_minios_directory
-        
         with patch('minios_utils._is_valid_minios_directory') as mock_valid:
             mock_valid.side_effect = lambda p: p == temp_minios_dir
             
@@ -63,36 +67,42 @@ class TestFindMiniosDirectory:
 
     def test_no_directory_found(self):
         """Test when no MiniOS directory is found."""
-        from minios_utils import find_minios_directory
-        
-        with patch('minios_utils._is_valid_minios_directory', return_value=False), \
-             patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(stdout='', returncode=0)
-            
+        with patch('minios_utils._is_valid_minios_directory', frozenset().__contains__):
             result = find_minios_directory()
             assert result is None
 
+    def test_finds_mounted_media(self):
+        """Test finding MiniOS on a mounted media filesystem."""
+        proc_mounts = ("/dev/sda1 / ext4 rw 0 0\n"
+                       "tmpfs /tmp tmpfs rw 0 0\n"
+                       "/dev/sdb1 /media/usb vfat rw 0 0\n")
+
+        try:
+            with patch('builtins.open', mock_open(read_data=proc_mounts)):
+                _read_mounts(refresh=True)
+            valid = frozenset({'/media/usb/minios', '/tmp/minios'})
+            with patch('minios_utils._is_valid_minios_directory', valid.__contains__):
+                assert find_minios_directory() == '/media/usb/minios'
+        finally:
+            _read_mounts(refresh=True)
+
 
 class TestGetKernelRepositoryPath:
     """Tests for get_kernel_repository_path function."""
 
-    def test_returns_correct_path(self, temp_minios_dir):
+    def test_returns_correct_path(self):
         """Test correct repository path generation."""
-        from minios_utils import get_kernel_repository_path
-        
-        result = get_kernel_repository_path(temp_minios_dir)
-        assert result == os.path.join(temp_minios_dir, "kernels")
+        result = get_kernel_repository_path("/run/initramfs/memory/data/minios")
+        assert result == "/run/initramfs/memory/data/minios/kernels"
 
 
 class TestGetKernelPath:
     """Tests for get_kernel_path function."""
 
-    def test_returns_correct_path(self, temp_minios_dir):
+    def test_returns_correct_path(self):
         """Test correct kernel version path generation."""
-        from minios_utils import get_kernel_path
-        
-        result = get_kernel_path(temp_minios_dir, "6.1.0-18-amd64")
-        assert result == os.path.join(temp_minios_dir, "kernels", "6.1.0-18-amd64")
+        result = get_kernel_path("/run/initramfs/memory/data/minios", "6.1.0-18-amd64")
+        assert result == "/run/initramfs/memory/data/minios/kernels/6.1.0-18-amd64"
 
 
 class TestGetActiveKernel:
@@ -100,81 +110,83 @@ class TestGetActiveKernel:
 
     def test_read_from_marker_file(self, temp_minios_dir):
         """Test reading active kernel from marker file."""
-        from minios_utils import get_active_kernel
-        
         # Create marker file
-        marker_path = os.path.join(temp_minios_dir, "boot", "active-kernel")
-        with open(marker_path, 'w') as f:
-            f.write("6.1.0-18-amd64\n")
+        Path(temp_minios_dir, "boot", "active-kernel").write_text("6.1.0-18-amd64\n")
         
         result = get_active_kernel(temp_minios_dir)
         assert result == "6.1.0-18-amd64"
 
     def test_fallback_to_vmlinuz_file(self, temp_minios_dir):
         """Test fallback to vmlinuz file when marker is missing."""
-        from minios_utils import get_active_kernel
-        
         # Create vmlinuz file without marker
-        vmlinuz_path = os.path.join(temp_minios_dir, "boot", "vmlinuz-6.5.0-1-amd64")
-        open(vmlinuz_path, 'w').close()
+        Path(temp_minios_dir, "boot", "vmlinuz-6.5.0-1-amd64").touch()
         
         result = get_active_kernel(temp_minios_dir)
         assert result == "6.5.0-1-amd64"
 
     def test_no_kernel_found(self, temp_minios_dir):
         """Test when no kernel is found."""
-        from minios_utils import get_active_kernel
-        
         # Empty boot directory
         result = get_active_kernel(temp_minios_dir)
         assert result is None
 
 
+class TestGetActiveKernelFiles:
+    """Tests for get_active_kernel_files function."""
+
+    def test_files_for_version(self, temp_minios_dir):
+        """Test only the given version's files are returned."""
+        for name in ("boot/vmlinuz-6.1.0", "boot/initrfs-6.1.0.img", "01-kernel-6.1.0.sb",
+                     "boot/vmlinuz-6.5.0", "01-kernel-6.5.0.sb"):
+            Path(temp_minios_dir, name).touch()
+
+        result = get_active_kernel_files(temp_minios_dir, "6.1.0")
+        assert result == [os.path.join(temp_minios_dir, "boot", "vmlinuz-6.1.0"),
+                          os.path.join(temp_minios_dir, "boot", "initrfs-6.1.0.img"),
+                          os.path.join(temp_minios_dir, "01-kernel-6.1.0.sb")]
+        assert len(get_active_kernel_files(temp_minios_dir)) == 5
+
+
+class TestGetKernelInfo:
+    """Tests for get_kernel_info function."""
+
+    @pytest.mark.parametrize("kernel_id,expected", [
+        ("6.1.0-18-rt-amd64", "Real-time"),
+        ("6.1.0-18-virtual", "Standard"),
+        ("6.1.0-18-cloud-amd64", "Cloud"),
+        ("6.5.0-1-mos", "MiniOS"),
+    ])
+    def test_kernel_type(self, temp_minios_dir, kernel_id, expected):
+        """Test flavors match whole version parts only."""
+        os.mkdir(get_kernel_path(temp_minios_dir, kernel_id))
+        assert get_kernel_info(temp_minios_dir, kernel_id)['kernel_type'] == expected
+
+
 class TestPackageKernelToRepository:
     """Tests for package_kernel_to_repository function."""
 
-    def test_successful_packaging(self, temp_minios_dir):
+    def test_successful_packaging(self, temp_minios_dir, kernel_blobs):
         """Test successful kernel packaging."""
-        import tempfile
-        from minios_utils import package_kernel_to_repository
+        sqfs_path, vmlinuz_path, initramfs_path = kernel_blobs
         
-        # Create temporary kernel files
-        with tempfile.NamedTemporaryFile(suffix='.sb', delete=False) as sqfs, \
-             tempfile.NamedTemporaryFile(prefix='vmlinuz-', delete=False) as vmlinuz, \
-             tempfile.NamedTemporaryFile(suffix='.img', delete=False) as initramfs:
-            
-            sqfs.write(b'squashfs content')
-            vmlinuz.write(b'vmlinuz content')
-            initramfs.write(b'initramfs content')
-            
-            sqfs_path = sqfs.name
-            vmlinuz_path = vmlinuz.name
-            initramfs_path = initramfs.name
+        result = package_kernel_to_repository(
+            temp_minios_dir,
+            "6.1.0-test",
+            sqfs_path,
+            vmlinuz_path,
+            initramfs_path
+        )
         
-        try:
-            result = package_kernel_to_repository(
-                temp_minios_dir,
-                "6.1.0-test",
-                sqfs_path,
-                vmlinuz_path,
-                initramfs_path
-            )
-            
-            assert result is True
-            
-            # Check files were copied
-            kernel_dir = os.path.join(temp_minios_dir, "kernels", "6.1.0-test")
-            assert os.path.exists(kernel_dir)
-        finally:
-            # Cleanup
-            for f in [sqfs_path, vmlinuz_path, initramfs_path]:
-                if os.path.exists(f):
-                    os.unlink(f)
+        assert result is True
+        
+        # Check files were copied
+        kernel_dir = os.path.join(temp_minios_dir, "kernels", "6.1.0-test")
+        with os.scandir(kernel_dir) as entries:
+            copied = {entry.name for entry in entries}
+        assert copied == {os.path.basename(path) for path in kernel_blobs}
 
     def test_packaging_failure(self, temp_minios_dir):
         """Test packaging failure with missing files."""
-        from minios_utils import package_kernel_to_repository
-        
         result = package_kernel_to_repository(
             temp_minios_dir,
             "6.1.0-test",
@@ -189,32 +201,15 @@ class TestPackageKernelToRepository:
 class TestFormatSize:
     """Tests for _format_size function."""
 
-    def test_format_bytes(self):
-        """Test formatting byte values."""
-        from minios_utils import _format_size
-        
-        assert _format_size(500) == "500.0 B"
-
-    def test_format_kilobytes(self):
-        """Test formatting kilobyte values."""
-        from minios_utils import _format_size
-        
-        result = _format_size(1024)
-        assert "KB" in result or "K" in result
-
-    def test_format_megabytes(self):
-        """Test formatting megabyte values."""
-        from minios_utils import _format_size
-        
-        result = _format_size(1024 * 1024)
-        assert "MB" in result or "M" in result
-
-    def test_format_gigabytes(self):
-        """Test formatting gigabyte values."""
-        from minios_utils import _format_size
-        
-        result = _format_size(1024 * 1024 * 1024)
-        assert "GB" in result or "G" in result
+    @pytest.mark.parametrize("size,expected", [
+        (500, '500.0 B'),
+        (1024, '1.0 KB'),
+        (1024 ** 2, '1.0 MB'),
+        (1024 ** 3, '1.0 GB'),
+    ])
+    def test_format(self, size, expected):
+        """Test formatting byte, kilobyte, megabyte and gigabyte values."""
+        assert _format_size(size) == expected
 
 
 class TestGetCurrentlyRunningKernel:
@@ -222,8 +217,7 @@ class TestGetCurrentlyRunningKernel:
 
     def test_get_running_kernel(self):
         """Test getting currently running kernel version."""
-        from minios_utils import get_currently_running_kernel
-        
+        invalidate_running_kernel()
         with patch('subprocess.run') as mock_run:
             mock_run.return_value = MagicMock(
                 stdout='6.1.0-18-amd64\n',
@@ -232,6 +226,25 @@ class TestGetCurrentlyRunningKernel:
             
             result = get_currently_running_kernel()
             assert '6.1.0' in result or result  # May use platform.release()
+        invalidate_running_kernel()
+
+    def test_kernel_bundle_mount(self):
+        """Test the version is taken from the mounted kernel bundle."""
+        proc_mounts = ("/dev/loop0 /run/initramfs/memory/bundles/00-core.sb squashfs ro 0 0\n"
+                       "/dev/loop1 /run/initramfs/memory/bundles/01-kernel-6.1.0-18-amd64.sb squashfs ro 0 0\n")
+
+        try:
+            with patch('builtins.open', mock_open(read_data=proc_mounts)):
+                _read_mounts(refresh=True)
+            invalidate_running_kernel()
+            with patch('subprocess.run', side_effect=AssertionError("forked")):
+                assert get_currently_running_kernel() == '6.1.0-18-amd64'
+                # Cached for the rest of the session
+                _read_mounts(refresh=True)
+                assert get_currently_running_kernel() == '6.1.0-18-amd64'
+        finally:
+            invalidate_running_kernel()
+            _read_mounts(refresh=True)
 
 
 class TestGetSystemType:
@@ -239,48 +252,52 @@ class TestGetSystemType:
 
     def test_get_system_type(self):
         """Test getting system type."""
-        from minios_utils import get_system_type
-        
-        with patch('os.path.exists') as mock_exists:
-            mock_exists.side_effect = lambda p: False
-            
-            result = get_system_type()
-            assert result in [
-                'Live system (running from media)',
-                'Installed system'
-            ]
+        present = frozenset({'/lib/live/mount'})
+        try:
+            get_system_type.cache_clear()
+            with patch('os.path.exists', side_effect=present.__contains__):
+                assert get_system_type() == 'Live system (running from media)'
 
+            get_system_type.cache_clear()
+            with patch('os.path.exists', side_effect=frozenset().__contains__):
+                assert get_system_type() == 'Installed system'
+        finally:
+            get_system_type.cache_clear()
 
-class TestGetUnionFilesystemType:
-    """Tests for get_union_filesystem_type function."""
 
-    def test_detect_overlayfs(self):
-        """Test detecting OverlayFS."""
-        from minios_utils import get_union_filesystem_type
-        
-        proc_cmdline = "BOOT_IMAGE=/minios/boot/vmlinuz union=overlayfs"
-        proc_filesystems = "nodev\toverlayfs\n"
-        
-        files = {
-            '/proc/cmdline': proc_cmdline,
-            '/proc/filesystems': proc_filesystems
-        }
-        
-        def mock_open_func(path, *args, **kwargs):
-            if path in files:
-                return mock_open(read_data=files[path])()
-            raise FileNotFoundError(path)
-        
-        with patch('builtins.open', side_effect=mock_open_func):
-            result = get_union_filesystem_type()
-            assert result == 'overlayfs'
+class TestGetFilesystemType:
+    """Tests for _get_filesystem_type function."""
 
-    def test_detect_aufs(self):
-        """Test detecting AUFS."""
-        from minios_utils import get_union_filesystem_type
+    def test_longest_mount_point_wins(self):
+        """Test the deepest mount containing the path is used."""
+        proc_mounts = ("/dev/sda1 / ext4 rw 0 0\n"
+                       "/dev/sdb1 /run/initramfs/memory/data vfat rw 0 0\n"
+                       "/dev/sdc1 /media/my\\040usb exfat rw 0 0\n")
 
-        mount_output = "none on / type aufs (rw,relatime)\n"
+        try:
+            with patch('builtins.open', mock_open(read_data=proc_mounts)):
+                _read_mounts(refresh=True)
+            assert _get_filesystem_type('/run/initramfs/memory/data/minios') == 'vfat'
+            assert _get_filesystem_type('/run/initramfs/memory/database') == 'ext4'
+            assert _get_filesystem_type('/media/my usb/minios') == 'exfat'
+        finally:
+            _read_mounts(refresh=True)
+
+
+class TestGetUnionFilesystemType:
+    """Tests for get_union_filesystem_type function."""
 
-        with patch('subprocess.run', return_value=MagicMock(stdout=mount_output, returncode=0)):
-            result = get_union_filesystem_type()
-            assert result == 'aufs'
+    @pytest.mark.parametrize("proc_mounts,expected", [
+        ("proc /proc proc rw 0 0\n"
+         "overlay / overlay rw,lowerdir=/run/initramfs/memory/bundles 0 0\n", 'overlayfs'),
+        ("none / aufs rw,relatime 0 0\n", 'aufs'),
+        ("/dev/sda1 / ext4 rw 0 0\n", 'overlayfs'),
+    ], ids=['overlayfs', 'aufs', 'default'])
+    def test_detect(self, proc_mounts, expected):
+        """Test detecting the union filesystem mounted on /."""
+        try:
+            with patch('builtins.open', mock_open(read_data=proc_mounts)):
+                _read_mounts(refresh=True)
+            assert get_union_filesystem_type() == expected
+        finally:
+            _read_mounts(refresh=True)